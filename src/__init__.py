@@ -3,8 +3,45 @@ NBA All-Star Prediction Package
 
 A comprehensive machine learning package for predicting NBA All-Star selections
 based on player performance statistics.
+
+The main pipeline functions are available from the package itself. They are
+imported on first access, so ``import src`` does not load pandas or NumPy.
 """
 
+from importlib import import_module
+from typing import Any, List
+
 __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
+
+# Public name -> module that defines it
+_LAZY_EXPORTS = {
+    "preprocess_data": "src.data_processing",
+    "engineer_all_features": "src.feature_engineering",
+    "select_modeling_features": "src.feature_engineering",
+    "prepare_modeling_data": "src.feature_engineering",
+    "run_planned_pipeline": "src.planner",
+    "FeatureStore": "src.feature_store",
+    "score_seasons": "src.scoring",
+    "save_artifacts": "src.artifacts",
+    "load_artifacts": "src.artifacts",
+    "run_sweep": "src.training",
+    "cross_validate": "src.validation",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import pipeline functions on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the module attributes, including the lazy exports."""
+    return sorted(set(globals()) | set(__all__))
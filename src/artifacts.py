@@ -0,0 +1,397 @@
+"""
+Model Artifacts Module
+
+This module saves fitted models, the feature scaler and the feature list as
+a directory that loads quickly in scoring workers. The weights of linear
+models and the scaler parameters are stored as ``.npy`` files and loaded
+memory-mapped, so starting a worker only maps files that every worker on the
+machine shares through the page cache. The nodes of random forests are
+concatenated into flat ``.npy`` arrays and predicted with a NumPy traversal
+over the mapped arrays, so no tree is unpickled either. XGBoost models use the
+library's own binary format. Any other estimator is stored with joblib, whose
+arrays are memory-mapped on load as well.
+
+Layout:
+    manifest.json           format version, features and one entry per model
+    scaler/<param>.npy      StandardScaler parameters
+    models/<name>/...       model weights or tree arrays
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+import joblib
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from src.feature_engineering import select_modeling_features
+
+ARTIFACT_MANIFEST = "manifest.json"
+ARTIFACT_FORMAT_VERSION = 1
+
+# Fitted attributes needed to predict with a linear model or transform with
+# a scaler, stored as one array each
+LINEAR_ATTRIBUTES = ("coef_", "intercept_", "classes_")
+SCALER_ATTRIBUTES = ("mean_", "var_", "scale_")
+
+# Linear classifiers rebuilt from their stored arrays
+LINEAR_MODELS = {"LogisticRegression": LogisticRegression}
+
+# Tree ensembles stored as concatenated node arrays
+FOREST_MODELS = ("RandomForestClassifier", "ExtraTreesClassifier")
+
+# Child index of a leaf node in scikit-learn trees
+TREE_LEAF = -1
+
+
+class ModelArtifacts(NamedTuple):
+    """
+    Loaded model artifacts.
+
+    Attributes:
+        models: Fitted models by name
+        scaler: Fitted StandardScaler (None if none was saved)
+        features: Model features, in training order
+    """
+
+    models: Dict[str, Any]
+    scaler: Optional[StandardScaler]
+    features: List[str]
+
+
+class MappedForestClassifier:
+    """
+    Random forest classifier predicting from flat tree arrays.
+
+    The nodes of all trees are concatenated, with child indices pointing
+    into the concatenated arrays, and every sample walks all trees at once,
+    one tree level per NumPy step. Probabilities equal those of the fitted
+    scikit-learn forest.
+
+    Attributes:
+        roots: Index of the root node of every tree
+        children_left: Left child of every node (TREE_LEAF for leaves)
+        children_right: Right child of every node (TREE_LEAF for leaves)
+        feature: Split feature of every node
+        threshold: Split threshold of every node
+        value: Class probabilities of every node, shape (n_nodes, n_classes)
+        missing_go_to_left: Whether missing values follow the left child
+            (None if the forest was fitted without missing-value support)
+        max_depth: Depth of the deepest tree
+        classes_: Class labels
+        n_features_in_: Number of features
+    """
+
+    def __init__(
+        self,
+        arrays: Dict[str, np.ndarray],
+        classes: np.ndarray,
+        max_depth: int,
+        n_features: int,
+        feature_names: Optional[List[str]] = None,
+    ) -> None:
+        self.roots = arrays["roots"]
+        self.children_left = arrays["children_left"]
+        self.children_right = arrays["children_right"]
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.value = arrays["value"]
+        self.missing_go_to_left = arrays.get("missing_go_to_left")
+        self.max_depth = max_depth
+        self.classes_ = np.asarray(classes)
+        self.n_features_in_ = n_features
+        _set_feature_names(self, feature_names)
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        """
+        Predict class probabilities.
+
+        Args:
+            X: Feature matrix of shape (n_samples, n_features)
+
+        Returns:
+            Mean class probabilities of the trees, shape (n_samples, n_classes)
+
+        Raises:
+            ValueError: If X does not have n_features_in_ columns
+        """
+        # Trees compare float32 features, like scikit-learn
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"Expected {self.n_features_in_} features, got shape {X.shape}"
+            )
+        # One (sample, tree) pair per entry; pairs that reached a leaf drop out
+        nodes = np.tile(self.roots, len(X))
+        samples = np.repeat(np.arange(len(X)), len(self.roots))
+        active = np.arange(len(nodes))
+        for _ in range(self.max_depth):
+            current = nodes[active]
+            left = self.children_left[current]
+            internal = left != TREE_LEAF
+            if not internal.all():
+                active, current, left = (
+                    active[internal],
+                    current[internal],
+                    left[internal],
+                )
+            if not len(active):
+                break
+            values = X[samples[active], self.feature[current]]
+            go_left = values <= self.threshold[current]
+            if self.missing_go_to_left is not None:
+                go_left = np.where(
+                    np.isnan(values), self.missing_go_to_left[current] != 0, go_left
+                )
+            nodes[active] = np.where(go_left, left, self.children_right[current])
+        nodes = nodes.reshape(len(X), len(self.roots))
+        return self.value[nodes].mean(axis=1)
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Predict the most probable class of every sample."""
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+def _forest_arrays(model: Any) -> Dict[str, np.ndarray]:
+    """Concatenate the node arrays of every tree of a fitted forest."""
+    trees = [estimator.tree_ for estimator in model.estimators_]
+    sizes = np.array([tree.node_count for tree in trees], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+    def children(name: str) -> np.ndarray:
+        parts = []
+        for tree, offset in zip(trees, offsets):
+            child = getattr(tree, name).astype(np.int64)
+            parts.append(np.where(child == TREE_LEAF, TREE_LEAF, child + offset))
+        return np.concatenate(parts)
+
+    value = np.concatenate([tree.value[:, 0, :] for tree in trees])
+    normalizer = value.sum(axis=1, keepdims=True)
+    normalizer[normalizer == 0.0] = 1.0
+    arrays = {
+        "roots": offsets,
+        "children_left": children("children_left"),
+        "children_right": children("children_right"),
+        "feature": np.concatenate([tree.feature for tree in trees]).astype(np.int64),
+        "threshold": np.concatenate([tree.threshold for tree in trees]),
+        "value": value / normalizer,
+    }
+    if all(hasattr(tree, "missing_go_to_left") for tree in trees):
+        arrays["missing_go_to_left"] = np.concatenate(
+            [np.asarray(tree.missing_go_to_left, dtype=np.uint8) for tree in trees]
+        )
+    return arrays
+
+
+def _model_kind(model: Any) -> str:
+    """Storage format of a model."""
+    if type(model).__name__ in LINEAR_MODELS:
+        return "linear"
+    if type(model).__name__ in FOREST_MODELS and model.n_outputs_ == 1:
+        return "forest"
+    if type(model).__module__.split(".")[0] == "xgboost":
+        return "xgboost"
+    return "joblib"
+
+
+def _save_arrays(obj: Any, attributes: tuple, out_dir: Path) -> List[str]:
+    """Save the fitted array attributes an object has as .npy files."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    saved = []
+    for name in attributes:
+        value = getattr(obj, name, None)
+        if value is not None:
+            np.save(out_dir / f"{name}.npy", np.ascontiguousarray(value))
+            saved.append(name)
+    return saved
+
+
+def _feature_names(obj: Any) -> Optional[List[str]]:
+    """Column names an estimator was fitted with (None for arrays)."""
+    names = getattr(obj, "feature_names_in_", None)
+    return None if names is None else [str(name) for name in names]
+
+
+def _set_feature_names(obj: Any, names: Optional[List[str]]) -> None:
+    """Restore the column names an estimator was fitted with."""
+    if names is not None:
+        obj.feature_names_in_ = np.asarray(names, dtype=object)
+
+
+def _load_arrays(obj: Any, attributes: List[str], in_dir: Path, mmap: bool) -> None:
+    """Set fitted array attributes from .npy files."""
+    for name in attributes:
+        setattr(
+            obj, name, np.load(in_dir / f"{name}.npy", mmap_mode="r" if mmap else None)
+        )
+
+
+def _save_model(model: Any, out_dir: Path) -> Dict[str, Any]:
+    """Write one model and return its manifest entry."""
+    kind = _model_kind(model)
+    entry: Dict[str, Any] = {"kind": kind, "class": type(model).__name__}
+    if kind == "linear":
+        entry["arrays"] = _save_arrays(model, LINEAR_ATTRIBUTES, out_dir)
+        entry["feature_names"] = _feature_names(model)
+    elif kind == "forest":
+        arrays = _forest_arrays(model)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for name, array in arrays.items():
+            np.save(out_dir / f"{name}.npy", np.ascontiguousarray(array))
+        entry["arrays"] = list(arrays)
+        entry["classes"] = model.classes_.tolist()
+        entry["max_depth"] = max(
+            int(estimator.tree_.max_depth) for estimator in model.estimators_
+        )
+        entry["n_features"] = int(model.n_features_in_)
+        entry["feature_names"] = _feature_names(model)
+    elif kind == "xgboost":
+        out_dir.mkdir(parents=True, exist_ok=True)
+        model.save_model(str(out_dir / "model.ubj"))
+        entry["file"] = "model.ubj"
+    else:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        joblib.dump(model, out_dir / "model.joblib")
+        entry["file"] = "model.joblib"
+    return entry
+
+
+def _load_model(entry: Dict[str, Any], in_dir: Path, mmap: bool) -> Any:
+    """Rebuild one model from its manifest entry."""
+    kind = entry["kind"]
+    if kind == "linear":
+        model = LINEAR_MODELS[entry["class"]]()
+        _load_arrays(model, entry["arrays"], in_dir, mmap)
+        model.n_features_in_ = model.coef_.shape[1]
+        _set_feature_names(model, entry["feature_names"])
+        return model
+    if kind == "forest":
+        arrays = {
+            name: np.load(in_dir / f"{name}.npy", mmap_mode="r" if mmap else None)
+            for name in entry["arrays"]
+        }
+        return MappedForestClassifier(
+            arrays,
+            np.asarray(entry["classes"]),
+            entry["max_depth"],
+            entry["n_features"],
+            entry["feature_names"],
+        )
+    if kind == "xgboost":
+        import xgboost
+
+        model = getattr(xgboost, entry["class"])()
+        model.load_model(str(in_dir / entry["file"]))
+        return model
+    return joblib.load(in_dir / entry["file"], mmap_mode="r" if mmap else None)
+
+
+def save_artifacts(
+    out_dir: Union[str, Path],
+    models: Dict[str, Any],
+    scaler: Optional[StandardScaler] = None,
+    features: Optional[List[str]] = None,
+) -> Path:
+    """
+    Save fitted models, the scaler and the feature list.
+
+    Args:
+        out_dir: Artifact directory (created; an existing manifest is replaced)
+        models: Fitted models by name, e.g. {"logistic_regression": model}
+        scaler: Fitted StandardScaler applied before the models (optional)
+        features: Model features, in training order
+            (select_modeling_features() if None)
+
+    Returns:
+        Path of the artifact directory
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if features is None:
+        features = select_modeling_features()
+
+    manifest: Dict[str, Any] = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "features": list(features),
+        "scaler": None,
+        "models": {},
+    }
+    if scaler is not None:
+        manifest["scaler"] = {
+            "arrays": _save_arrays(scaler, SCALER_ATTRIBUTES, out_dir / "scaler"),
+            "with_mean": scaler.with_mean,
+            "with_std": scaler.with_std,
+            "n_samples_seen": np.asarray(scaler.n_samples_seen_).tolist(),
+            "n_features": int(scaler.n_features_in_),
+            "feature_names": _feature_names(scaler),
+        }
+    for name, model in models.items():
+        manifest["models"][name] = _save_model(model, out_dir / "models" / name)
+
+    # The manifest is written last, so a partial save is never loaded
+    tmp_path = out_dir / f"{ARTIFACT_MANIFEST}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2)
+    os.replace(tmp_path, out_dir / ARTIFACT_MANIFEST)
+    return out_dir
+
+
+def load_artifacts(
+    in_dir: Union[str, Path],
+    models: Optional[List[str]] = None,
+    mmap: bool = True,
+) -> ModelArtifacts:
+    """
+    Load models, the scaler and the feature list.
+
+    Args:
+        in_dir: Artifact directory written by save_artifacts
+        models: Names of the models to load (all if None)
+        mmap: Whether to memory-map the stored arrays (read-only) instead of
+            reading them into memory
+
+    Returns:
+        ModelArtifacts with the loaded models, scaler and features
+
+    Raises:
+        FileNotFoundError: If the directory has no manifest
+        ValueError: If the format version is not supported
+        KeyError: If a requested model is not stored
+    """
+    in_dir = Path(in_dir)
+    manifest_path = in_dir / ARTIFACT_MANIFEST
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"No model artifacts in {in_dir}")
+    with open(manifest_path, "r", encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    if manifest.get("format_version") != ARTIFACT_FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported artifact format version {manifest.get('format_version')}"
+        )
+
+    features = manifest["features"]
+    scaler = None
+    if manifest["scaler"] is not None:
+        entry = manifest["scaler"]
+        scaler = StandardScaler(
+            with_mean=entry["with_mean"], with_std=entry["with_std"]
+        )
+        for name in SCALER_ATTRIBUTES:
+            setattr(scaler, name, None)
+        _load_arrays(scaler, entry["arrays"], in_dir / "scaler", mmap)
+        scaler.n_samples_seen_ = np.asarray(entry["n_samples_seen"])
+        scaler.n_features_in_ = entry["n_features"]
+        _set_feature_names(scaler, entry["feature_names"])
+
+    names = list(manifest["models"]) if models is None else models
+    loaded = {}
+    for name in names:
+        if name not in manifest["models"]:
+            raise KeyError(f"Model {name!r} not stored in {in_dir}")
+        loaded[name] = _load_model(
+            manifest["models"][name], in_dir / "models" / name, mmap
+        )
+    return ModelArtifacts(loaded, scaler, features)
@@ -0,0 +1,324 @@
+"""
+Benchmark Module
+
+This module times the preprocessing and feature engineering stages on
+synthetic NBA data (see src.synthetic) at several multiples of the real
+dataset size and writes the results as JSON, so throughput and peak memory
+can be compared between commits and machines.
+
+Usage:
+    python -m src.benchmark --scales 1 10 --output data/results/bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import (
+    DEFAULT_SEASON_WINDOW,
+    clean_missing_values,
+    load_nba_data,
+    merge_datasets,
+    process_age_data,
+    process_height_weight,
+)
+from src.feature_engineering import (
+    engineer_all_features,
+    get_correlation_matrix,
+    select_modeling_features,
+)
+from src.profiling import track_peak_memory
+from src.synthetic import write_synthetic_dataset
+
+# Larger scales, e.g. 100 and 1000, are opt-in through --scales
+DEFAULT_SCALES = (1, 10)
+DEFAULT_WORK_DIR = Path("data") / "synthetic"
+DEFAULT_RESULTS_DIR = Path("data") / "results"
+RESULTS_FORMAT_VERSION = 1
+
+SOURCE_FILES = ("player_data.csv", "Seasons_Stats.csv", "All_Star.csv")
+
+
+def _count_rows(result: Any) -> int:
+    """Count the rows of a DataFrame or a tuple of DataFrames."""
+    if isinstance(result, tuple):
+        return sum(len(frame) for frame in result)
+    return len(result)
+
+
+def benchmark_stage(
+    name: str,
+    func: Callable[..., Any],
+    *args: Any,
+    rows: Optional[int] = None,
+    repeat: int = 3,
+    measure_memory: bool = True,
+    **kwargs: Any,
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Time one pipeline stage and measure its peak memory.
+
+    The stage is timed ``repeat`` times without memory tracing, because
+    tracemalloc slows allocation-heavy code down; peak memory is measured in
+    one additional traced run.
+
+    Args:
+        name: Stage name
+        func: Stage function
+        *args: Positional arguments for the stage
+        rows: Rows processed by the stage (rows of the result if None)
+        repeat: Number of timed runs
+        measure_memory: Whether to run the stage once more under tracemalloc
+        **kwargs: Keyword arguments for the stage
+
+    Returns:
+        Tuple of (stage result, benchmark record)
+    """
+    timings = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+
+    peak_bytes = None
+    if measure_memory:
+        with track_peak_memory() as tracker:
+            func(*args, **kwargs)
+        peak_bytes = tracker.peak_bytes
+
+    if rows is None:
+        rows = _count_rows(result)
+    best = min(timings)
+    record = {
+        "stage": name,
+        "rows": rows,
+        "repeat": len(timings),
+        "seconds_min": best,
+        "seconds_median": statistics.median(timings),
+        "rows_per_second": rows / best if best > 0 else None,
+        "peak_memory_bytes": peak_bytes,
+    }
+    return result, record
+
+
+def benchmark_pipeline(
+    player_data_path: str,
+    seasons_stats_path: str,
+    all_star_path: str,
+    repeat: int = 3,
+    measure_memory: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark every pipeline stage on one dataset.
+
+    Each stage consumes the output of the previous one, as in preprocess_data
+    followed by engineer_all_features and get_correlation_matrix.
+
+    Args:
+        player_data_path: Path to player demographic data CSV
+        seasons_stats_path: Path to season statistics CSV
+        all_star_path: Path to All-Star selections CSV
+        repeat: Number of timed runs per stage
+        measure_memory: Whether to measure the peak memory of each stage
+
+    Returns:
+        Benchmark records in stage order
+    """
+    options = {"repeat": repeat, "measure_memory": measure_memory}
+    records = []
+
+    (player_data, seasons_stats, all_star), record = benchmark_stage(
+        "load_nba_data",
+        load_nba_data,
+        player_data_path,
+        seasons_stats_path,
+        all_star_path,
+        season_window=DEFAULT_SEASON_WINDOW,
+        **options,
+    )
+    records.append(record)
+
+    df, record = benchmark_stage(
+        "merge_datasets",
+        merge_datasets,
+        player_data,
+        seasons_stats,
+        all_star,
+        rows=len(player_data) + len(seasons_stats) + len(all_star),
+        **options,
+    )
+    records.append(record)
+
+    for name, func in [
+        ("clean_missing_values", clean_missing_values),
+        ("process_height_weight", process_height_weight),
+        ("process_age_data", process_age_data),
+        ("engineer_all_features", engineer_all_features),
+    ]:
+        df, record = benchmark_stage(name, func, df, rows=len(df), **options)
+        records.append(record)
+
+    _, record = benchmark_stage(
+        "get_correlation_matrix",
+        get_correlation_matrix,
+        df,
+        select_modeling_features(),
+        rows=len(df),
+        **options,
+    )
+    records.append(record)
+    return records
+
+
+def synthetic_dataset(
+    work_dir: Union[str, Path], scale: float, seed: int = 0
+) -> Tuple[str, str, str]:
+    """
+    Return the paths of a synthetic dataset, generating it if needed.
+
+    Generated datasets are kept in ``work_dir`` and reused by later runs with
+    the same scale and seed.
+
+    Args:
+        work_dir: Directory holding the generated datasets
+        scale: Size as a multiple of the real sources
+        seed: Random seed
+
+    Returns:
+        Paths to (player_data.csv, Seasons_Stats.csv, All_Star.csv)
+    """
+    out_dir = Path(work_dir) / f"scale_{scale:g}-seed_{seed}"
+    paths = tuple(str(out_dir / name) for name in SOURCE_FILES)
+    if all(os.path.exists(path) for path in paths):
+        return paths
+    return write_synthetic_dataset(out_dir, scale=scale, seed=seed)
+
+
+def environment_info() -> Dict[str, Any]:
+    """
+    Describe the machine and library versions a benchmark ran with.
+
+    Returns:
+        Dictionary of environment details
+    """
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def run_benchmarks(
+    scales: Sequence[float] = DEFAULT_SCALES,
+    work_dir: Union[str, Path] = DEFAULT_WORK_DIR,
+    seed: int = 0,
+    repeat: int = 3,
+    measure_memory: bool = True,
+) -> Dict[str, Any]:
+    """
+    Benchmark the pipeline stages at several dataset sizes.
+
+    Args:
+        scales: Dataset sizes as multiples of the real sources
+        work_dir: Directory holding the generated datasets
+        seed: Random seed of the synthetic data
+        repeat: Number of timed runs per stage
+        measure_memory: Whether to measure the peak memory of each stage
+
+    Returns:
+        Dictionary with "format_version", "environment", "settings" and
+        "results" (one record per scale and stage)
+    """
+    results = []
+    for scale in scales:
+        paths = synthetic_dataset(work_dir, scale, seed)
+        for record in benchmark_pipeline(*paths, repeat, measure_memory):
+            results.append({"scale": scale, **record})
+
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "environment": environment_info(),
+        "settings": {
+            "scales": list(scales),
+            "seed": seed,
+            "repeat": repeat,
+            "measure_memory": measure_memory,
+        },
+        "results": results,
+    }
+
+
+def write_results(results: Dict[str, Any], path: Union[str, Path]) -> Path:
+    """
+    Write benchmark results as JSON.
+
+    Args:
+        results: Output of run_benchmarks
+        path: Destination file
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2)
+    return path
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        default=list(DEFAULT_SCALES),
+        help="dataset sizes as multiples of the real data (default: 1 10)",
+    )
+    parser.add_argument("--work-dir", default=str(DEFAULT_WORK_DIR))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip peak memory measurement"
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="JSON results file (default: data/results/benchmark-<timestamp>.json)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.scales, args.work_dir, args.seed, args.repeat, not args.no_memory
+    )
+    output = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = DEFAULT_RESULTS_DIR / f"benchmark-{stamp}.json"
+    path = write_results(results, output)
+
+    for record in results["results"]:
+        print(
+            f"x{record['scale']:g} {record['stage']:<24} "
+            f"{record['seconds_min']:9.4f}s {record['rows']:>10,} rows"
+        )
+    print(f"Results written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,337 @@
+"""
+Command-Line Interface
+
+Entry point of the ``nba-allstar`` command. Only the standard library is
+imported at start-up; pandas, NumPy, scikit-learn and the pipeline modules
+are imported by the subcommand that needs them, so ``--help`` and argument
+validation return without loading them.
+
+Usage:
+    nba-allstar preprocess --output data/processed/processed.parquet
+    nba-allstar features data/processed/processed.parquet features.parquet
+    nba-allstar train features.parquet models/ --last-season 2015
+    nba-allstar score features.parquet models/ --season 2016
+    nba-allstar benchmark --scales 1 10
+"""
+
+import argparse
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any, List, Optional
+
+DEFAULT_RAW_DIR = Path("data") / "raw"
+DEFAULT_PROCESSED_PATH = Path("data") / "processed" / "processed.parquet"
+# src.data_processing.DEFAULT_SEASON_WINDOW (not imported, to keep start-up fast)
+DEFAULT_SEASON_WINDOW = (2000, 2016)
+MODEL_NAMES = ("random_forest", "xgboost", "logistic_regression")
+# Models whose estimator comes from an optional package
+MODEL_PACKAGES = {"xgboost": "xgboost"}
+# src.data_processing.BACKENDS
+BACKENDS = ("pandas", "polars")
+TABLE_SUFFIXES = (".parquet", ".csv")
+
+# src.artifacts.ARTIFACT_MANIFEST
+ARTIFACT_MANIFEST = "manifest.json"
+
+
+def _read_table(path: Path) -> Any:
+    """Read a DataFrame from a Parquet or CSV file."""
+    import pandas as pd
+
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def _write_table(df: Any, path: Path) -> None:
+    """Write a DataFrame as Parquet or CSV, depending on the suffix."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def _check_table_path(parser: argparse.ArgumentParser, path: Path) -> None:
+    """Reject table paths with an unsupported suffix."""
+    if path.suffix not in TABLE_SUFFIXES:
+        parser.error(f"{path}: expected one of {', '.join(TABLE_SUFFIXES)}")
+
+
+def _check_exists(parser: argparse.ArgumentParser, *paths: Path) -> None:
+    """Reject input paths that do not exist."""
+    for path in paths:
+        if not path.exists():
+            parser.error(f"{path}: no such file or directory")
+
+
+def _feature_list(value: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated feature list."""
+    if value is None:
+        return None
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def _season_slice(df: Any, first: Optional[int], last: Optional[int]) -> Any:
+    """Rows of a season range."""
+    if first is not None:
+        df = df[df["Year"] >= first]
+    if last is not None:
+        df = df[df["Year"] <= last]
+    return df
+
+
+def run_preprocess(args: argparse.Namespace) -> int:
+    """Run the preprocessing pipeline and write the processed table."""
+    from src.data_processing import preprocess_data
+
+    df = preprocess_data(
+        str(args.player_data),
+        str(args.seasons_stats),
+        str(args.all_star),
+        cache_dir=args.cache_dir,
+        season_window=tuple(args.season_window),
+        copy=False,
+        n_jobs=args.n_jobs,
+        age_reference=args.age_reference,
+        backend=args.backend,
+        name_crosswalk=args.name_crosswalk,
+    )
+    _write_table(df, args.output)
+    print(f"Wrote {len(df):,} rows to {args.output}")
+    return 0
+
+
+def run_features(args: argparse.Namespace) -> int:
+    """Engineer features for a processed table."""
+    from src.feature_engineering import engineer_all_features
+
+    df = engineer_all_features(
+        _read_table(args.input), copy=False, n_jobs=args.n_jobs, backend=args.backend
+    )
+    _write_table(df, args.output)
+    print(f"Wrote {len(df):,} rows to {args.output}")
+    return 0
+
+
+def run_train(args: argparse.Namespace) -> int:
+    """Fit models on engineered features and save them as artifacts."""
+    from sklearn.preprocessing import StandardScaler
+
+    from src.artifacts import save_artifacts
+    from src.feature_engineering import prepare_modeling_data
+    from src.training import PARAM_GRIDS, make_model, run_sweep
+
+    df = _season_slice(_read_table(args.input), args.first_season, args.last_season)
+    X, y = prepare_modeling_data(df, _feature_list(args.features))
+
+    params = {name: {} for name in args.models}
+    if args.sweep:
+        grids = {name: PARAM_GRIDS[name] for name in args.models}
+        sweep = run_sweep(X, y, grids, n_jobs=args.n_jobs, cache_dir=args.cache_dir)
+        for name in args.models:
+            best = sweep[sweep["model"] == name].iloc[0]
+            params[name] = best["params"]
+            print(f"{name}: validation ROC AUC {best['roc_auc']:.4f} {params[name]}")
+
+    # Every model uses the standardised features; tree models are unaffected
+    scaler = StandardScaler().fit(X)
+    X_scaled = scaler.transform(X)
+    models = {
+        name: make_model(name, params[name], standardize=False).fit(X_scaled, y)
+        for name in args.models
+    }
+    save_artifacts(args.output, models, scaler, list(X.columns))
+    print(f"Saved {', '.join(models)} to {args.output}")
+    return 0
+
+
+def run_score(args: argparse.Namespace) -> int:
+    """Score seasons with a saved model and select the predicted All-Stars."""
+    from src.artifacts import load_artifacts
+    from src.scoring import score_seasons
+
+    artifacts = load_artifacts(args.artifacts, [args.model])
+    df = _read_table(args.input)
+    if args.season is not None:
+        df = df[df["Year"] == args.season]
+    if df.empty:
+        print("No rows to score", file=sys.stderr)
+        return 1
+
+    result = score_seasons(
+        artifacts.models[args.model],
+        df,
+        artifacts.features,
+        k=args.k,
+        scaler=artifacts.scaler,
+    )
+    if args.output is not None:
+        _write_table(result, args.output)
+        print(f"Wrote {len(result):,} rows to {args.output}")
+    else:
+        selected = result[result["predicted_all_star"] == 1]
+        print(selected.sort_values(["Year", "season_rank"]).to_string(index=False))
+    return 0
+
+
+def run_benchmark(args: argparse.Namespace) -> int:
+    """Run the stage benchmarks (arguments are passed to src.benchmark)."""
+    from src.benchmark import main as benchmark_main
+
+    return benchmark_main(args.benchmark_args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser of the command-line interface.
+
+    Returns:
+        Parser with one subcommand per pipeline step
+    """
+    parser = argparse.ArgumentParser(
+        prog="nba-allstar", description="NBA All-Star prediction pipeline"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    preprocess = subparsers.add_parser(
+        "preprocess", help="load, merge, clean and impute the raw sources"
+    )
+    preprocess.add_argument(
+        "--player-data", type=Path, default=DEFAULT_RAW_DIR / "player_data.csv"
+    )
+    preprocess.add_argument(
+        "--seasons-stats", type=Path, default=DEFAULT_RAW_DIR / "Seasons_Stats.csv"
+    )
+    preprocess.add_argument(
+        "--all-star", type=Path, default=DEFAULT_RAW_DIR / "All_Star.csv"
+    )
+    preprocess.add_argument("--output", type=Path, default=DEFAULT_PROCESSED_PATH)
+    preprocess.add_argument(
+        "--cache-dir", default=None, help="directory for columnar copies of the CSVs"
+    )
+    preprocess.add_argument(
+        "--season-window",
+        type=int,
+        nargs=2,
+        default=DEFAULT_SEASON_WINDOW,
+        metavar=("FIRST", "LAST"),
+    )
+    preprocess.add_argument("--n-jobs", type=int, default=None)
+    preprocess.add_argument(
+        "--age-reference", default=None, help='"MM-DD" reference date for ages'
+    )
+    preprocess.add_argument("--backend", choices=BACKENDS, default="pandas")
+    preprocess.add_argument(
+        "--name-crosswalk",
+        default=None,
+        help="CSV crosswalk resolving player-name variants (created if missing)",
+    )
+    preprocess.set_defaults(func=run_preprocess)
+
+    features = subparsers.add_parser("features", help="engineer modeling features")
+    features.add_argument("input", type=Path, help="processed table")
+    features.add_argument("output", type=Path, help="engineered table")
+    features.add_argument("--n-jobs", type=int, default=None)
+    features.add_argument("--backend", choices=BACKENDS, default="pandas")
+    features.set_defaults(func=run_features)
+
+    train = subparsers.add_parser("train", help="fit models and save artifacts")
+    train.add_argument("input", type=Path, help="engineered table")
+    train.add_argument("output", type=Path, help="artifact directory")
+    train.add_argument(
+        "--models", nargs="+", choices=MODEL_NAMES, default=["logistic_regression"]
+    )
+    train.add_argument(
+        "--features", default=None, help="comma-separated features (default set)"
+    )
+    train.add_argument("--first-season", type=int, default=None)
+    train.add_argument("--last-season", type=int, default=None)
+    train.add_argument(
+        "--sweep",
+        action="store_true",
+        help="pick hyperparameters with a validation sweep first",
+    )
+    train.add_argument("--n-jobs", type=int, default=-1)
+    train.add_argument("--cache-dir", default=None, help="sweep result cache")
+    train.set_defaults(func=run_train)
+
+    score = subparsers.add_parser("score", help="select the predicted All-Stars")
+    score.add_argument("input", type=Path, help="engineered table")
+    score.add_argument("artifacts", type=Path, help="artifact directory")
+    score.add_argument("--model", choices=MODEL_NAMES, default="logistic_regression")
+    score.add_argument("--season", type=int, default=None)
+    score.add_argument("--k", type=int, default=24, help="All-Star slots per season")
+    score.add_argument("--output", type=Path, default=None)
+    score.set_defaults(func=run_score)
+
+    # Options of the benchmark are left unparsed and passed to src.benchmark
+    benchmark = subparsers.add_parser(
+        "benchmark",
+        help="benchmark the pipeline stages",
+        add_help=False,
+        description="Arguments are passed to python -m src.benchmark",
+    )
+    benchmark.set_defaults(func=run_benchmark)
+    return parser
+
+
+def validate_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Check paths and options before any heavy module is imported.
+
+    Args:
+        parser: Parser used to report errors (exits with status 2)
+        args: Parsed arguments
+    """
+    if args.command == "preprocess":
+        _check_exists(parser, args.player_data, args.seasons_stats, args.all_star)
+        _check_table_path(parser, args.output)
+        first, last = args.season_window
+        if first > last:
+            parser.error(f"--season-window: {first} is after {last}")
+        if args.backend == "polars" and args.name_crosswalk is not None:
+            parser.error("--name-crosswalk is not supported by the polars backend")
+    elif args.command in ("features", "train", "score"):
+        _check_exists(parser, args.input)
+        _check_table_path(parser, args.input)
+        if args.command == "features":
+            _check_table_path(parser, args.output)
+    if args.command == "score":
+        _check_exists(parser, args.artifacts / ARTIFACT_MANIFEST)
+        if args.output is not None:
+            _check_table_path(parser, args.output)
+        if args.k < 1:
+            parser.error("--k must be positive")
+    if args.command == "train":
+        if args.features is not None and not _feature_list(args.features):
+            parser.error("--features: no feature names given")
+        for name in args.models:
+            package = MODEL_PACKAGES.get(name)
+            if package is not None and importlib.util.find_spec(package) is None:
+                parser.error(f"--models {name}: {package} is not installed")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the command-line interface.
+
+    Args:
+        argv: Arguments (sys.argv[1:] if None)
+
+    Returns:
+        Exit status
+    """
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "benchmark":
+        args.benchmark_args = extra
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    validate_args(parser, args)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,244 @@
+"""
+Streaming Correlation Module
+
+This module computes covariance and correlation matrices in one pass over
+chunks of rows, so correlation analysis does not need the whole dataset in
+memory. Partial results from separate chunks or worker processes are
+combined with the pairwise update of Chan, Golub and LeVeque, which keeps
+the result equal to a single pass over all rows.
+
+Missing values are handled either listwise (rows with any missing value are
+ignored, like ``df.dropna().corr()``) or pairwise (each pair of columns uses
+the rows where both are present, like ``df.corr()``).
+"""
+
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+NAN_POLICIES = ("pairwise", "listwise")
+
+
+class CorrelationAccumulator:
+    """
+    One-pass accumulator of pairwise means, variances and co-moments.
+
+    For every pair of columns (i, j) the accumulator keeps the number of rows
+    where both are present, the mean of column i over those rows and the sums
+    of squared deviations and cross deviations. Values are shifted by the
+    column means of the first chunk before they are summed, which avoids the
+    cancellation of the naive sum-of-squares formula for columns with a large
+    mean relative to their spread.
+
+    Attributes:
+        columns: Column names, in matrix order
+        nan_policy: "pairwise" or "listwise" handling of missing values
+    """
+
+    def __init__(self, columns: List[str], nan_policy: str = "pairwise") -> None:
+        if nan_policy not in NAN_POLICIES:
+            raise ValueError(
+                f"nan_policy must be one of {NAN_POLICIES}, got {nan_policy!r}"
+            )
+        self.columns = list(columns)
+        self.nan_policy = nan_policy
+        k = len(self.columns)
+        self._shift: Optional[np.ndarray] = None
+        # _count[i, j]: rows where columns i and j are both present
+        self._count = np.zeros((k, k))
+        # _mean[i, j]: mean of column i over those rows
+        self._mean = np.zeros((k, k))
+        # _m2[i, j]: squared deviations of column i over those rows
+        self._m2 = np.zeros((k, k))
+        # _comoment[i, j]: cross deviations of columns i and j
+        self._comoment = np.zeros((k, k))
+
+    def _as_array(self, chunk: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """Return the chunk as a float64 array in column order."""
+        if isinstance(chunk, pd.DataFrame):
+            return np.column_stack(
+                [
+                    chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                    for col in self.columns
+                ]
+            )
+        values = np.asarray(chunk, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != len(self.columns):
+            raise ValueError(
+                f"Expected an array with {len(self.columns)} columns, "
+                f"got shape {values.shape}"
+            )
+        return values
+
+    def update(
+        self, chunk: Union[pd.DataFrame, np.ndarray]
+    ) -> "CorrelationAccumulator":
+        """
+        Add a chunk of rows.
+
+        Args:
+            chunk: DataFrame containing the accumulator columns, or a 2-D
+                array with one column per accumulator column
+
+        Returns:
+            The accumulator itself
+        """
+        values = self._as_array(chunk)
+        present = ~np.isnan(values)
+        if self.nan_policy == "listwise":
+            present &= present.all(axis=1, keepdims=True)
+        if not present.any():
+            return self
+
+        if self._shift is None:
+            counts = present.sum(axis=0)
+            sums = np.where(present, values, 0.0).sum(axis=0)
+            self._shift = np.divide(
+                sums, counts, out=np.zeros(len(self.columns)), where=counts > 0
+            )
+
+        mask = present.astype(np.float64)
+        shifted = np.where(present, values - self._shift, 0.0)
+
+        count = mask.T @ mask
+        sums = shifted.T @ mask  # sums[i, j]: column i over rows with j present
+        squares = (shifted**2).T @ mask
+        products = shifted.T @ shifted
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, sums / count, 0.0)
+            m2 = np.where(count > 0, squares - sums * mean, 0.0)
+            comoment = np.where(count > 0, products - sums * mean.T, 0.0)
+
+        chunk_stats = CorrelationAccumulator(self.columns, self.nan_policy)
+        chunk_stats._shift = self._shift
+        chunk_stats._count = count
+        chunk_stats._mean = mean + self._shift[:, None]
+        chunk_stats._m2 = m2
+        chunk_stats._comoment = comoment
+        return self.merge(chunk_stats)
+
+    def merge(self, other: "CorrelationAccumulator") -> "CorrelationAccumulator":
+        """
+        Combine the statistics of another accumulator into this one.
+
+        Args:
+            other: Accumulator over other rows, with the same columns
+
+        Returns:
+            The accumulator itself
+        """
+        if other.columns != self.columns or other.nan_policy != self.nan_policy:
+            raise ValueError("Accumulators must have the same columns and policy")
+        if self._shift is None:
+            self._shift = other._shift
+
+        n_a, n_b = self._count, other._count
+        n = n_a + n_b
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(n > 0, n_a * n_b / n, 0.0)
+            delta = other._mean - self._mean
+            self._mean = np.where(n > 0, self._mean + delta * n_b / n, 0.0)
+        self._m2 = self._m2 + other._m2 + delta**2 * weight
+        self._comoment = self._comoment + other._comoment + delta * delta.T * weight
+        self._count = n
+        return self
+
+    def count(self) -> pd.DataFrame:
+        """
+        Return the number of rows used for each pair of columns.
+
+        Returns:
+            Square DataFrame of pair counts
+        """
+        return pd.DataFrame(
+            self._count.astype(np.int64), index=self.columns, columns=self.columns
+        )
+
+    def covariance(self, ddof: int = 1, min_periods: int = 1) -> pd.DataFrame:
+        """
+        Return the covariance matrix.
+
+        Args:
+            ddof: Delta degrees of freedom
+            min_periods: Minimum rows per pair for a result
+
+        Returns:
+            Square covariance DataFrame (NaN where too few rows)
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = self._comoment / (self._count - ddof)
+        valid = (self._count >= max(min_periods, ddof + 1)) & (self._count > ddof)
+        return pd.DataFrame(
+            np.where(valid, cov, np.nan), index=self.columns, columns=self.columns
+        )
+
+    def correlation(self, min_periods: int = 1) -> pd.DataFrame:
+        """
+        Return the Pearson correlation matrix.
+
+        Args:
+            min_periods: Minimum rows per pair for a result
+
+        Returns:
+            Square correlation DataFrame (NaN where too few rows or a column
+            is constant)
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = self._comoment / np.sqrt(self._m2 * self._m2.T)
+        corr = np.clip(corr, -1.0, 1.0)
+        valid = (self._count >= max(min_periods, 2)) & (self._m2 > 0) & (self._m2.T > 0)
+        return pd.DataFrame(
+            np.where(valid, corr, np.nan), index=self.columns, columns=self.columns
+        )
+
+
+def iter_row_chunks(
+    df: pd.DataFrame, columns: List[str], chunk_size: int
+) -> Iterable[np.ndarray]:
+    """
+    Yield float64 row chunks of some columns without copying the whole frame.
+
+    Args:
+        df: Input DataFrame
+        columns: Columns to include, in order
+        chunk_size: Rows per chunk
+
+    Yields:
+        2-D arrays of at most ``chunk_size`` rows
+    """
+    arrays = [df[col] for col in columns]
+    for start in range(0, len(df), max(1, chunk_size)):
+        stop = start + chunk_size
+        yield np.column_stack(
+            [
+                values.iloc[start:stop].to_numpy(dtype=np.float64, na_value=np.nan)
+                for values in arrays
+            ]
+        )
+
+
+def streaming_correlation(
+    chunks: Iterable[Union[pd.DataFrame, np.ndarray]],
+    columns: List[str],
+    nan_policy: str = "pairwise",
+) -> pd.DataFrame:
+    """
+    Compute a correlation matrix in one pass over chunks of rows.
+
+    ``chunks`` can be any iterable, e.g. ``pd.read_csv(path, chunksize=...)``,
+    so the data never has to be in memory at once.
+
+    Args:
+        chunks: Row chunks as DataFrames or 2-D arrays
+        columns: Columns to correlate
+        nan_policy: "pairwise" or "listwise" handling of missing values
+
+    Returns:
+        Square correlation DataFrame
+    """
+    accumulator = CorrelationAccumulator(columns, nan_policy)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.correlation()
@@ -0,0 +1,367 @@
+"""
+Data Cache Module
+
+This module keeps columnar (Parquet) copies of the raw NBA CSV files so that
+repeated pipeline runs do not have to re-parse the text sources.
+
+Cache entries are keyed by the location and content hash of the source
+file, the cache schema version and the options used to parse it. A small
+manifest remembers the size and modification time of every source so
+unchanged files are not re-hashed on each run.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+# Bump whenever the on-disk layout or the parsing logic changes so that
+# previously written cache files are no longer considered valid.
+CACHE_SCHEMA_VERSION = 2
+
+MANIFEST_NAME = "cache_manifest.json"
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def parquet_available() -> bool:
+    """
+    Check whether a Parquet engine is installed.
+
+    Returns:
+        True if pyarrow can be imported
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def options_fingerprint(options: Dict[str, Any]) -> str:
+    """
+    Build a short, stable fingerprint of CSV parsing options.
+
+    Args:
+        options: Keyword arguments passed to pd.read_csv
+
+    Returns:
+        Short hex fingerprint of the options
+    """
+    encoded = json.dumps(options, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:8]
+
+
+def _load_manifest(cache_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Read the cache manifest, returning an empty one if missing or corrupt."""
+    manifest_path = cache_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(cache_dir: Path, manifest: Dict[str, Dict[str, Any]]) -> None:
+    """Atomically write the cache manifest."""
+    manifest_path = cache_dir / MANIFEST_NAME
+    tmp_path = manifest_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def source_digest(
+    source: Path, manifest: Dict[str, Dict[str, Any]]
+) -> Tuple[str, bool]:
+    """
+    Return the content digest of a source file.
+
+    The digest recorded in the manifest is reused while the file's size and
+    modification time are unchanged; otherwise the file is hashed again and
+    the manifest entry is refreshed.
+
+    Args:
+        source: Path to the source file
+        manifest: Mapping of resolved path to size, mtime and digest
+            (updated in place)
+
+    Returns:
+        Tuple of (digest, manifest_updated)
+    """
+    stat = source.stat()
+    key = str(source.resolve())
+    entry = manifest.get(key)
+    if (
+        entry is not None
+        and entry.get("size") == stat.st_size
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        return entry["sha256"], False
+
+    digest = file_digest(source)
+    manifest[key] = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest,
+    }
+    return digest, True
+
+
+def cache_path_for(
+    source: Union[str, Path],
+    cache_dir: Union[str, Path],
+    digest: str,
+    options: Optional[Dict[str, Any]] = None,
+) -> Path:
+    """
+    Build the cache file path for a source file.
+
+    Args:
+        source: Path to the raw CSV file
+        cache_dir: Directory holding cache files
+        digest: Content digest of the source file
+        options: CSV parsing options used to build the cached frame
+
+    Returns:
+        Path of the Parquet cache file
+    """
+    source = Path(source)
+    stem = source.stem.replace(" ", "_")
+    location = hashlib.sha256(str(source.resolve()).encode("utf-8")).hexdigest()[:8]
+    fingerprint = options_fingerprint(options or {})
+    name = (
+        f"{stem}-{location}-{digest[:16]}-v{CACHE_SCHEMA_VERSION}-{fingerprint}"
+        ".parquet"
+    )
+    return Path(cache_dir) / name
+
+
+def _cache_key_parts(cache_file: Path) -> Tuple[str, str, str]:
+    """Split a cache file name into (source location, digest, schema version)."""
+    _, location, digest, version, _ = cache_file.stem.rsplit("-", 4)
+    return location, digest, version
+
+
+def _remove_stale_entries(current: Path) -> None:
+    """
+    Delete cache files built from older contents of the same source.
+
+    Sources are matched by their resolved path, so files with the same name in
+    different directories keep their own entries. Entries for the current
+    contents parsed with other options are kept, so callers that read
+    different column subsets do not evict each other.
+    """
+    location, digest, version = _cache_key_parts(current)
+    for candidate in current.parent.glob("*.parquet"):
+        try:
+            other_location, other_digest, other_version = _cache_key_parts(candidate)
+        except ValueError:
+            continue
+        if other_location != location:
+            continue
+        if other_digest != digest or other_version != version:
+            try:
+                candidate.unlink()
+            except OSError:
+                pass
+
+
+Filter = Tuple[str, str, Any]
+
+_FILTER_OPS = {
+    "==": lambda values, value: values == value,
+    "!=": lambda values, value: values != value,
+    ">": lambda values, value: values > value,
+    ">=": lambda values, value: values >= value,
+    "<": lambda values, value: values < value,
+    "<=": lambda values, value: values <= value,
+}
+
+
+def csv_header(
+    path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None
+) -> List[str]:
+    """
+    Return the column names of a CSV file.
+
+    With a cache directory, the header is recorded in the cache manifest next
+    to the source digest, so unchanged sources are not opened again.
+
+    Args:
+        path: Path to the CSV file
+        cache_dir: Directory holding cache files (no caching if None)
+
+    Returns:
+        Column names of the file, in file order
+    """
+    if cache_dir is None or not parquet_available():
+        return list(pd.read_csv(path, nrows=0).columns)
+
+    source = Path(path)
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest = _load_manifest(cache_dir)
+    _, manifest_updated = source_digest(source, manifest)
+    entry = manifest[str(source.resolve())]
+    if "columns" not in entry:
+        entry["columns"] = list(pd.read_csv(source, nrows=0).columns)
+        manifest_updated = True
+    if manifest_updated:
+        _save_manifest(cache_dir, manifest)
+    return list(entry["columns"])
+
+
+def apply_filters(df: pd.DataFrame, filters: Optional[List[Filter]]) -> pd.DataFrame:
+    """
+    Apply pyarrow-style row filters to an in-memory DataFrame.
+
+    Args:
+        df: Input DataFrame
+        filters: List of (column, operator, value) conditions combined with AND
+
+    Returns:
+        DataFrame with only the matching rows
+    """
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        if column in df.columns:
+            mask &= _FILTER_OPS[op](df[column], value)
+    return df[mask].reset_index(drop=True)
+
+
+def read_csv_cached(
+    path: Union[str, Path],
+    cache_dir: Optional[Union[str, Path]] = None,
+    filters: Optional[List[Filter]] = None,
+    **read_csv_kwargs: Any,
+) -> pd.DataFrame:
+    """
+    Read a CSV file through the columnar cache.
+
+    On the first call the CSV is parsed and written to a Parquet file under
+    ``cache_dir``; subsequent calls read the Parquet copy as long as the source
+    contents, the cache schema version and the parsing options are unchanged.
+    Falls back to a plain ``pd.read_csv`` when no cache directory is given or
+    pyarrow is not installed.
+
+    Row filters are pushed down into the Parquet reader on cache hits, so rows
+    outside them are never materialised; the cache itself always holds the
+    complete file.
+
+    Args:
+        path: Path to the raw CSV file
+        cache_dir: Directory holding cache files (no caching if None)
+        filters: List of (column, operator, value) row conditions, e.g.
+            [("Year", ">=", 2000)]
+        **read_csv_kwargs: Extra keyword arguments for pd.read_csv
+
+    Returns:
+        DataFrame with the file contents
+    """
+    if cache_dir is None or not parquet_available():
+        return apply_filters(pd.read_csv(path, **read_csv_kwargs), filters)
+
+    source = Path(path)
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest = _load_manifest(cache_dir)
+    digest, manifest_updated = source_digest(source, manifest)
+    target = cache_path_for(source, cache_dir, digest, read_csv_kwargs)
+
+    if target.exists():
+        try:
+            df = pd.read_parquet(target, filters=filters or None)
+        except (OSError, ValueError):
+            df = None
+        if df is not None:
+            if manifest_updated:
+                _save_manifest(cache_dir, manifest)
+            return df
+
+    df = pd.read_csv(source, **read_csv_kwargs)
+
+    tmp_target = target.with_suffix(".parquet.tmp")
+    df.to_parquet(tmp_target, index=False)
+    os.replace(tmp_target, target)
+    _remove_stale_entries(target)
+    _save_manifest(cache_dir, manifest)
+
+    return apply_filters(df, filters)
+
+
+def write_frame(df: pd.DataFrame, path: Union[str, Path]) -> Path:
+    """
+    Atomically write a DataFrame to a binary file.
+
+    Parquet is used when pyarrow is installed; otherwise the frame is pickled.
+    The suffix of ``path`` is replaced accordingly.
+
+    Args:
+        df: DataFrame to store
+        path: Target path (suffix is ignored)
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if parquet_available():
+        target = path.with_suffix(".parquet")
+        tmp_target = target.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp_target, index=False)
+    else:
+        target = path.with_suffix(".pkl")
+        tmp_target = target.with_suffix(".pkl.tmp")
+        df.reset_index(drop=True).to_pickle(tmp_target)
+    os.replace(tmp_target, target)
+    return target
+
+
+def read_frame(
+    path: Union[str, Path], filters: Optional[List[Filter]] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Read a DataFrame written with write_frame.
+
+    Args:
+        path: Path given to write_frame (suffix is ignored)
+        filters: List of (column, operator, value) row conditions
+
+    Returns:
+        The stored DataFrame, or None if nothing has been written yet
+    """
+    path = Path(path)
+    parquet_path = path.with_suffix(".parquet")
+    if parquet_path.exists() and parquet_available():
+        return pd.read_parquet(parquet_path, filters=filters or None)
+    pickle_path = path.with_suffix(".pkl")
+    if pickle_path.exists():
+        return apply_filters(pd.read_pickle(pickle_path), filters)
+    return None
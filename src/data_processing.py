@@ -4,14 +4,146 @@ Data Processing Module
 This module contains functions for loading, cleaning, and preprocessing NBA player data.
 """
 
-from typing import List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from src.data_cache import csv_header, read_csv_cached
+from src.parallel import (
+    concat_partitions,
+    map_partitions,
+    resolve_n_jobs,
+    split_rows,
+)
+from src.profiling import StageProfiler, run_stage
+from src.schemas import (
+    CATEGORY,
+    REQUIRED_COLUMNS,
+    SCHEMAS,
+    TEXT,
+    apply_schema,
+    csv_read_options,
+    memory_report,
+)
+
+# Seasons kept by default (the 2000-2016 modelling window)
+DEFAULT_SEASON_WINDOW: Tuple[int, int] = (2000, 2016)
+
+# Execution backends of preprocess_data and engineer_all_features
+BACKENDS = ("pandas", "polars")
+
+
+def check_backend(backend: str) -> None:
+    """
+    Validate the name of an execution backend.
+
+    Args:
+        backend: Backend name
+
+    Raises:
+        ValueError: If the backend is not one of BACKENDS
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+
+
+def season_filters(
+    season_window: Optional[Tuple[int, int]],
+) -> Optional[List[Tuple[str, str, int]]]:
+    """
+    Build row filters selecting the seasons inside a window.
+
+    Args:
+        season_window: Inclusive (first_year, last_year) or None for all seasons
+
+    Returns:
+        List of (column, operator, value) filters, or None
+    """
+    if season_window is None:
+        return None
+    first_year, last_year = season_window
+    return [("Year", ">=", first_year), ("Year", "<=", last_year)]
+
+
+def filter_season_window(
+    df: pd.DataFrame, season_window: Optional[Tuple[int, int]]
+) -> pd.DataFrame:
+    """
+    Keep only the rows whose Year falls inside a season window.
+
+    Args:
+        df: DataFrame with a Year column
+        season_window: Inclusive (first_year, last_year) or None for all seasons
+
+    Returns:
+        Filtered DataFrame (the input itself if no window is given)
+    """
+    if season_window is None or "Year" not in df.columns:
+        return df
+    first_year, last_year = season_window
+    return df[(df["Year"] >= first_year) & (df["Year"] <= last_year)]
+
+
+def read_source(
+    path: str,
+    source: str,
+    cache_dir: Optional[str] = None,
+    typed: bool = True,
+    season_window: Optional[Tuple[int, int]] = None,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Read one raw source, optionally pruned and typed by its declared schema.
+
+    Args:
+        path: Path to the source CSV
+        source: Source name ("player_data", "seasons_stats" or "all_star")
+        cache_dir: Directory for columnar copies of the CSVs (no caching if None)
+        typed: Whether to apply the declared schema of the source
+        season_window: Inclusive (first_year, last_year) applied while loading
+            sources that have a Year column (all seasons if None)
+        columns: Columns to read (all declared columns if None)
+
+    Returns:
+        DataFrame with the source contents
+    """
+    header = csv_header(path, cache_dir)
+    filters = season_filters(season_window) if "Year" in header else None
+
+    if not typed:
+        if columns is None:
+            return read_csv_cached(path, cache_dir, filters=filters)
+        usecols = [col for col in header if col in columns]
+        return read_csv_cached(path, cache_dir, filters=filters, usecols=usecols)
+
+    schema = SCHEMAS[source]
+    options = csv_read_options(schema, header, columns)
+    try:
+        df = read_csv_cached(path, cache_dir, filters=filters, **options)
+    except ValueError:
+        # Stray text in a numeric column; parse numerics loosely and let
+        # apply_schema coerce them.
+        options["dtype"] = {
+            col: dtype
+            for col, dtype in options["dtype"].items()
+            if dtype in (CATEGORY, TEXT)
+        }
+        df = read_csv_cached(path, cache_dir, filters=filters, **options)
+
+    return apply_schema(df, schema, REQUIRED_COLUMNS.get(source), copy=False)
+
 
 def load_nba_data(
-    player_data_path: str, seasons_stats_path: str, all_star_path: str
+    player_data_path: str,
+    seasons_stats_path: str,
+    all_star_path: str,
+    cache_dir: Optional[str] = None,
+    typed: bool = True,
+    season_window: Optional[Tuple[int, int]] = None,
+    columns: Optional[Dict[str, List[str]]] = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     """
     Load the three main NBA datasets.
@@ -20,54 +152,234 @@ def load_nba_data(
         player_data_path: Path to player demographic data CSV
         seasons_stats_path: Path to season statistics CSV
         all_star_path: Path to All-Star selections CSV
+        cache_dir: Directory for columnar copies of the CSVs, e.g.
+            "data/processed" (no caching if None)
+        typed: Whether to load only the declared columns with compact dtypes
+            (see src.schemas); if False every column is read as inferred
+        season_window: Inclusive (first_year, last_year) applied to the season
+            statistics and All-Star selections while loading (all seasons if
+            None). With a cache directory the filter is pushed down into the
+            Parquet reader.
+        columns: Columns to read per source name ("player_data",
+            "seasons_stats", "all_star"); sources without an entry are read
+            in full
 
     Returns:
         Tuple of (player_data, seasons_stats, all_star) DataFrames
     """
-    player_data = pd.read_csv(player_data_path)
-    seasons_stats = pd.read_csv(seasons_stats_path)
-    all_star = pd.read_csv(all_star_path)
+    columns = columns or {}
+    player_data = read_source(
+        player_data_path,
+        "player_data",
+        cache_dir,
+        typed,
+        columns=columns.get("player_data"),
+    )
+    seasons_stats = read_source(
+        seasons_stats_path,
+        "seasons_stats",
+        cache_dir,
+        typed,
+        season_window,
+        columns.get("seasons_stats"),
+    )
+    all_star = read_source(
+        all_star_path,
+        "all_star",
+        cache_dir,
+        typed,
+        season_window,
+        columns.get("all_star"),
+    )
 
     return player_data, seasons_stats, all_star
 
 
+def compare_load_memory(
+    player_data_path: str, seasons_stats_path: str, all_star_path: str
+) -> pd.DataFrame:
+    """
+    Report memory usage of the raw sources and merged frame with and without
+    the declared schemas.
+
+    Args:
+        player_data_path: Path to player demographic data CSV
+        seasons_stats_path: Path to season statistics CSV
+        all_star_path: Path to All-Star selections CSV
+
+    Returns:
+        Memory report DataFrame (see src.schemas.memory_report)
+    """
+    paths = (player_data_path, seasons_stats_path, all_star_path)
+    names = ("player_data", "seasons_stats", "all_star")
+
+    before = dict(zip(names, load_nba_data(*paths, typed=False)))
+    after = dict(zip(names, load_nba_data(*paths, typed=True)))
+    before["merged"] = merge_datasets(
+        before["player_data"], before["seasons_stats"], before["all_star"]
+    )
+    after["merged"] = merge_datasets(
+        after["player_data"], after["seasons_stats"], after["all_star"]
+    )
+
+    return memory_report(before, after)
+
+
+def _factorize_names(names: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Factorize names and normalise each distinct value once."""
+    codes, uniques = pd.factorize(names)
+    normalized = (
+        pd.Index(uniques, dtype=object).str.strip().str.replace(r"\s+", " ", regex=True)
+    )
+    return codes, normalized
+
+
+def normalize_player_names(names: pd.Series) -> pd.Series:
+    """
+    Normalise player names by stripping and collapsing whitespace.
+
+    Only the distinct names are processed; the results are broadcast back to
+    every row.
+
+    Args:
+        names: Series of raw player names
+
+    Returns:
+        Series of normalised names aligned with the input
+    """
+    codes, normalized = _factorize_names(names)
+    values = np.asarray(normalized, dtype=object)
+    result = np.where(codes >= 0, values[np.maximum(codes, 0)], None)
+    return pd.Series(result, index=names.index, name=names.name)
+
+
+def build_player_index(*names: pd.Series) -> pd.Index:
+    """
+    Build a player-identity index over one or more name columns.
+
+    The position of a normalised name in the index is its integer player ID.
+
+    Args:
+        *names: Series of raw player names
+
+    Returns:
+        Index of distinct normalised player names
+    """
+    uniques = [_factorize_names(series)[1] for series in names]
+    if not uniques:
+        return pd.Index([], dtype=object)
+    combined = uniques[0].append(uniques[1:]) if len(uniques) > 1 else uniques[0]
+    return pd.Index(combined.unique(), dtype=object)
+
+
+def encode_player_names(names: pd.Series, player_index: pd.Index) -> np.ndarray:
+    """
+    Map raw player names to integer IDs from a player index.
+
+    Args:
+        names: Series of raw player names
+        player_index: Index built with build_player_index
+
+    Returns:
+        int32 array of player IDs (-1 for missing or unknown names)
+    """
+    codes, normalized = _factorize_names(names)
+    unique_ids = player_index.get_indexer(normalized).astype(np.int32)
+    return np.where(codes >= 0, unique_ids[np.maximum(codes, 0)], -1).astype(np.int32)
+
+
+def apply_name_crosswalk(names: pd.Series, mapping: Dict[str, str]) -> pd.Series:
+    """
+    Normalise player names and replace them by their resolved names.
+
+    Args:
+        names: Series of raw player names
+        mapping: Normalised name -> resolved name (see
+            src.name_resolution.crosswalk_mapping)
+
+    Returns:
+        Series of resolved names aligned with the input
+    """
+    codes, normalized = _factorize_names(names)
+    values = np.array([mapping.get(name, name) for name in normalized], dtype=object)
+    result = np.where(codes >= 0, values[np.maximum(codes, 0)], None)
+    return pd.Series(result, index=names.index, name=names.name)
+
+
 def merge_datasets(
-    player_data: pd.DataFrame, seasons_stats: pd.DataFrame, all_star: pd.DataFrame
+    player_data: pd.DataFrame,
+    seasons_stats: pd.DataFrame,
+    all_star: pd.DataFrame,
+    season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+    name_crosswalk: Optional[Dict[str, Dict[str, str]]] = None,
 ) -> pd.DataFrame:
     """
     Merge the three datasets and create the target variable.
 
+    Player names are normalised once and dictionary-encoded into integer
+    ``player_id`` values, so both joins run on integer keys. The season window
+    is applied before any join.
+
     Args:
         player_data: Player demographic data
         seasons_stats: Season statistics data
         all_star: All-Star selections data
+        season_window: Inclusive (first_year, last_year) of seasons to keep
+            (all seasons if None)
+        name_crosswalk: Name replacements per source name ("seasons_stats",
+            "all_star"), applied before the names are encoded, so name
+            variants join to the player data (see src.name_resolution)
 
     Returns:
-        Merged DataFrame with is_all_star target variable
+        Merged DataFrame with player_id and is_all_star target variable
     """
+    # Filter seasons before joining
+    seasons_stats = filter_season_window(seasons_stats, season_window)
+    seasons_stats = seasons_stats[seasons_stats["Year"].notna()]
+    all_star = filter_season_window(all_star, season_window)
+
+    # Replace name variants by their resolved names
+    if name_crosswalk:
+        seasons_stats = seasons_stats.assign(
+            Player=apply_name_crosswalk(
+                seasons_stats["Player"], name_crosswalk.get("seasons_stats", {})
+            )
+        )
+        all_star = all_star.assign(
+            Player=apply_name_crosswalk(
+                all_star["Player"], name_crosswalk.get("all_star", {})
+            )
+        )
+
     # Rename columns for consistency
     seasons_stats = seasons_stats.rename(columns={"Player": "PlayerName"})
     player_data = player_data.rename(columns={"name": "PlayerName"})
     all_star = all_star.rename(columns={"Player": "PlayerName"})
 
-    # Merge seasons_stats with players
-    merged = pd.merge(seasons_stats, player_data, on="PlayerName", how="left")
-
-    # Filter seasons from 2000 to 2016
-    merged = merged[(merged["Year"] >= 2000) & (merged["Year"] <= 2016)]
+    # Encode player names into integer IDs
+    player_index = build_player_index(
+        seasons_stats["PlayerName"], player_data["PlayerName"], all_star["PlayerName"]
+    )
+    seasons_stats = seasons_stats.assign(
+        PlayerName=normalize_player_names(seasons_stats["PlayerName"]),
+        player_id=encode_player_names(seasons_stats["PlayerName"], player_index),
+    )
+    player_ids = encode_player_names(player_data["PlayerName"], player_index)
+    player_data = player_data.drop(columns=["PlayerName"]).assign(player_id=player_ids)
+    player_data = player_data[player_ids >= 0]
 
-    # Standardize player name formatting
-    merged["PlayerName"] = merged["PlayerName"].str.strip()
-    all_star["PlayerName"] = all_star["PlayerName"].str.strip()
+    # Merge seasons_stats with players
+    merged = pd.merge(seasons_stats, player_data, on="player_id", how="left")
+    merged["Year"] = merged["Year"].astype(np.int16)
 
     # Add 'is_all_star' column
-    all_star["is_all_star"] = 1
-    labeled = pd.merge(
-        merged,
-        all_star[["PlayerName", "Year", "is_all_star"]],
-        on=["PlayerName", "Year"],
-        how="left",
+    all_star_ids = encode_player_names(all_star["PlayerName"], player_index)
+    labels = pd.DataFrame(
+        {"player_id": all_star_ids, "Year": all_star["Year"].to_numpy()}
     )
+    labels = labels[(labels["player_id"] >= 0) & labels["Year"].notna()]
+    labels = labels.astype({"Year": np.int16}).assign(is_all_star=1)
+    labeled = pd.merge(merged, labels, on=["player_id", "Year"], how="left")
 
     # Fill NaNs in is_all_star with 0
     labeled["is_all_star"] = labeled["is_all_star"].fillna(0).astype(int)
@@ -75,21 +387,68 @@ def merge_datasets(
     return labeled
 
 
-def clean_missing_values(df: pd.DataFrame) -> pd.DataFrame:
+# Shooting percentages back-filled from makes and attempts while cleaning
+PERCENTAGE_COLUMNS = ["3P%", "2P%", "FG%", "FT%", "eFG%"]
+
+# Makes and attempts of each percentage: (numerator terms, denominator), where
+# each term is (coefficient, column)
+PERCENTAGE_INPUTS: Dict[str, Tuple[Tuple[Tuple[float, str], ...], str]] = {
+    "3P%": (((1.0, "3P"),), "3PA"),
+    "2P%": (((1.0, "2P"),), "2PA"),
+    "FG%": (((1.0, "FG"),), "FGA"),
+    "FT%": (((1.0, "FT"),), "FTA"),
+    "eFG%": (((1.0, "FG"), (0.5, "3P")), "FGA"),
+}
+
+# Advanced statistics whose missing values mean zero
+ADVANCED_STAT_COLUMNS = [
+    "PER",
+    "TS%",
+    "3PAr",
+    "FTr",
+    "ORB%",
+    "DRB%",
+    "TRB%",
+    "AST%",
+    "STL%",
+    "BLK%",
+    "TOV%",
+    "USG%",
+    "WS/48",
+]
+
+# Text columns filled with a placeholder while cleaning
+TEXT_FILL_COLUMNS = {"college": "Unknown", "position": "Unknown"}
+
+
+def _fill_text(series: pd.Series, value: str) -> pd.Series:
+    """Fill missing text values, adding the fill value to categoricals first."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if value not in series.cat.categories:
+            series = series.cat.add_categories([value])
+    return series.fillna(value)
+
+
+def clean_missing_values(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Clean missing values in the dataset.
 
     Args:
         df: Input DataFrame
+        copy: Work on a copy of ``df``; if False, ``df`` is modified in place
+            where possible (always use the returned frame)
 
     Returns:
         DataFrame with missing values handled
     """
-    df = df.copy()
+    if copy:
+        df = df.copy()
 
     # Remove unnecessary columns
     cols_to_drop = ["Unnamed: 0", "blanl", "blank2"]
-    df = df.drop(columns=[col for col in cols_to_drop if col in df.columns])
+    existing_cols_to_drop = [col for col in cols_to_drop if col in df.columns]
+    if existing_cols_to_drop:
+        df.drop(columns=existing_cols_to_drop, inplace=True)
 
     # Convert numeric columns
     cols_to_float = [
@@ -153,100 +512,324 @@ def clean_missing_values(df: pd.DataFrame) -> pd.DataFrame:
         df["eFG%"] = (df["FG"] + 0.5 * df["3P"]) / df["FGA"]
 
     # Fill remaining NaNs in percentages with 0.0
-    percentage_cols = ["3P%", "2P%", "FG%", "FT%", "eFG%"]
-    existing_percentage_cols = [col for col in percentage_cols if col in df.columns]
+    existing_percentage_cols = [col for col in PERCENTAGE_COLUMNS if col in df.columns]
     if existing_percentage_cols:
         df[existing_percentage_cols] = df[existing_percentage_cols].fillna(0.0)
 
     # Fill advanced stats with 0.0
-    advanced_stats = [
-        "PER",
-        "TS%",
-        "3PAr",
-        "FTr",
-        "ORB%",
-        "DRB%",
-        "TRB%",
-        "AST%",
-        "STL%",
-        "BLK%",
-        "TOV%",
-        "USG%",
-        "WS/48",
-    ]
-    for col in advanced_stats:
+    for col in ADVANCED_STAT_COLUMNS:
         if col in df.columns:
             df[col] = df[col].fillna(0.0)
 
     # Fill categorical columns
-    if "college" in df.columns:
-        df["college"] = df["college"].fillna("Unknown")
-    if "position" in df.columns:
-        df["position"] = df["position"].fillna("Unknown")
+    for col, value in TEXT_FILL_COLUMNS.items():
+        if col in df.columns:
+            df[col] = _fill_text(df[col], value)
 
     return df
 
 
-def process_height_weight(df: pd.DataFrame) -> pd.DataFrame:
+# Plausible range for heights already given in centimeters (Players.csv)
+METRIC_HEIGHT_RANGE_CM = (120.0, 260.0)
+
+
+def _height_to_cm(height) -> Optional[float]:
+    """
+    Convert one height to centimeters.
+
+    Accepts feet-inches strings (e.g. '6-10') and metric heights in cm
+    (e.g. 180 or '180'); anything else yields None.
+    """
+    if height is None or (isinstance(height, float) and np.isnan(height)):
+        return None
+
+    text = str(height).strip()
+    if "-" in text:
+        feet, _, inches = text.partition("-")
+        if feet.isdigit() and inches.isdigit():
+            return round(int(feet) * 30.48 + int(inches) * 2.54, 1)
+        return None
+
+    try:
+        value = float(text)
+    except ValueError:
+        return None
+    low, high = METRIC_HEIGHT_RANGE_CM
+    return round(value, 1) if low <= value <= high else None
+
+
+def parse_heights(heights: pd.Series) -> pd.Series:
+    """
+    Convert heights to centimeters.
+
+    Heights are feet-inches strings such as "6-10" or metric values in cm
+    such as 180. Each distinct value is parsed once and the results are
+    broadcast back to the rows.
+
+    Args:
+        heights: Series of heights
+
+    Returns:
+        Float series of heights in cm (NaN where unparseable)
+    """
+    codes, uniques = pd.factorize(heights)
+    parsed = np.array([_height_to_cm(value) for value in uniques] + [None], dtype=float)
+    # Missing values have code -1, which picks the trailing NaN
+    return pd.Series(parsed[codes], index=heights.index, name=heights.name)
+
+
+# Format of the birth dates in player_data.csv, e.g. "June 24, 1968"
+BIRTH_DATE_FORMAT = "%B %d, %Y"
+
+
+def parse_birth_dates(
+    dates: pd.Series, date_format: Optional[str] = BIRTH_DATE_FORMAT
+) -> pd.Series:
+    """
+    Convert birth dates to datetimes.
+
+    Each distinct date string is parsed once with ``date_format`` and the
+    results are broadcast back to the rows, since the same birth date repeats
+    for every season of a player. Strings that do not match the format fall
+    back to pandas' per-value inference.
+
+    Args:
+        dates: Series of birth dates
+        date_format: strptime format of the dates (inferred if None)
+
+    Returns:
+        datetime64[ns] series (NaT where unparseable)
+    """
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+
+    codes, uniques = pd.factorize(dates)
+    uniques = pd.Series(uniques, dtype=object)
+    parsed = pd.to_datetime(uniques, format=date_format, errors="coerce")
+
+    unmatched = parsed.isna() & uniques.notna()
+    if unmatched.any():
+        parsed[unmatched] = pd.to_datetime(
+            uniques[unmatched].map(lambda value: pd.to_datetime(value, errors="coerce"))
+        )
+
+    # Missing values have code -1, which picks the trailing NaT
+    values = np.append(parsed.to_numpy(dtype="datetime64[ns]"), np.datetime64("NaT"))
+    return pd.Series(values[codes], index=dates.index, name=dates.name)
+
+
+def _reference_month_day(age_reference: str) -> int:
+    """Turn an "MM-DD" reference date into a comparable MMDD integer."""
+    try:
+        reference = datetime.strptime(f"2000-{age_reference}", "%Y-%m-%d")
+    except ValueError:
+        raise ValueError(
+            f"age_reference must be a 'MM-DD' date, got {age_reference!r}"
+        ) from None
+    return reference.month * 100 + reference.day
+
+
+def _birth_year_and_age(
+    birth_dates: pd.Series, years: pd.Series, age_reference: Optional[str] = None
+) -> Tuple[pd.Series, pd.Series]:
+    """
+    Compute birth years and season ages from parsed birth dates.
+
+    Without ``age_reference`` the age is the season year minus the birth
+    year. With an "MM-DD" reference the age is the player's age on that date
+    of the season year, i.e. one less for players whose birthday falls later.
+    """
+    birth_year = birth_dates.dt.year
+    age_calc = years - birth_year
+    if age_reference is not None:
+        birth_month_day = birth_dates.dt.month * 100 + birth_dates.dt.day
+        before_birthday = birth_month_day > _reference_month_day(age_reference)
+        age_calc = age_calc - before_birthday.astype(int)
+    return birth_year, age_calc
+
+
+def _realistic_ages(age_calc: pd.Series) -> pd.Series:
+    """Mask of rows whose age is missing or inside the NBA range (18-44)."""
+    return (age_calc.isna()) | ((age_calc >= 18) & (age_calc <= 44))
+
+
+def _median(values: pd.Series, fill_values: Optional[Dict[str, float]]) -> float:
+    """Return the precomputed fill value for a column, else its median."""
+    if fill_values is not None and values.name in fill_values:
+        return fill_values[values.name]
+    return values.median()
+
+
+def collect_imputation_counts(
+    df: pd.DataFrame, age_reference: Optional[str] = None
+) -> Dict[str, Dict[float, int]]:
+    """
+    Count the observed values that the median imputers are computed over.
+
+    Value counts are additive, so counts from separate partitions or seasons
+    can be merged with merge_imputation_counts and turned into the exact
+    medians of the combined data with imputation_medians.
+
+    Args:
+        df: Merged DataFrame (before process_height_weight/process_age_data)
+        age_reference: Season reference date for ages (see process_age_data)
+
+    Returns:
+        Mapping of imputed column to {value: count}
+    """
+    columns = {}
+    if "height" in df.columns:
+        columns["height_cm"] = parse_heights(df["height"])
+    if "weight" in df.columns:
+        columns["weight"] = df["weight"]
+    if "birth_date" in df.columns:
+        birth_year, age_calc = _birth_year_and_age(
+            parse_birth_dates(df["birth_date"]), df["Year"], age_reference
+        )
+        realistic = _realistic_ages(age_calc)
+        columns["birth_year"] = birth_year[realistic]
+        columns["age_calc"] = age_calc[realistic]
+
+    counts = {}
+    for name, values in columns.items():
+        value_counts = values.dropna().value_counts()
+        counts[name] = {
+            float(value): int(count) for value, count in value_counts.items()
+        }
+    return counts
+
+
+def merge_imputation_counts(
+    *counts: Dict[str, Dict[float, int]],
+) -> Dict[str, Dict[float, int]]:
+    """
+    Add up value counts collected with collect_imputation_counts.
+
+    Args:
+        *counts: Value counts of several partitions
+
+    Returns:
+        Combined value counts
+    """
+    merged: Dict[str, Dict[float, int]] = {}
+    for partition in counts:
+        for name, value_counts in partition.items():
+            target = merged.setdefault(name, {})
+            for value, count in value_counts.items():
+                target[value] = target.get(value, 0) + count
+    return merged
+
+
+def imputation_medians(counts: Dict[str, Dict[float, int]]) -> Dict[str, float]:
+    """
+    Compute exact medians from value counts.
+
+    Args:
+        counts: Value counts from collect_imputation_counts
+
+    Returns:
+        Mapping of imputed column to its median (NaN if no values were seen)
+    """
+    medians = {}
+    for name, value_counts in counts.items():
+        values = sorted(value_counts)
+        total = sum(value_counts.values())
+        if total == 0:
+            medians[name] = np.nan
+            continue
+
+        # Positions (0-based) of the middle element(s) in the sorted data
+        lower_pos, upper_pos = (total - 1) // 2, total // 2
+        lower = upper = None
+        seen = 0
+        for value in values:
+            seen += value_counts[value]
+            if lower is None and seen > lower_pos:
+                lower = value
+            if seen > upper_pos:
+                upper = value
+                break
+        medians[name] = (lower + upper) / 2
+    return medians
+
+
+def process_height_weight(
+    df: pd.DataFrame,
+    copy: bool = True,
+    fill_values: Optional[Dict[str, float]] = None,
+) -> pd.DataFrame:
     """
     Process height and weight data.
 
     Args:
         df: Input DataFrame
+        copy: Work on a copy of ``df``; if False, ``df`` is modified in place
+            where possible (always use the returned frame)
+        fill_values: Precomputed fill values for "height_cm" and "weight"
+            (see imputation_medians); medians of ``df`` are used otherwise
 
     Returns:
         DataFrame with processed height and weight
     """
-    df = df.copy()
-
-    def height_to_cm(height_str):
-        """Convert height string (e.g., '6-10') to centimeters."""
-        try:
-            feet, inches = map(int, height_str.split("-"))
-            return round(feet * 30.48 + inches * 2.54, 1)
-        except:
-            return None
+    if copy:
+        df = df.copy()
 
     # Convert height to cm
     if "height" in df.columns:
-        df["height_cm"] = df["height"].apply(height_to_cm)
-        df["height_cm"] = df["height_cm"].fillna(df["height_cm"].median())
+        df["height_cm"] = parse_heights(df["height"])
+        df["height_cm"] = df["height_cm"].fillna(_median(df["height_cm"], fill_values))
 
     # Fill weight with median
     if "weight" in df.columns:
-        df["weight"] = df["weight"].fillna(df["weight"].median())
+        df["weight"] = df["weight"].fillna(_median(df["weight"], fill_values))
 
     return df
 
 
-def process_age_data(df: pd.DataFrame) -> pd.DataFrame:
+def process_age_data(
+    df: pd.DataFrame,
+    copy: bool = True,
+    fill_values: Optional[Dict[str, float]] = None,
+    age_reference: Optional[str] = None,
+) -> pd.DataFrame:
     """
     Process birth date and age data.
 
     Args:
         df: Input DataFrame
+        copy: Work on a copy of ``df``; if False, ``df`` is modified in place
+            where possible (always use the returned frame)
+        fill_values: Precomputed fill values for "birth_year" and "age_calc"
+            (see imputation_medians); medians of ``df`` are used otherwise
+        age_reference: "MM-DD" date of the season year on which ages are
+            measured (e.g. "02-01" for All-Star voting); ages are plain
+            year differences if None
 
     Returns:
         DataFrame with processed age data
     """
-    df = df.copy()
+    if copy:
+        df = df.copy()
 
     if "birth_date" in df.columns:
         # Convert birth_date to datetime
-        df["birth_date"] = pd.to_datetime(df["birth_date"], errors="coerce")
+        df["birth_date"] = parse_birth_dates(df["birth_date"])
 
         # Extract birth year and calculate age
-        df["birth_year"] = df["birth_date"].dt.year
-        df["age_calc"] = df["Year"] - df["birth_year"]
+        df["birth_year"], df["age_calc"] = _birth_year_and_age(
+            df["birth_date"], df["Year"], age_reference
+        )
 
         # Remove unrealistic ages (NBA range: 18-44)
-        df = df[
-            (df["age_calc"].isna()) | ((df["age_calc"] >= 18) & (df["age_calc"] <= 44))
-        ]
+        realistic = _realistic_ages(df["age_calc"])
+        if not realistic.all():
+            df = df[realistic]
 
         # Fill missing values with median
-        df["birth_year"] = df["birth_year"].fillna(df["birth_year"].median())
-        df["age_calc"] = df["age_calc"].fillna(df["age_calc"].median())
+        df["birth_year"] = df["birth_year"].fillna(
+            _median(df["birth_year"], fill_values)
+        )
+        df["age_calc"] = df["age_calc"].fillna(_median(df["age_calc"], fill_values))
 
     # Fill career timeline data
     if "year_start" in df.columns:
@@ -257,8 +840,68 @@ def process_age_data(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _process_partition(
+    df: pd.DataFrame,
+    fill_values: Dict[str, float],
+    age_reference: Optional[str] = None,
+) -> pd.DataFrame:
+    """Run the row-local preprocessing stages on one partition."""
+    df = clean_missing_values(df)
+    df = process_height_weight(df, copy=False, fill_values=fill_values)
+    return process_age_data(
+        df, copy=False, fill_values=fill_values, age_reference=age_reference
+    )
+
+
+def _preprocess_parallel(
+    df: pd.DataFrame, n_jobs: int, age_reference: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Run cleaning and imputation over row partitions in a process pool.
+
+    A first pass collects the imputation value counts of every partition so
+    the medians equal those of the whole frame; the second pass runs the
+    row-local stages with those medians.
+    """
+    parts = split_rows(df, n_jobs)
+    stat_columns = [
+        col for col in ("height", "weight", "birth_date", "Year") if col in df.columns
+    ]
+
+    with ProcessPoolExecutor(max_workers=len(parts)) as executor:
+        counts = map_partitions(
+            collect_imputation_counts,
+            [part[stat_columns] for part in parts],
+            n_jobs,
+            executor,
+            age_reference=age_reference,
+        )
+        medians = imputation_medians(merge_imputation_counts(*counts))
+        parts = map_partitions(
+            _process_partition,
+            parts,
+            n_jobs,
+            executor,
+            fill_values=medians,
+            age_reference=age_reference,
+        )
+
+    return concat_partitions(parts)
+
+
 def preprocess_data(
-    player_data_path: str, seasons_stats_path: str, all_star_path: str
+    player_data_path: str,
+    seasons_stats_path: str,
+    all_star_path: str,
+    cache_dir: Optional[str] = None,
+    season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+    copy: bool = True,
+    stage_memory: Optional[Dict[str, int]] = None,
+    n_jobs: Optional[int] = None,
+    age_reference: Optional[str] = None,
+    profiler: Optional[StageProfiler] = None,
+    backend: str = "pandas",
+    name_crosswalk: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Complete data preprocessing pipeline.
@@ -267,25 +910,145 @@ def preprocess_data(
         player_data_path: Path to player demographic data CSV
         seasons_stats_path: Path to season statistics CSV
         all_star_path: Path to All-Star selections CSV
+        cache_dir: Directory for columnar copies of the CSVs (no caching if None)
+        season_window: Inclusive (first_year, last_year) of seasons to keep,
+            applied while loading (all seasons if None)
+        copy: Let every stage work on its own copy of the frame; if False the
+            stages modify the merged frame in place, keeping a single copy alive
+        stage_memory: Dictionary receiving the peak memory (bytes) of each
+            stage; memory is not traced if None
+        n_jobs: Number of worker processes for the cleaning and imputation
+            stages (-1 for one per CPU). With more than one worker the merged
+            frame is split into row partitions; global medians are computed
+            in a first pass so the result matches the serial path exactly.
+        age_reference: "MM-DD" season reference date for player ages (see
+            process_age_data); ages are plain year differences if None
+        profiler: StageProfiler receiving the time, memory and shape of every
+            stage, including loading (see src.profiling)
+        backend: "pandas", or "polars" to run the whole pipeline as one lazy
+            multi-threaded Polars plan (see src.polars_backend; cache_dir,
+            copy and n_jobs do not apply)
+        name_crosswalk: CSV crosswalk of resolved player-name variants,
+            updated with the names it does not contain yet and applied before
+            merging (see src.name_resolution); names are only normalised if
+            None
 
     Returns:
         Fully preprocessed DataFrame ready for modeling
+
+    Raises:
+        ValueError: If the backend is unknown, or a name crosswalk is used
+            with the polars backend
     """
+    check_backend(backend)
+    if backend == "polars" and name_crosswalk is not None:
+        raise ValueError("name_crosswalk is not supported by the polars backend")
+    if backend == "polars":
+        from src.polars_backend import preprocess_polars
+
+        return run_stage(
+            "polars_preprocessing",
+            preprocess_polars,
+            player_data_path,
+            stage_memory,
+            profiler,
+            seasons_stats_path=seasons_stats_path,
+            all_star_path=all_star_path,
+            season_window=season_window,
+            age_reference=age_reference,
+        )
+
     # Load data
-    player_data, seasons_stats, all_star = load_nba_data(
-        player_data_path, seasons_stats_path, all_star_path
+    player_data, seasons_stats, all_star = run_stage(
+        "load_nba_data",
+        load_nba_data,
+        player_data_path,
+        profiler=profiler,
+        seasons_stats_path=seasons_stats_path,
+        all_star_path=all_star_path,
+        cache_dir=cache_dir,
+        season_window=season_window,
     )
 
+    # Resolve player-name variants, reusing the stored crosswalk
+    name_map = None
+    if name_crosswalk is not None:
+        # Imported here: src.name_resolution builds on this module
+        from src.name_resolution import (
+            RESOLVED_SOURCES,
+            crosswalk_mapping,
+            update_crosswalk,
+        )
+
+        crosswalk = run_stage(
+            "update_crosswalk",
+            update_crosswalk,
+            name_crosswalk,
+            stage_memory,
+            profiler,
+            player_data=player_data,
+            seasons_stats=seasons_stats,
+            all_star=all_star,
+        )
+        name_map = {
+            source: crosswalk_mapping(crosswalk, source) for source in RESOLVED_SOURCES
+        }
+
     # Merge datasets
-    df = merge_datasets(player_data, seasons_stats, all_star)
+    df = run_stage(
+        "merge_datasets",
+        merge_datasets,
+        player_data,
+        stage_memory,
+        profiler,
+        seasons_stats=seasons_stats,
+        all_star=all_star,
+        season_window=season_window,
+        name_crosswalk=name_map,
+    )
+    del player_data, seasons_stats, all_star
+
+    n_workers = resolve_n_jobs(n_jobs)
+    if n_workers > 1:
+        return run_stage(
+            "parallel_preprocessing",
+            _preprocess_parallel,
+            df,
+            stage_memory,
+            profiler,
+            n_jobs=n_workers,
+            age_reference=age_reference,
+        )
 
     # Clean missing values
-    df = clean_missing_values(df)
+    df = run_stage(
+        "clean_missing_values",
+        clean_missing_values,
+        df,
+        stage_memory,
+        profiler,
+        copy=copy,
+    )
 
     # Process height and weight
-    df = process_height_weight(df)
+    df = run_stage(
+        "process_height_weight",
+        process_height_weight,
+        df,
+        stage_memory,
+        profiler,
+        copy=copy,
+    )
 
     # Process age data
-    df = process_age_data(df)
+    df = run_stage(
+        "process_age_data",
+        process_age_data,
+        df,
+        stage_memory,
+        profiler,
+        copy=copy,
+        age_reference=age_reference,
+    )
 
     return df
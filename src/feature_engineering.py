@@ -5,80 +5,160 @@ This module contains functions for creating new features and selecting optimal
 feature sets for NBA All-Star prediction.
 """
 
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from src.correlation import CorrelationAccumulator, iter_row_chunks
+from src.data_processing import check_backend
+from src.parallel import concat_partitions, map_partitions, resolve_n_jobs, split_rows
+from src.profiling import StageProfiler, run_stage
+
+# Derived ratio features: name -> (numerator column, denominator column)
+PER_MINUTE_FEATURES: Dict[str, Tuple[str, str]] = {
+    "pts_per_minute": ("PTS", "MP"),
+    "fga_per_minute": ("FGA", "MP"),
+    "fta_per_minute": ("FTA", "MP"),
+    "3pa_per_minute": ("3PA", "MP"),
+}
+
+EFFICIENCY_RATIO_FEATURES: Dict[str, Tuple[str, str]] = {
+    "ast_to_turnover_ratio": ("AST", "TOV"),
+}
+
+ROLE_RATIO_FEATURES: Dict[str, Tuple[str, str]] = {
+    "offensive_ws_ratio": ("OWS", "WS"),
+    "defensive_ws_ratio": ("DWS", "WS"),
+}
+
+# Definition versions of the engineered features. Bump a feature's version
+# whenever its definition changes so materialised copies (see
+# src.feature_store) are recomputed.
+FEATURE_VERSIONS: Dict[str, int] = {
+    **{name: 1 for name in PER_MINUTE_FEATURES},
+    **{name: 1 for name in EFFICIENCY_RATIO_FEATURES},
+    **{name: 1 for name in ROLE_RATIO_FEATURES},
+    "years_played": 1,
+}
+
+
+def _as_float_array(values: pd.Series) -> np.ndarray:
+    """Return a float ndarray view of a column, keeping float32 storage."""
+    if values.dtype in (np.float32, np.float64):
+        return values.to_numpy()
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values, errors="coerce")
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def safe_divide(
+    numerator: pd.Series, denominator: pd.Series, fill_value: float = 0.0
+) -> np.ndarray:
+    """
+    Divide two columns element-wise, guarding against zero denominators.
+
+    Rows with a zero denominator get ``fill_value``; rows with a missing
+    numerator or denominator stay missing.
+
+    Args:
+        numerator: Numerator values
+        denominator: Denominator values
+        fill_value: Result for rows whose denominator is zero
+
+    Returns:
+        Array of ratios
+    """
+    num = _as_float_array(numerator)
+    den = _as_float_array(denominator)
+    dtype = np.result_type(num.dtype, den.dtype)
+
+    result = np.full(num.shape, fill_value, dtype=dtype)
+    np.divide(num, den, out=result, where=den != 0)
+    return result
+
+
+def add_ratio_features(
+    df: pd.DataFrame, specs: Dict[str, Tuple[str, str]], fill_value: float = 0.0
+) -> pd.DataFrame:
+    """
+    Add guarded ratio columns to a DataFrame in place.
+
+    Features whose input columns are missing are skipped.
+
+    Args:
+        df: Input DataFrame (modified in place)
+        specs: Mapping of feature name to (numerator, denominator) columns
+        fill_value: Result for rows whose denominator is zero
+
+    Returns:
+        The same DataFrame with the ratio columns added
+    """
+    for name, (numerator, denominator) in specs.items():
+        if numerator in df.columns and denominator in df.columns:
+            df[name] = safe_divide(df[numerator], df[denominator], fill_value)
+    return df
 
-def create_efficiency_features(df: pd.DataFrame) -> pd.DataFrame:
+
+def create_efficiency_features(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Create efficiency and per-minute statistics.
 
+    Players without minutes (or turnovers, for the assist-to-turnover ratio)
+    get 0 instead of an infinite ratio.
+
     Args:
         df: Input DataFrame
+        copy: Work on a copy of ``df``; if False, ``df`` is modified in place
 
     Returns:
         DataFrame with additional efficiency features
     """
-    df = df.copy()
+    if copy:
+        df = df.copy()
 
     # Per-minute statistics
-    if "PTS" in df.columns and "MP" in df.columns:
-        df["pts_per_minute"] = df["PTS"] / df["MP"]
-    if "FGA" in df.columns and "MP" in df.columns:
-        df["fga_per_minute"] = df["FGA"] / df["MP"]
-    if "FTA" in df.columns and "MP" in df.columns:
-        df["fta_per_minute"] = df["FTA"] / df["MP"]
-    if "3PA" in df.columns and "MP" in df.columns:
-        df["3pa_per_minute"] = df["3PA"] / df["MP"]
+    add_ratio_features(df, PER_MINUTE_FEATURES)
 
     # Assist-to-turnover ratio
-    if "AST" in df.columns and "TOV" in df.columns:
-        df["ast_to_turnover_ratio"] = df.apply(
-            lambda row: row["AST"] / row["TOV"] if row["TOV"] != 0 else 0, axis=1
-        )
+    add_ratio_features(df, EFFICIENCY_RATIO_FEATURES)
 
     return df
 
 
-def create_role_features(df: pd.DataFrame) -> pd.DataFrame:
+def create_role_features(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Create features that indicate player role and contribution type.
 
     Args:
         df: Input DataFrame
+        copy: Work on a copy of ``df``; if False, ``df`` is modified in place
 
     Returns:
         DataFrame with role-based features
     """
-    df = df.copy()
+    if copy:
+        df = df.copy()
 
     # Win share ratios
-    if "OWS" in df.columns and "WS" in df.columns:
-        df["offensive_ws_ratio"] = df.apply(
-            lambda row: row["OWS"] / row["WS"] if row["WS"] != 0 else 0, axis=1
-        )
-
-    if "DWS" in df.columns and "WS" in df.columns:
-        df["defensive_ws_ratio"] = df.apply(
-            lambda row: row["DWS"] / row["WS"] if row["WS"] != 0 else 0, axis=1
-        )
+    add_ratio_features(df, ROLE_RATIO_FEATURES)
 
     return df
 
 
-def create_career_features(df: pd.DataFrame) -> pd.DataFrame:
+def create_career_features(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Create career-related features.
 
     Args:
         df: Input DataFrame
+        copy: Work on a copy of ``df``; if False, ``df`` is modified in place
 
     Returns:
         DataFrame with career features
     """
-    df = df.copy()
+    if copy:
+        df = df.copy()
 
     # Career length
     if "year_end" in df.columns and "year_start" in df.columns:
@@ -121,13 +201,44 @@ def select_modeling_features() -> List[str]:
     ]
 
 
-def get_correlation_matrix(df: pd.DataFrame, features: List[str]) -> pd.DataFrame:
+# Rows per chunk when correlations are accumulated in one pass
+CORRELATION_CHUNK_ROWS = 100_000
+
+
+def _accumulate_correlation(
+    df: pd.DataFrame, columns: List[str], nan_policy: str, chunk_size: int
+) -> CorrelationAccumulator:
+    """Accumulate correlation statistics of one frame or partition."""
+    accumulator = CorrelationAccumulator(columns, nan_policy)
+    for chunk in iter_row_chunks(df, columns, chunk_size):
+        accumulator.update(chunk)
+    return accumulator
+
+
+def get_correlation_matrix(
+    df: pd.DataFrame,
+    features: List[str],
+    nan_policy: str = "listwise",
+    chunk_size: int = CORRELATION_CHUNK_ROWS,
+    n_jobs: Optional[int] = None,
+) -> pd.DataFrame:
     """
     Calculate correlation matrix for selected features.
 
+    The matrix is accumulated in one pass over row chunks (see
+    src.correlation). Serially, the selected columns are never copied as a
+    whole; with several workers, each worker receives a copy of the selected
+    columns of its row partition.
+
     Args:
         df: Input DataFrame
         features: List of feature names
+        nan_policy: "listwise" ignores rows with any missing value (as
+            ``dropna().corr()``); "pairwise" uses, for each pair, the rows
+            where both values are present (as ``corr()``)
+        chunk_size: Rows per chunk
+        n_jobs: Number of worker processes (-1 for one per CPU); partial
+            results of row partitions are merged exactly
 
     Returns:
         Correlation matrix DataFrame
@@ -135,26 +246,100 @@ def get_correlation_matrix(df: pd.DataFrame, features: List[str]) -> pd.DataFram
     # Add target variable to features for correlation analysis
     analysis_features = features + ["is_all_star"]
 
-    # Filter and compute correlation
-    corr_df = df[analysis_features].dropna()
-    corr_matrix = corr_df.corr()
+    n_workers = resolve_n_jobs(n_jobs)
+    if n_workers > 1:
+        partials = map_partitions(
+            _accumulate_correlation,
+            split_rows(df[analysis_features], n_workers),
+            n_workers,
+            columns=analysis_features,
+            nan_policy=nan_policy,
+            chunk_size=chunk_size,
+        )
+        accumulator = partials[0]
+        for partial in partials[1:]:
+            accumulator.merge(partial)
+    else:
+        accumulator = _accumulate_correlation(
+            df, analysis_features, nan_policy, chunk_size
+        )
+
+    return accumulator.correlation()
+
+
+def _engineer_partition(df: pd.DataFrame) -> pd.DataFrame:
+    """Engineer features for one row partition in a worker process."""
+    return engineer_all_features(df)
+
 
-    return corr_matrix
+def _engineer_parallel(df: pd.DataFrame, n_jobs: int) -> pd.DataFrame:
+    """Engineer features over row partitions in a process pool."""
+    parts = split_rows(df, n_jobs)
+    return concat_partitions(map_partitions(_engineer_partition, parts, n_jobs))
 
 
-def engineer_all_features(df: pd.DataFrame) -> pd.DataFrame:
+def engineer_all_features(
+    df: pd.DataFrame,
+    copy: bool = True,
+    stage_memory: Optional[Dict[str, int]] = None,
+    n_jobs: Optional[int] = None,
+    profiler: Optional[StageProfiler] = None,
+    backend: str = "pandas",
+) -> pd.DataFrame:
     """
     Apply all feature engineering steps.
 
     Args:
         df: Input DataFrame
+        copy: Copy ``df`` before each step; if False the features are added to
+            ``df`` in place and no intermediate copies are made
+        stage_memory: Dictionary receiving the peak memory (bytes) of each
+            step; memory is not traced if None
+        n_jobs: Number of worker processes (-1 for one per CPU). All features
+            are row-local, so row partitions are engineered independently and
+            concatenated in their original order.
+        profiler: StageProfiler receiving the time, memory and shape of every
+            step (see src.profiling)
+        backend: "pandas", or "polars" to compute every feature in one
+            multi-threaded Polars pass (see src.polars_backend; n_jobs does
+            not apply)
 
     Returns:
         DataFrame with all engineered features
+
+    Raises:
+        ValueError: If the backend is unknown
     """
-    df = create_efficiency_features(df)
-    df = create_role_features(df)
-    df = create_career_features(df)
+    check_backend(backend)
+    if backend == "polars":
+        from src.polars_backend import engineer_polars
+
+        return run_stage(
+            "polars_feature_engineering",
+            engineer_polars,
+            df,
+            stage_memory,
+            profiler,
+            copy=copy,
+        )
+
+    n_workers = resolve_n_jobs(n_jobs)
+    if n_workers > 1:
+        return run_stage(
+            "parallel_feature_engineering",
+            _engineer_parallel,
+            df,
+            stage_memory,
+            profiler,
+            n_jobs=n_workers,
+        )
+
+    for name, stage in [
+        ("create_efficiency_features", create_efficiency_features),
+        ("create_role_features", create_role_features),
+        ("create_career_features", create_career_features),
+    ]:
+        df = run_stage(name, stage, df, stage_memory, profiler, copy=copy)
 
     return df
 
@@ -0,0 +1,342 @@
+"""
+Feature Store Module
+
+This module keeps a local, materialised copy of engineered features keyed by
+player-season, so scoring jobs and notebooks can share one copy instead of
+each re-running the pipeline.
+
+Every feature column is stored in its own file together with the version of
+its definition (see ``FEATURE_VERSIONS`` in src.feature_engineering) and the
+content digests of the raw sources it was computed from. Requesting features
+only computes those that are missing or stale, using the column-pruned
+pipeline of src.planner.
+
+Rows are ordered by (Year, PlayerName), so season-range scans are contiguous
+slices and point lookups are binary searches.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+from src.data_cache import read_frame, source_digest, write_frame
+from src.data_processing import DEFAULT_SEASON_WINDOW
+from src.feature_engineering import FEATURE_VERSIONS, select_modeling_features
+from src.planner import KEY_COLUMNS, run_planned_pipeline
+
+STORE_MANIFEST = "feature_store.json"
+KEYS_NAME = "keys"
+FEATURES_DIR = "features"
+
+# Version of every stored column that is not an engineered feature (raw,
+# cleaned and imputed columns). Bump when preprocessing changes.
+PREPROCESSING_VERSION = 1
+
+
+def feature_version(name: str) -> int:
+    """
+    Return the definition version of a stored column.
+
+    Args:
+        name: Feature name
+
+    Returns:
+        Version number
+    """
+    return FEATURE_VERSIONS.get(name, PREPROCESSING_VERSION)
+
+
+def _feature_file(name: str) -> str:
+    """File stem of a feature column (feature names contain '%' and '/')."""
+    return quote(name, safe="").replace(".", "%2E")
+
+
+def _sort_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Order rows by season, then player, keeping ties in pipeline order."""
+    return df.sort_values(["Year", "PlayerName"], kind="stable").reset_index(drop=True)
+
+
+class FeatureStore:
+    """
+    Materialised engineered features keyed by (PlayerName, Year).
+
+    A player can have several rows in one season (one per team after a
+    trade), so lookups return all rows of a player-season.
+
+    Attributes:
+        store_dir: Directory holding the store
+        paths: Raw (player_data, seasons_stats, all_star) CSV paths
+        season_window: Inclusive (first_year, last_year) of stored seasons
+        cache_dir: Directory for columnar copies of the CSVs (no caching if None)
+    """
+
+    def __init__(
+        self,
+        store_dir: Union[str, Path],
+        player_data_path: str,
+        seasons_stats_path: str,
+        all_star_path: str,
+        season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        self.store_dir = Path(store_dir)
+        self.paths = (player_data_path, seasons_stats_path, all_star_path)
+        self.season_window = season_window
+        self.cache_dir = cache_dir
+        self._keys: Optional[pd.DataFrame] = None
+        self._years: Optional[np.ndarray] = None
+        self._names: Optional[np.ndarray] = None
+        self._columns: Dict[str, pd.Series] = {}
+        self._fresh: set = set()
+
+    def _manifest_path(self) -> Path:
+        """Path of the store manifest."""
+        return self.store_dir / STORE_MANIFEST
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        """Read the store manifest (empty for a new store)."""
+        path = self._manifest_path()
+        if not path.exists():
+            return {"sources": {}, "features": {}}
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """Atomically write the store manifest."""
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        path = self._manifest_path()
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def _rows_signature(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """Digests of the raw sources and the season window of the rows."""
+        digests = [
+            source_digest(Path(path), manifest["sources"])[0] for path in self.paths
+        ]
+        window = None if self.season_window is None else list(self.season_window)
+        return {"source_digests": digests, "season_window": window}
+
+    def _requested(self, features: Optional[List[str]]) -> List[str]:
+        """Deduplicated feature names, without the always-stored key columns."""
+        if features is None:
+            features = select_modeling_features()
+        return [name for name in dict.fromkeys(features) if name not in KEY_COLUMNS]
+
+    def _stale(
+        self, manifest: Dict[str, Any], rows_changed: bool, features: List[str]
+    ) -> List[str]:
+        """Features whose stored copy is missing or has another version."""
+        if rows_changed:
+            return list(features)
+        stored = manifest["features"]
+        return [
+            name
+            for name in features
+            if stored.get(name, {}).get("version") != feature_version(name)
+        ]
+
+    def stale_features(self, features: Optional[List[str]] = None) -> List[str]:
+        """
+        List requested features that are missing or out of date.
+
+        A feature is stale when it has not been materialised, its definition
+        version changed, or the raw sources or season window changed.
+
+        Args:
+            features: Feature names (select_modeling_features() if None)
+
+        Returns:
+            Stale feature names, in request order
+        """
+        manifest = self._read_manifest()
+        rows_changed = manifest.get("rows") != self._rows_signature(manifest)
+        return self._stale(manifest, rows_changed, self._requested(features))
+
+    def _compute(self, features: List[str]) -> pd.DataFrame:
+        """Run the column-pruned pipeline for some features."""
+        return _sort_rows(
+            run_planned_pipeline(
+                *self.paths,
+                features=features,
+                cache_dir=self.cache_dir,
+                season_window=self.season_window,
+            )
+        )
+
+    def materialize(self, features: Optional[List[str]] = None) -> List[str]:
+        """
+        Compute and store the requested features that are missing or stale.
+
+        If the raw sources or the season window changed, the stored rows and
+        every stored feature are discarded first.
+
+        Args:
+            features: Feature names (select_modeling_features() if None)
+
+        Returns:
+            Names of the features that were computed
+        """
+        features = self._requested(features)
+        manifest = self._read_manifest()
+        signature = self._rows_signature(manifest)
+        keys = read_frame(self.store_dir / KEYS_NAME)
+        rebuild = manifest.get("rows") != signature or keys is None
+
+        stale = self._stale(manifest, rebuild, features)
+        if not stale:
+            self._fresh.update(features)
+            return []
+
+        computed = self._compute(stale)
+        if not rebuild and not keys.equals(computed[KEY_COLUMNS]):
+            # The rows changed although the sources did not (e.g. a
+            # preprocessing change): recompute everything requested
+            rebuild = True
+            if stale != features:
+                stale = features
+                computed = self._compute(stale)
+
+        if rebuild:
+            self._clear(manifest)
+            write_frame(computed[KEY_COLUMNS], self.store_dir / KEYS_NAME)
+
+        features_dir = self.store_dir / FEATURES_DIR
+        for name in stale:
+            stem = _feature_file(name)
+            write_frame(computed[[name]], features_dir / stem)
+            manifest["features"][name] = {
+                "version": feature_version(name),
+                "file": stem,
+            }
+            self._columns.pop(name, None)
+
+        manifest["rows"] = signature
+        self._write_manifest(manifest)
+        self._keys = self._years = self._names = None
+        self._fresh.update(features)
+        return stale
+
+    def _clear(self, manifest: Dict[str, Any]) -> None:
+        """Delete every stored feature column."""
+        features_dir = self.store_dir / FEATURES_DIR
+        if features_dir.exists():
+            for path in features_dir.iterdir():
+                path.unlink()
+        manifest["features"] = {}
+        self._columns.clear()
+        self._fresh.clear()
+
+    def _ensure(self, features: Optional[List[str]]) -> List[str]:
+        """Materialise features not yet checked by this store object."""
+        features = self._requested(features)
+        if not set(features) <= self._fresh:
+            self.materialize(features)
+        return features
+
+    def keys(self) -> pd.DataFrame:
+        """
+        Return the key columns of the stored rows.
+
+        Returns:
+            DataFrame with PlayerName, player_id, Year and is_all_star
+        """
+        if self._keys is None:
+            keys = read_frame(self.store_dir / KEYS_NAME)
+            if keys is None:
+                raise FileNotFoundError(f"No features materialised in {self.store_dir}")
+            self._keys = keys
+        return self._keys
+
+    def _column(self, name: str) -> pd.Series:
+        """Stored values of one feature (kept in memory after the first read)."""
+        if name not in self._columns:
+            stem = self._read_manifest()["features"][name]["file"]
+            frame = read_frame(self.store_dir / FEATURES_DIR / stem)
+            self._columns[name] = frame[name]
+        return self._columns[name]
+
+    def _rows(self, rows: slice, features: List[str]) -> pd.DataFrame:
+        """Assemble keys and features of a contiguous row range."""
+        keys = self.keys()
+        data = {col: keys[col].array[rows] for col in KEY_COLUMNS}
+        for name in features:
+            data[name] = self._column(name).array[rows]
+        start, stop, _ = rows.indices(len(keys))
+        return pd.DataFrame(data, index=pd.RangeIndex(start, stop))
+
+    def _season_bounds(self, first_year: int, last_year: int) -> Tuple[int, int]:
+        """Row range of a season range (rows are ordered by Year)."""
+        years = self._years
+        if years is None:
+            years = self._years = self.keys()["Year"].to_numpy()
+        start = int(np.searchsorted(years, first_year, side="left"))
+        stop = int(np.searchsorted(years, last_year, side="right"))
+        return start, stop
+
+    def load(self, features: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Return all stored rows with the requested features.
+
+        Args:
+            features: Feature names (select_modeling_features() if None)
+
+        Returns:
+            DataFrame with the key columns followed by the features
+        """
+        features = self._ensure(features)
+        return self._rows(slice(0, len(self.keys())), features)
+
+    def scan(
+        self,
+        first_year: int,
+        last_year: int,
+        features: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Return the rows of a range of seasons.
+
+        Args:
+            first_year: First season (inclusive)
+            last_year: Last season (inclusive)
+            features: Feature names (select_modeling_features() if None)
+
+        Returns:
+            DataFrame with the key columns followed by the features
+        """
+        features = self._ensure(features)
+        start, stop = self._season_bounds(first_year, last_year)
+        return self._rows(slice(start, stop), features)
+
+    def get(
+        self, player: str, year: int, features: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Look up the rows of one player-season.
+
+        Args:
+            player: Player name (whitespace is normalised as in the pipeline)
+            year: Season
+            features: Feature names (select_modeling_features() if None)
+
+        Returns:
+            DataFrame with the matching rows (empty if the player-season is
+            not stored)
+        """
+        features = self._ensure(features)
+        start, stop = self._season_bounds(year, year)
+
+        # Same normalisation as normalize_player_names
+        name = " ".join(player.split())
+        names = self._names
+        if names is None:
+            names = self._names = self.keys()["PlayerName"].to_numpy(dtype=object)
+        first = start + int(np.searchsorted(names[start:stop], name, side="left"))
+        last = start + int(np.searchsorted(names[start:stop], name, side="right"))
+        return self._rows(slice(first, last), features)
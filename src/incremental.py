@@ -0,0 +1,247 @@
+"""
+Incremental Processing Module
+
+This module maintains a persisted, fully processed dataset that can be
+extended one season at a time. Instead of re-running ``preprocess_data`` over
+every year, new season statistics and All-Star selections are merged, cleaned
+and feature-engineered on their own and appended to the store.
+
+The median imputers are kept exact by storing, per season, the value counts
+they are computed over. Appending a season updates those running statistics
+and imputes the new rows with the medians of all stored seasons. Rows that
+were already stored keep the fill values they were imputed with.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.data_cache import read_frame, write_frame
+from src.data_processing import (
+    DEFAULT_SEASON_WINDOW,
+    clean_missing_values,
+    collect_imputation_counts,
+    imputation_medians,
+    load_nba_data,
+    merge_datasets,
+    merge_imputation_counts,
+    process_age_data,
+    process_height_weight,
+)
+from src.feature_engineering import engineer_all_features
+
+DATASET_NAME = "processed_dataset"
+STATS_NAME = "imputation_counts.json"
+
+SeasonCounts = Dict[int, Dict[str, Dict[float, int]]]
+
+
+def _season_counts(df: pd.DataFrame) -> SeasonCounts:
+    """Collect imputation value counts separately for each season."""
+    return {
+        int(year): collect_imputation_counts(part)
+        for year, part in df.groupby("Year", sort=True)
+    }
+
+
+def load_season_counts(store_dir: Union[str, Path]) -> SeasonCounts:
+    """
+    Load the per-season imputation value counts of a store.
+
+    Args:
+        store_dir: Directory of the processed dataset store
+
+    Returns:
+        Mapping of season to value counts (empty if the store is new)
+    """
+    stats_path = Path(store_dir) / STATS_NAME
+    if not stats_path.exists():
+        return {}
+    with open(stats_path, "r", encoding="utf-8") as handle:
+        raw = json.load(handle)
+    return {
+        int(year): {
+            name: {float(value): count for value, count in value_counts.items()}
+            for name, value_counts in columns.items()
+        }
+        for year, columns in raw.items()
+    }
+
+
+def _save_season_counts(store_dir: Path, counts: SeasonCounts) -> None:
+    """Write the per-season imputation value counts of a store."""
+    raw = {
+        str(year): {
+            name: {repr(value): count for value, count in value_counts.items()}
+            for name, value_counts in columns.items()
+        }
+        for year, columns in sorted(counts.items())
+    }
+    stats_path = store_dir / STATS_NAME
+    tmp_path = stats_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(raw, handle)
+    tmp_path.replace(stats_path)
+
+
+def load_processed_dataset(store_dir: Union[str, Path]) -> Optional[pd.DataFrame]:
+    """
+    Load the processed dataset of a store.
+
+    Args:
+        store_dir: Directory of the processed dataset store
+
+    Returns:
+        Processed DataFrame, or None if the store is empty
+    """
+    return read_frame(Path(store_dir) / DATASET_NAME)
+
+
+def current_medians(store_dir: Union[str, Path]) -> Dict[str, float]:
+    """
+    Compute the imputation medians over every season in a store.
+
+    Args:
+        store_dir: Directory of the processed dataset store
+
+    Returns:
+        Mapping of imputed column to its median
+    """
+    counts = load_season_counts(store_dir)
+    return imputation_medians(merge_imputation_counts(*counts.values()))
+
+
+def _concat_preserving_categories(
+    existing: pd.DataFrame, new: pd.DataFrame
+) -> pd.DataFrame:
+    """Concatenate two frames, keeping categorical columns categorical."""
+    combined = pd.concat([existing, new], ignore_index=True)
+    for col in existing.columns:
+        if isinstance(existing[col].dtype, pd.CategoricalDtype) and not isinstance(
+            combined[col].dtype, pd.CategoricalDtype
+        ):
+            combined[col] = combined[col].astype("category")
+    return combined
+
+
+def _align_player_ids(existing: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """
+    Re-key new rows with the player IDs already used in the store.
+
+    Player IDs are assigned per merge, so a season merged on its own would
+    otherwise number its players independently of the stored seasons.
+    Players not seen before get IDs after the largest stored one.
+    """
+    known = existing.drop_duplicates("PlayerName").set_index("PlayerName")["player_id"]
+    ids = new["PlayerName"].map(known)
+
+    unseen = pd.unique(new.loc[ids.isna(), "PlayerName"])
+    next_id = int(existing["player_id"].max()) + 1 if len(existing) else 0
+    fresh = dict(zip(unseen, range(next_id, next_id + len(unseen))))
+
+    new["player_id"] = ids.fillna(new["PlayerName"].map(fresh)).astype(np.int32)
+    return new
+
+
+def _process_new_rows(merged: pd.DataFrame, counts: SeasonCounts) -> pd.DataFrame:
+    """Impute and feature-engineer freshly merged rows with stored statistics."""
+    merged = clean_missing_values(merged, copy=False)
+    medians = imputation_medians(merge_imputation_counts(*counts.values()))
+    merged = process_height_weight(merged, copy=False, fill_values=medians)
+    merged = process_age_data(merged, copy=False, fill_values=medians)
+    return engineer_all_features(merged, copy=False)
+
+
+def build_processed_store(
+    store_dir: Union[str, Path],
+    player_data_path: str,
+    seasons_stats_path: str,
+    all_star_path: str,
+    season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+    cache_dir: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Build a processed dataset store from the raw sources.
+
+    The stored frame equals ``engineer_all_features(preprocess_data(...))``
+    for the same season window.
+
+    Args:
+        store_dir: Directory of the processed dataset store
+        player_data_path: Path to player demographic data CSV
+        seasons_stats_path: Path to season statistics CSV
+        all_star_path: Path to All-Star selections CSV
+        season_window: Inclusive (first_year, last_year) of seasons to keep
+        cache_dir: Directory for columnar copies of the CSVs (no caching if None)
+
+    Returns:
+        The processed DataFrame written to the store
+    """
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+
+    player_data, seasons_stats, all_star = load_nba_data(
+        player_data_path,
+        seasons_stats_path,
+        all_star_path,
+        cache_dir=cache_dir,
+        season_window=season_window,
+    )
+    merged = merge_datasets(player_data, seasons_stats, all_star, season_window)
+
+    counts = _season_counts(merged)
+    processed = _process_new_rows(merged, counts)
+
+    write_frame(processed, store_dir / DATASET_NAME)
+    _save_season_counts(store_dir, counts)
+    return processed
+
+
+def append_season(
+    store_dir: Union[str, Path],
+    player_data: pd.DataFrame,
+    seasons_stats: pd.DataFrame,
+    all_star: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Append new seasons to a processed dataset store.
+
+    Only the new rows are merged, cleaned, imputed and feature-engineered.
+    Seasons already present in the store are replaced, so re-running a nightly
+    update for the same season is safe.
+
+    Args:
+        store_dir: Directory of the processed dataset store
+        player_data: Player demographic data
+        seasons_stats: Season statistics of the new season(s)
+        all_star: All-Star selections of the new season(s)
+
+    Returns:
+        The updated processed DataFrame
+    """
+    store_dir = Path(store_dir)
+    store_dir.mkdir(parents=True, exist_ok=True)
+
+    merged = merge_datasets(player_data, seasons_stats, all_star, season_window=None)
+    new_years = set(int(year) for year in merged["Year"].unique())
+
+    counts = load_season_counts(store_dir)
+    counts = {year: c for year, c in counts.items() if year not in new_years}
+    counts.update(_season_counts(merged))
+
+    existing = load_processed_dataset(store_dir)
+    if existing is not None:
+        merged = _align_player_ids(existing, merged)
+
+    processed = _process_new_rows(merged, counts)
+
+    if existing is not None:
+        existing = existing[~existing["Year"].isin(new_years)]
+        processed = _concat_preserving_categories(existing, processed)
+
+    write_frame(processed, store_dir / DATASET_NAME)
+    _save_season_counts(store_dir, counts)
+    return processed
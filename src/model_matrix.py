@@ -0,0 +1,277 @@
+"""
+Model Matrix Module
+
+This module builds the training matrix once as a contiguous float32 array,
+optionally memory-mapped to a ``.npy`` file, with the target and the season
+of every row alongside.
+
+Rows are ordered by season, so a season range is a slice of the matrix
+(a view, not a copy), and train/validation splits are index arrays.
+Standardisation is applied in place, so no scaled copy of the matrix is made.
+"""
+
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from src.feature_engineering import select_modeling_features
+
+MATRIX_DTYPE = np.float32
+
+# Rows converted to float64 or transformed at a time
+CHUNK_ROWS = 65_536
+
+
+class ModelMatrix(NamedTuple):
+    """
+    Feature matrix with its target and seasons.
+
+    Attributes:
+        X: C-contiguous feature matrix, rows ordered by season
+        y: All-Star labels (int8)
+        years: Season of every row (ascending)
+        features: Column names of X
+        index: Index label of every row in the source DataFrame
+    """
+
+    X: np.ndarray
+    y: np.ndarray
+    years: np.ndarray
+    features: List[str]
+    index: np.ndarray
+
+
+def as_float_matrix(X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+    """
+    Return a C-contiguous floating-point matrix, copying only if needed.
+
+    Float32 and float64 arrays are kept as they are; anything else is
+    converted to float64.
+
+    Args:
+        X: Feature matrix
+
+    Returns:
+        C-contiguous floating-point array
+    """
+    if isinstance(X, np.ndarray) and np.issubdtype(X.dtype, np.floating):
+        return np.ascontiguousarray(X)
+    return np.ascontiguousarray(X, dtype=np.float64)
+
+
+def build_model_matrix(
+    df: pd.DataFrame,
+    features: Optional[List[str]] = None,
+    path: Optional[Union[str, Path]] = None,
+    dtype: type = MATRIX_DTYPE,
+) -> ModelMatrix:
+    """
+    Write the modeling features of a DataFrame into one contiguous array.
+
+    Columns are written one at a time into a preallocated array, so the only
+    temporary is a single column. Missing values become NaN.
+
+    Args:
+        df: Engineered DataFrame with Year and is_all_star columns
+        features: Feature names (select_modeling_features() if None)
+        path: ``.npy`` file backing the matrix (in memory if None); the file
+            can later be opened with load_model_matrix
+        dtype: Floating-point type of the matrix
+
+    Returns:
+        ModelMatrix with rows ordered by season
+
+    Raises:
+        KeyError: If a feature is not a column of ``df``
+    """
+    if features is None:
+        features = select_modeling_features()
+    missing = [name for name in features if name not in df.columns]
+    if missing:
+        raise KeyError(f"Missing features: {missing}")
+
+    years = df["Year"].to_numpy(dtype=np.int64)
+    order = np.argsort(years, kind="stable")
+    shape = (len(df), len(features))
+    if path is None:
+        X = np.empty(shape, dtype=dtype)
+    else:
+        X = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+    for position, name in enumerate(features):
+        values = df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        X[:, position] = values[order]
+    if path is not None:
+        X.flush()
+
+    return ModelMatrix(
+        X=X,
+        y=df["is_all_star"].to_numpy(dtype=np.int8)[order],
+        years=years[order],
+        features=list(features),
+        index=df.index.to_numpy()[order],
+    )
+
+
+def load_model_matrix(
+    path: Union[str, Path], matrix: ModelMatrix, mode: str = "r+"
+) -> ModelMatrix:
+    """
+    Reopen the memory-mapped feature matrix of a model matrix.
+
+    Args:
+        path: ``.npy`` file written by build_model_matrix
+        matrix: Model matrix providing the target, seasons and features
+        mode: Memory-map mode ("r" for read-only, "r+" to scale in place)
+
+    Returns:
+        ModelMatrix backed by the file
+    """
+    return matrix._replace(X=np.load(path, mmap_mode=mode))
+
+
+def season_rows(
+    matrix: ModelMatrix, first_year: Optional[int], last_year: Optional[int]
+) -> slice:
+    """
+    Row range of a range of seasons.
+
+    ``matrix.X[season_rows(...)]`` is a view of the matrix.
+
+    Args:
+        matrix: Model matrix
+        first_year: First season (inclusive, no limit if None)
+        last_year: Last season (inclusive, no limit if None)
+
+    Returns:
+        Slice of the rows of those seasons
+    """
+    start = 0
+    stop = len(matrix.years)
+    if first_year is not None:
+        start = int(np.searchsorted(matrix.years, first_year, side="left"))
+    if last_year is not None:
+        stop = int(np.searchsorted(matrix.years, last_year, side="right"))
+    return slice(start, max(start, stop))
+
+
+def train_validation_split(
+    matrix: ModelMatrix,
+    rows: slice = slice(None),
+    validation_size: float = 0.2,
+    random_state: int = 42,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split rows into stratified training and validation positions.
+
+    Args:
+        matrix: Model matrix
+        rows: Rows to split (e.g. from season_rows)
+        validation_size: Fraction of rows held out for validation
+        random_state: Seed of the split
+
+    Returns:
+        Tuple of (training, validation) row positions, each sorted
+    """
+    positions = np.arange(len(matrix.y))[rows]
+    train, validation = train_test_split(
+        positions,
+        test_size=validation_size,
+        random_state=random_state,
+        stratify=matrix.y[rows],
+    )
+    return np.sort(train), np.sort(validation)
+
+
+def _row_chunks(
+    rows: Union[slice, np.ndarray], n_rows: int, chunk_rows: int
+) -> List[Union[slice, np.ndarray]]:
+    """Split a row slice or position array into chunks of at most chunk_rows."""
+    chunk_rows = max(1, chunk_rows)
+    if isinstance(rows, slice):
+        start, stop, _ = rows.indices(n_rows)
+        return [
+            slice(begin, min(begin + chunk_rows, stop))
+            for begin in range(start, stop, chunk_rows)
+        ]
+    return np.array_split(rows, max(1, -(-len(rows) // chunk_rows)))
+
+
+def _column_moments(
+    X: np.ndarray, rows: Union[slice, np.ndarray], chunk_rows: int
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Float64 column means and variances over some rows, ignoring NaN."""
+    count = np.zeros(X.shape[1])
+    mean = np.zeros(X.shape[1])
+    m2 = np.zeros(X.shape[1])
+    for part in _row_chunks(rows, len(X), chunk_rows):
+        chunk = X[part].astype(np.float64)
+        present = ~np.isnan(chunk)
+        chunk_count = present.sum(axis=0)
+        if not chunk_count.any():
+            continue
+        chunk = np.where(present, chunk, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            chunk_mean = np.where(chunk_count > 0, chunk.sum(axis=0) / chunk_count, 0.0)
+        chunk_m2 = (np.where(present, chunk - chunk_mean, 0.0) ** 2).sum(axis=0)
+
+        # Chan et al. update of the running moments
+        total = count + chunk_count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = np.where(chunk_count > 0, chunk_mean - mean, 0.0)
+            weight = np.where(total > 0, chunk_count / total, 0.0)
+            m2 = m2 + chunk_m2 + delta**2 * count * weight
+        mean = mean + delta * weight
+        count = total
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = np.where(count > 0, m2 / count, np.nan)
+    return mean, var, int(count.max(initial=0))
+
+
+def standardize_inplace(
+    X: np.ndarray,
+    fit_rows: Union[slice, np.ndarray] = slice(None),
+    chunk_rows: int = CHUNK_ROWS,
+) -> StandardScaler:
+    """
+    Standardise a matrix in place with statistics of some of its rows.
+
+    Means and variances are accumulated in float64; the matrix keeps its
+    dtype. The returned scaler transforms new rows (e.g. serving requests)
+    exactly like the matrix was transformed.
+
+    Args:
+        X: Writable feature matrix (e.g. ModelMatrix.X)
+        fit_rows: Rows the statistics are computed from, usually the
+            training rows (a slice or an array of positions)
+        chunk_rows: Rows processed per step, which bounds the temporary
+            float64 copies
+
+    Returns:
+        Fitted StandardScaler with the statistics used
+    """
+    mean, var, n_samples = _column_moments(X, fit_rows, chunk_rows)
+    scale = np.sqrt(var)
+    # Constant columns are only centred, as in StandardScaler
+    scale = np.where((scale == 0) | np.isnan(scale), 1.0, scale)
+
+    mean_cast = mean.astype(X.dtype)
+    scale_cast = scale.astype(X.dtype)
+    for rows in _row_chunks(slice(None), len(X), chunk_rows):
+        block = X[rows]
+        block -= mean_cast
+        block /= scale_cast
+    if isinstance(X, np.memmap):
+        X.flush()
+
+    scaler = StandardScaler()
+    scaler.mean_ = mean
+    scaler.var_ = var
+    scaler.scale_ = scale
+    scaler.n_samples_seen_ = n_samples
+    scaler.n_features_in_ = X.shape[1]
+    return scaler
@@ -0,0 +1,432 @@
+"""
+Name Resolution Module
+
+This module resolves player-name variants between the sources before they
+are merged: accents ("Nenê"), suffixes ("Tim Hardaway Jr."), punctuation
+("Shaquille O'Neal") and the Hall-of-Fame asterisks of the season statistics
+("Karl Malone*").
+
+Names are first compared in a canonical form. Remaining names are scored
+with difflib only against the reference names sharing a block (the same
+canonical surname, or the same first name and birth year), so resolution
+never compares all pairs of names. Resolved names are stored in a CSV
+crosswalk that is reused on every run; only names missing from it are
+resolved, and manual corrections made in the file are kept.
+"""
+
+import difflib
+import os
+import unicodedata
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import normalize_player_names, parse_birth_dates
+
+CROSSWALK_COLUMNS = ["source", "name", "resolved_name", "score", "method"]
+
+# Sources whose names are resolved, in resolution order
+RESOLVED_SOURCES = ("seasons_stats", "all_star")
+
+# Minimum difflib similarity of canonical names for a fuzzy match
+DEFAULT_THRESHOLD = 0.88
+
+# Largest birth-year difference of two names of the same player
+BIRTH_YEAR_TOLERANCE = 1
+
+NAME_SUFFIXES = frozenset(["jr", "sr", "ii", "iii", "iv", "v"])
+
+
+class NameIndex(NamedTuple):
+    """
+    Blocking index over reference names.
+
+    Attributes:
+        names: Reference names
+        canonical: Canonical form of every reference name
+        birth_years: Birth year of every reference name (NaN if unknown)
+        exact: Canonical name -> positions of the names with that form
+        blocks: Blocking key -> positions of the names in the block
+    """
+
+    names: List[str]
+    canonical: List[str]
+    birth_years: np.ndarray
+    exact: Dict[str, List[int]]
+    blocks: Dict[Tuple, List[int]]
+
+
+def canonical_name(name: str) -> str:
+    """
+    Reduce a player name to the form used for matching.
+
+    Accents, asterisks, punctuation, case and trailing suffixes such as
+    "Jr." or "III" are removed.
+
+    Args:
+        name: Player name
+
+    Returns:
+        Canonical name, e.g. "tim hardaway" for "Tim Hardaway Jr."
+    """
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = text.lower().replace("'", "").replace(".", "")
+    text = "".join(char if char.isalnum() else " " for char in text)
+    tokens = text.split()
+    while len(tokens) > 2 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def blocking_keys(canonical: str, birth_year: Optional[float] = None) -> List[Tuple]:
+    """
+    Blocking keys of a canonical name.
+
+    A name belongs to the block of its surname and, when its birth year is
+    known, to the block of its first name and birth year, so a misspelt
+    surname can still be matched.
+
+    Args:
+        canonical: Canonical name
+        birth_year: Birth year (unknown if None or NaN)
+
+    Returns:
+        List of blocking keys
+    """
+    tokens = canonical.split()
+    if not tokens:
+        return []
+    keys: List[Tuple] = [("surname", tokens[-1])]
+    if birth_year is not None and not np.isnan(birth_year):
+        keys.append(("first", tokens[0], int(birth_year)))
+    return keys
+
+
+def _year_range(birth_year: Optional[float]) -> List[Optional[float]]:
+    """Birth years whose blocks are searched for a name."""
+    if birth_year is None or np.isnan(birth_year):
+        return [None]
+    return [
+        birth_year + offset
+        for offset in range(-BIRTH_YEAR_TOLERANCE, BIRTH_YEAR_TOLERANCE + 1)
+    ]
+
+
+def build_name_index(
+    names: Sequence[str], birth_years: Optional[Sequence[float]] = None
+) -> NameIndex:
+    """
+    Build the blocking index of the reference names.
+
+    Args:
+        names: Reference names (e.g. the player data names)
+        birth_years: Birth year of every name (unknown if None)
+
+    Returns:
+        NameIndex over the names
+    """
+    names = list(names)
+    canonical = [canonical_name(name) for name in names]
+    if birth_years is None:
+        years = np.full(len(names), np.nan)
+    else:
+        years = np.asarray(birth_years, dtype=np.float64)
+
+    exact: Dict[str, List[int]] = {}
+    blocks: Dict[Tuple, List[int]] = {}
+    for position, (form, year) in enumerate(zip(canonical, years)):
+        exact.setdefault(form, []).append(position)
+        for key in blocking_keys(form, year):
+            blocks.setdefault(key, []).append(position)
+    return NameIndex(names, canonical, years, exact, blocks)
+
+
+def candidate_positions(
+    index: NameIndex, canonical: str, birth_year: Optional[float] = None
+) -> List[int]:
+    """
+    Reference names sharing a block with a name.
+
+    Candidates whose birth year differs by more than BIRTH_YEAR_TOLERANCE
+    are left out when both birth years are known.
+
+    Args:
+        index: NameIndex of the reference names
+        canonical: Canonical name to resolve
+        birth_year: Birth year of the name (unknown if None or NaN)
+
+    Returns:
+        Sorted positions of the candidate reference names
+    """
+    candidates: Set[int] = set()
+    for year in _year_range(birth_year):
+        for key in blocking_keys(canonical, year):
+            candidates.update(index.blocks.get(key, ()))
+    if birth_year is not None and not np.isnan(birth_year):
+        candidates = {
+            position
+            for position in candidates
+            if np.isnan(index.birth_years[position])
+            or abs(index.birth_years[position] - birth_year) <= BIRTH_YEAR_TOLERANCE
+        }
+    return sorted(candidates)
+
+
+def _closest_year(
+    index: NameIndex, positions: List[int], birth_year: Optional[float]
+) -> List[int]:
+    """Positions whose birth year is closest to a name's (all if unknown)."""
+    if birth_year is None or np.isnan(birth_year):
+        return positions
+    gaps = np.abs(index.birth_years[positions] - birth_year)
+    if np.isnan(gaps).all():
+        return positions
+    return [
+        position for position, gap in zip(positions, gaps) if gap == np.nanmin(gaps)
+    ]
+
+
+def resolve_name(
+    name: str,
+    index: NameIndex,
+    birth_year: Optional[float] = None,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> Tuple[Optional[str], float, str]:
+    """
+    Resolve one name against the reference names.
+
+    Args:
+        name: Name to resolve
+        index: NameIndex of the reference names
+        birth_year: Birth year of the name (unknown if None or NaN)
+        threshold: Minimum similarity of a fuzzy match
+
+    Returns:
+        Tuple of (resolved name or None, similarity, method), where method is
+        "exact", "canonical", "fuzzy", "ambiguous" or "unresolved"
+    """
+    canonical = canonical_name(name)
+    if canonical in index.exact:
+        positions = index.exact[canonical]
+        if any(index.names[position] == name for position in positions):
+            return name, 1.0, "exact"
+        positions = _closest_year(index, positions, birth_year)
+        resolved = {index.names[position] for position in positions}
+        if len(resolved) == 1:
+            return resolved.pop(), 1.0, "canonical"
+        return None, 1.0, "ambiguous"
+
+    best_score, best = 0.0, set()
+    matcher = difflib.SequenceMatcher(b=canonical, autojunk=False)
+    for position in candidate_positions(index, canonical, birth_year):
+        matcher.set_seq1(index.canonical[position])
+        if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+            continue
+        score = matcher.ratio()
+        if score > best_score:
+            best_score, best = score, {index.names[position]}
+        elif score == best_score:
+            best.add(index.names[position])
+    if best_score < threshold:
+        return None, best_score, "unresolved"
+    if len(best) > 1:
+        return None, best_score, "ambiguous"
+    return best.pop(), best_score, "fuzzy"
+
+
+def resolve_names(
+    names: Iterable[str],
+    index: NameIndex,
+    birth_years: Optional[Dict[str, float]] = None,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> pd.DataFrame:
+    """
+    Resolve distinct names against the reference names.
+
+    Args:
+        names: Names to resolve (duplicates and missing values are skipped)
+        index: NameIndex of the reference names
+        birth_years: Birth year per name (unknown for names without one)
+        threshold: Minimum similarity of a fuzzy match
+
+    Returns:
+        DataFrame with "name", "resolved_name", "score" and "method" columns
+    """
+    birth_years = birth_years or {}
+    rows = []
+    for name in dict.fromkeys(names):
+        if not isinstance(name, str):
+            continue
+        resolved, score, method = resolve_name(
+            name, index, birth_years.get(name), threshold
+        )
+        rows.append(
+            {"name": name, "resolved_name": resolved, "score": score, "method": method}
+        )
+    return pd.DataFrame(rows, columns=CROSSWALK_COLUMNS[1:])
+
+
+def load_crosswalk(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Read a crosswalk file.
+
+    Args:
+        path: CSV file written by save_crosswalk
+
+    Returns:
+        Crosswalk DataFrame (empty if the file does not exist)
+    """
+    path = Path(path)
+    if not path.exists():
+        return pd.DataFrame(columns=CROSSWALK_COLUMNS)
+    return pd.read_csv(
+        path, dtype={"source": object, "name": object, "resolved_name": object}
+    )[CROSSWALK_COLUMNS]
+
+
+def save_crosswalk(crosswalk: pd.DataFrame, path: Union[str, Path]) -> Path:
+    """
+    Atomically write a crosswalk file.
+
+    Args:
+        crosswalk: Crosswalk DataFrame
+        path: Output CSV file
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    crosswalk[CROSSWALK_COLUMNS].to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _median_by_name(names: pd.Series, values: pd.Series) -> Dict[str, float]:
+    """Median of some values per name."""
+    frame = pd.DataFrame({"name": names.to_numpy(), "value": values.to_numpy()})
+    medians = frame.dropna().groupby("name", sort=False)["value"].median()
+    return {str(name): float(value) for name, value in medians.items()}
+
+
+def _source_birth_years(source: str, df: pd.DataFrame) -> pd.Series:
+    """Birth year of every row of a source (NaN where unknown)."""
+    if source == "player_data" and "birth_date" in df.columns:
+        return parse_birth_dates(df["birth_date"]).dt.year
+    if "Age" in df.columns and "Year" in df.columns:
+        return pd.to_numeric(df["Year"], errors="coerce") - pd.to_numeric(
+            df["Age"], errors="coerce"
+        )
+    return pd.Series(np.nan, index=df.index)
+
+
+def _append(crosswalk: pd.DataFrame, entries: pd.DataFrame) -> pd.DataFrame:
+    """Add entries to a crosswalk."""
+    entries = entries[CROSSWALK_COLUMNS]
+    if crosswalk.empty:
+        return entries.reset_index(drop=True)
+    return pd.concat([crosswalk, entries], ignore_index=True)
+
+
+def update_crosswalk(
+    path: Union[str, Path],
+    player_data: pd.DataFrame,
+    seasons_stats: pd.DataFrame,
+    all_star: pd.DataFrame,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> pd.DataFrame:
+    """
+    Resolve the names missing from a crosswalk file and save it.
+
+    Season-statistics names are resolved against the player data, with birth
+    years (season minus age, and parsed birth dates) as blocking keys.
+    All-Star names are resolved against the resolved season-statistics
+    names. Entries already in the file are reused as they are.
+
+    Args:
+        path: Crosswalk CSV file (created if missing)
+        player_data: Player demographic data
+        seasons_stats: Season statistics data
+        all_star: All-Star selections data
+        threshold: Minimum similarity of a fuzzy match
+
+    Returns:
+        Crosswalk DataFrame with an entry per source name
+    """
+    crosswalk = load_crosswalk(path)
+    known = set(zip(crosswalk["source"], crosswalk["name"]))
+    added = False
+
+    player_names = normalize_player_names(player_data["name"])
+    present = player_names.notna()
+    player_years = _median_by_name(
+        player_names[present], _source_birth_years("player_data", player_data)[present]
+    )
+    reference_names = list(dict.fromkeys(player_names[present]))
+    references = {
+        "seasons_stats": build_name_index(
+            reference_names,
+            [player_years.get(name, np.nan) for name in reference_names],
+        )
+    }
+
+    frames = {"seasons_stats": seasons_stats, "all_star": all_star}
+    for source in RESOLVED_SOURCES:
+        df = frames[source]
+        names = normalize_player_names(df["Player"])
+        pending = [
+            name
+            for name in dict.fromkeys(names.dropna())
+            if (source, name) not in known
+        ]
+        if not pending:
+            continue
+        if source == "all_star":
+            # All-Star names are matched to the resolved season names
+            mapping = crosswalk_mapping(crosswalk, "seasons_stats")
+            season_names = normalize_player_names(seasons_stats["Player"]).dropna()
+            references[source] = build_name_index(
+                dict.fromkeys(mapping.get(name, name) for name in season_names)
+            )
+        years = _median_by_name(names, _source_birth_years(source, df))
+        result = resolve_names(pending, references[source], years, threshold)
+        crosswalk = _append(crosswalk, result.assign(source=source))
+        added = True
+
+    if added:
+        save_crosswalk(crosswalk, path)
+    return crosswalk
+
+
+def crosswalk_mapping(crosswalk: pd.DataFrame, source: str) -> Dict[str, str]:
+    """
+    Name replacements of one source.
+
+    Args:
+        crosswalk: Crosswalk DataFrame
+        source: Source name ("seasons_stats" or "all_star")
+
+    Returns:
+        Mapping of source name to resolved name, for the resolved names that
+        differ from the source name
+    """
+    rows = crosswalk[
+        (crosswalk["source"] == source)
+        & crosswalk["resolved_name"].notna()
+        & (crosswalk["resolved_name"] != crosswalk["name"])
+    ]
+    return dict(zip(rows["name"], rows["resolved_name"]))
@@ -0,0 +1,109 @@
+"""
+Parallel Execution Module
+
+This module contains helpers for running row-local pipeline stages over
+partitions of a DataFrame in a process pool.
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Turn an ``n_jobs`` setting into a worker count.
+
+    Args:
+        n_jobs: Number of worker processes; None or 1 means serial execution
+            and -1 means one worker per CPU
+
+    Returns:
+        Number of workers (at least 1)
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
+def split_rows(df: pd.DataFrame, n_parts: int) -> List[pd.DataFrame]:
+    """
+    Split a DataFrame into contiguous row chunks.
+
+    Concatenating the chunks restores the original frame, including its
+    row order and index.
+
+    Args:
+        df: Input DataFrame
+        n_parts: Number of chunks
+
+    Returns:
+        List of non-empty row chunks
+    """
+    n_parts = max(1, min(n_parts, len(df)))
+    bounds = np.linspace(0, len(df), n_parts + 1).astype(int)
+    return [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def map_partitions(
+    func: Callable[..., Any],
+    parts: List[Any],
+    n_jobs: int,
+    executor: Optional[Executor] = None,
+    **kwargs: Any,
+) -> List[Any]:
+    """
+    Apply a function to every partition in a process pool.
+
+    ``func`` must be defined at module level so it can be pickled.
+
+    Args:
+        func: Function applied to each partition
+        parts: Partitions to process
+        n_jobs: Number of worker processes
+        executor: Existing executor to reuse (a new pool is created if None)
+        **kwargs: Extra keyword arguments for ``func``
+
+    Returns:
+        Results in partition order
+    """
+    task = partial(func, **kwargs)
+    if n_jobs <= 1 or len(parts) <= 1:
+        return [task(part) for part in parts]
+    if executor is not None:
+        return list(executor.map(task, parts))
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(parts))) as pool:
+        return list(pool.map(task, parts))
+
+
+def concat_partitions(parts: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate processed partitions back into one DataFrame.
+
+    Categorical columns whose categories differ between partitions are
+    re-encoded so the result stays categorical.
+
+    Args:
+        parts: Processed partitions in their original order
+
+    Returns:
+        Combined DataFrame
+    """
+    if len(parts) == 1:
+        return parts[0]
+    combined = pd.concat(parts)
+    for col in parts[0].columns:
+        if isinstance(parts[0][col].dtype, pd.CategoricalDtype) and not isinstance(
+            combined[col].dtype, pd.CategoricalDtype
+        ):
+            categories = pd.api.types.union_categoricals(
+                [part[col] for part in parts]
+            ).categories
+            combined[col] = pd.Categorical(combined[col], categories=categories)
+    return combined
@@ -0,0 +1,319 @@
+"""
+Pipeline Planner Module
+
+This module builds column-pruned pipelines for a target feature list. The
+planner knows which raw columns every cleaned, imputed and engineered column
+is computed from, so a job that only needs a handful of features loads,
+cleans and derives only those columns instead of the whole dataset.
+
+A planned run produces the same values as ``preprocess_data`` followed by
+``engineer_all_features`` for the requested columns. Birth dates are always
+loaded because the age filter of ``process_age_data`` decides which rows are
+kept.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import pandas as pd
+
+from src.data_processing import (
+    DEFAULT_SEASON_WINDOW,
+    clean_missing_values,
+    load_nba_data,
+    merge_datasets,
+    process_age_data,
+    process_height_weight,
+)
+from src.feature_engineering import (
+    EFFICIENCY_RATIO_FEATURES,
+    PER_MINUTE_FEATURES,
+    ROLE_RATIO_FEATURES,
+    add_ratio_features,
+    create_career_features,
+    select_modeling_features,
+)
+from src.profiling import StageProfiler, run_stage
+from src.schemas import SCHEMAS
+
+RATIO_FEATURES: Dict[str, Tuple[str, str]] = {
+    **PER_MINUTE_FEATURES,
+    **EFFICIENCY_RATIO_FEATURES,
+    **ROLE_RATIO_FEATURES,
+}
+
+# Columns computed from other columns: name -> columns it is computed from.
+# Raw columns listed here (the shooting percentages) are also read themselves.
+DERIVED_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    # Missing percentages are filled from makes and attempts while cleaning
+    "FG%": ("FG", "FGA"),
+    "2P%": ("2P", "2PA"),
+    "3P%": ("3P", "3PA"),
+    "FT%": ("FT", "FTA"),
+    "eFG%": ("FG", "3P", "FGA"),
+    # Imputed columns
+    "height_cm": ("height",),
+    "birth_year": ("birth_date",),
+    "age_calc": ("birth_date", "Year"),
+    # Engineered features
+    "years_played": ("year_start", "year_end"),
+    **RATIO_FEATURES,
+}
+
+# Columns every planned pipeline reads: join keys, labels and the inputs of
+# the age filter, which drops rows
+REQUIRED_SOURCE_COLUMNS: Dict[str, List[str]] = {
+    "player_data": ["name", "birth_date"],
+    "seasons_stats": ["Year", "Player"],
+    "all_star": ["Year", "Player"],
+}
+
+# Identifier and label columns at the front of every planned result
+KEY_COLUMNS = ["PlayerName", "player_id", "Year", "is_all_star"]
+
+
+class PipelinePlan(NamedTuple):
+    """
+    Column-pruned pipeline for a feature list.
+
+    Attributes:
+        features: Requested output features, in order
+        columns: Raw columns to read per source name
+        stages: Stages the plan runs, in order
+    """
+
+    features: List[str]
+    columns: Dict[str, List[str]]
+    stages: List[str]
+
+
+def _source_of(column: str) -> Optional[str]:
+    """Name of the raw source declaring a column (season statistics first)."""
+    for source in ("seasons_stats", "player_data"):
+        if column in SCHEMAS[source]:
+            return source
+    return None
+
+
+def required_raw_columns(features: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Resolve features to the raw columns they are computed from.
+
+    Args:
+        features: Raw, cleaned, imputed or engineered column names
+
+    Returns:
+        Mapping of source name to the raw columns it has to provide, in
+        schema order
+
+    Raises:
+        ValueError: If a feature is neither a raw column nor derivable
+    """
+    needed = {source: set(cols) for source, cols in REQUIRED_SOURCE_COLUMNS.items()}
+    pending = list(features)
+    seen = set()
+    unknown = []
+    while pending:
+        column = pending.pop()
+        if column in seen or column in KEY_COLUMNS:
+            continue
+        seen.add(column)
+
+        source = _source_of(column)
+        if source is not None:
+            needed[source].add(column)
+        elif column not in DERIVED_COLUMNS:
+            unknown.append(column)
+        pending.extend(DERIVED_COLUMNS.get(column, ()))
+
+    if unknown:
+        raise ValueError(f"Cannot compute features: {sorted(unknown)}")
+    return {
+        source: [col for col in SCHEMAS[source] if col in cols]
+        for source, cols in needed.items()
+    }
+
+
+def plan_pipeline(features: Optional[List[str]] = None) -> PipelinePlan:
+    """
+    Plan a column-pruned pipeline for a target feature list.
+
+    Args:
+        features: Output features (select_modeling_features() if None)
+
+    Returns:
+        PipelinePlan with the raw columns to read and the stages to run
+
+    Raises:
+        ValueError: If a feature cannot be computed from the raw sources
+    """
+    if features is None:
+        features = select_modeling_features()
+    features = list(dict.fromkeys(features))
+    columns = required_raw_columns(features)
+
+    stages = ["load_nba_data", "merge_datasets", "clean_missing_values"]
+    if {"height", "weight"} & set(columns["player_data"]):
+        stages.append("process_height_weight")
+    stages.append("process_age_data")
+    if any(feature in RATIO_FEATURES for feature in features):
+        stages.append("add_ratio_features")
+    if "years_played" in features:
+        stages.append("create_career_features")
+
+    return PipelinePlan(features, columns, stages)
+
+
+def run_plan(
+    plan: PipelinePlan,
+    player_data_path: str,
+    seasons_stats_path: str,
+    all_star_path: str,
+    cache_dir: Optional[str] = None,
+    season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+    age_reference: Optional[str] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> pd.DataFrame:
+    """
+    Run a planned pipeline.
+
+    Every stage works in place on the pruned frame, so no stage copies it.
+
+    Args:
+        plan: Plan from plan_pipeline
+        player_data_path: Path to player demographic data CSV
+        seasons_stats_path: Path to season statistics CSV
+        all_star_path: Path to All-Star selections CSV
+        cache_dir: Directory for columnar copies of the CSVs (no caching if None)
+        season_window: Inclusive (first_year, last_year) of seasons to keep
+        age_reference: "MM-DD" season reference date for player ages (see
+            process_age_data)
+        profiler: StageProfiler receiving a record per stage
+
+    Returns:
+        DataFrame with the key columns followed by the planned features
+    """
+    player_data, seasons_stats, all_star = run_stage(
+        "load_nba_data",
+        load_nba_data,
+        player_data_path,
+        profiler=profiler,
+        seasons_stats_path=seasons_stats_path,
+        all_star_path=all_star_path,
+        cache_dir=cache_dir,
+        season_window=season_window,
+        columns=plan.columns,
+    )
+    df = run_stage(
+        "merge_datasets",
+        merge_datasets,
+        player_data,
+        profiler=profiler,
+        seasons_stats=seasons_stats,
+        all_star=all_star,
+        season_window=season_window,
+    )
+    del player_data, seasons_stats, all_star
+
+    df = run_stage(
+        "clean_missing_values",
+        clean_missing_values,
+        df,
+        profiler=profiler,
+        copy=False,
+    )
+    return run_plan_stages(plan, df, age_reference, profiler)
+
+
+def run_plan_stages(
+    plan: PipelinePlan,
+    df: pd.DataFrame,
+    age_reference: Optional[str] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> pd.DataFrame:
+    """
+    Run the stages of a plan that follow cleaning.
+
+    Args:
+        plan: Plan from plan_pipeline
+        df: Merged and cleaned frame with the planned raw columns (modified
+            in place)
+        age_reference: "MM-DD" season reference date for player ages (see
+            process_age_data)
+        profiler: StageProfiler receiving a record per stage
+
+    Returns:
+        DataFrame with the key columns followed by the planned features
+    """
+    if "process_height_weight" in plan.stages:
+        df = run_stage(
+            "process_height_weight",
+            process_height_weight,
+            df,
+            profiler=profiler,
+            copy=False,
+        )
+    df = run_stage(
+        "process_age_data",
+        process_age_data,
+        df,
+        profiler=profiler,
+        copy=False,
+        age_reference=age_reference,
+    )
+    if "add_ratio_features" in plan.stages:
+        specs = {
+            name: spec for name, spec in RATIO_FEATURES.items() if name in plan.features
+        }
+        df = run_stage(
+            "add_ratio_features", add_ratio_features, df, profiler=profiler, specs=specs
+        )
+    if "create_career_features" in plan.stages:
+        df = run_stage(
+            "create_career_features",
+            create_career_features,
+            df,
+            profiler=profiler,
+            copy=False,
+        )
+
+    output = KEY_COLUMNS + [col for col in plan.features if col not in KEY_COLUMNS]
+    return df[output]
+
+
+def run_planned_pipeline(
+    player_data_path: str,
+    seasons_stats_path: str,
+    all_star_path: str,
+    features: Optional[List[str]] = None,
+    cache_dir: Optional[str] = None,
+    season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+    age_reference: Optional[str] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> pd.DataFrame:
+    """
+    Compute only the columns needed for a feature list.
+
+    Args:
+        player_data_path: Path to player demographic data CSV
+        seasons_stats_path: Path to season statistics CSV
+        all_star_path: Path to All-Star selections CSV
+        features: Output features (select_modeling_features() if None)
+        cache_dir: Directory for columnar copies of the CSVs (no caching if None)
+        season_window: Inclusive (first_year, last_year) of seasons to keep
+        age_reference: "MM-DD" season reference date for player ages (see
+            process_age_data)
+        profiler: StageProfiler receiving a record per stage
+
+    Returns:
+        DataFrame with the key columns followed by the requested features
+    """
+    return run_plan(
+        plan_pipeline(features),
+        player_data_path,
+        seasons_stats_path,
+        all_star_path,
+        cache_dir=cache_dir,
+        season_window=season_window,
+        age_reference=age_reference,
+        profiler=profiler,
+    )
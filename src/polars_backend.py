@@ -0,0 +1,496 @@
+"""
+Polars Backend Module
+
+This module implements ``preprocess_data`` and ``engineer_all_features`` as
+lazy Polars query plans. Loading, the joins, cleaning, imputation and the
+engineered features are planned together and executed by Polars' streaming
+engine on all cores, so only the final frame is materialised. Results are
+converted to pandas at the boundary, so downstream code is unchanged.
+
+Polars is an optional dependency (``pip install .[polars]``); it is imported
+only when this backend is used. The size of its thread pool is set with the
+``POLARS_MAX_THREADS`` environment variable.
+
+Select the backend with ``preprocess_data(..., backend="polars")`` and
+``engineer_all_features(..., backend="polars")``.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src.data_processing import (
+    ADVANCED_STAT_COLUMNS,
+    BIRTH_DATE_FORMAT,
+    DEFAULT_SEASON_WINDOW,
+    METRIC_HEIGHT_RANGE_CM,
+    PERCENTAGE_COLUMNS,
+    PERCENTAGE_INPUTS,
+    TEXT_FILL_COLUMNS,
+    _reference_month_day,
+)
+from src.feature_engineering import (
+    EFFICIENCY_RATIO_FEATURES,
+    PER_MINUTE_FEATURES,
+    ROLE_RATIO_FEATURES,
+)
+from src.schemas import (
+    CATEGORY,
+    CSV_NA_VALUES,
+    FLOAT,
+    REQUIRED_COLUMNS,
+    SCHEMAS,
+    SMALL_INT,
+)
+
+# Internal columns of the merge plan
+_KEY = "_player_key"
+_ROW_COLUMNS = {
+    "seasons_stats": "_s_row",
+    "player_data": "_p_row",
+    "all_star": "_a_row",
+}
+
+# Ratio features in the order engineer_all_features adds them
+RATIO_FEATURES: Dict[str, Tuple[str, str]] = {
+    **PER_MINUTE_FEATURES,
+    **EFFICIENCY_RATIO_FEATURES,
+    **ROLE_RATIO_FEATURES,
+}
+
+
+def polars_available() -> bool:
+    """
+    Check whether Polars is installed.
+
+    Returns:
+        True if polars can be imported
+    """
+    try:
+        import polars  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _import_polars() -> Any:
+    """Import Polars, explaining how to install it if it is missing."""
+    try:
+        import polars as pl
+    except ImportError:
+        raise ImportError(
+            "The polars backend requires polars; install it with "
+            "pip install 'nba-allstar-prediction[polars]'"
+        ) from None
+    return pl
+
+
+def _collect(frame: Any, streaming: bool) -> Any:
+    """Execute a lazy plan, with the streaming engine if requested."""
+    return frame.collect(engine="streaming" if streaming else "auto")
+
+
+def _normalize(pl: Any, column: str) -> Any:
+    """Expression of normalised player names (see normalize_player_names)."""
+    return pl.col(column).str.strip_chars().str.replace_all(r"\s+", " ")
+
+
+def scan_source(
+    path: str,
+    source: str,
+    season_window: Optional[Tuple[int, int]] = None,
+) -> Any:
+    """
+    Lazily read one raw source with its declared schema.
+
+    Numeric columns are cast with stray text becoming null, and rows missing
+    every required column are dropped, as in load_nba_data.
+
+    Args:
+        path: Path to the source CSV
+        source: Source name ("player_data", "seasons_stats" or "all_star")
+        season_window: Inclusive (first_year, last_year) of seasons to keep
+            (all seasons if None)
+
+    Returns:
+        polars.LazyFrame with the declared columns in file order
+    """
+    pl = _import_polars()
+    schema = SCHEMAS[source]
+    frame = pl.scan_csv(path, infer_schema=False, null_values=sorted(CSV_NA_VALUES))
+    columns = [col for col in frame.collect_schema().names() if col in schema]
+
+    # Integer columns are read as float32, as by the pandas reader
+    frame = frame.select(
+        [
+            (
+                pl.col(col).cast(pl.Float32, strict=False)
+                if schema[col] in (FLOAT, SMALL_INT)
+                else pl.col(col)
+            )
+            for col in columns
+        ]
+    )
+    required = [col for col in REQUIRED_COLUMNS.get(source, []) if col in columns]
+    if required:
+        frame = frame.filter(
+            pl.any_horizontal([pl.col(col).is_not_null() for col in required])
+        )
+    if season_window is not None and "Year" in columns:
+        first_year, last_year = season_window
+        frame = frame.filter(pl.col("Year").is_between(first_year, last_year))
+    return frame
+
+
+def merge_plan(player_data: Any, seasons_stats: Any, all_star: Any) -> Any:
+    """
+    Plan the merge of the three sources (see merge_datasets).
+
+    Player IDs are numbered in order of first appearance of the normalised
+    name in the season statistics, the player data and the All-Star
+    selections, so they equal those of merge_datasets, as does the row order.
+
+    Args:
+        player_data: LazyFrame of player demographic data
+        seasons_stats: LazyFrame of season statistics (season window applied)
+        all_star: LazyFrame of All-Star selections (season window applied)
+
+    Returns:
+        LazyFrame with player_id and the is_all_star target
+    """
+    pl = _import_polars()
+    season_columns = seasons_stats.collect_schema().names()
+    player_columns = [
+        col for col in player_data.collect_schema().names() if col != "name"
+    ]
+
+    seasons_stats = (
+        seasons_stats.filter(pl.col("Year").is_not_null())
+        .with_columns(pl.col("Year").cast(pl.Int16))
+        .with_row_index(_ROW_COLUMNS["seasons_stats"])
+        .with_columns(_normalize(pl, "Player").alias(_KEY))
+    )
+    player_data = player_data.with_row_index(_ROW_COLUMNS["player_data"]).with_columns(
+        _normalize(pl, "name").alias(_KEY)
+    )
+    all_star = all_star.with_row_index(_ROW_COLUMNS["all_star"]).with_columns(
+        _normalize(pl, "Player").alias(_KEY)
+    )
+
+    # Player index: distinct names in order of first appearance
+    sources = [
+        (seasons_stats, "seasons_stats"),
+        (player_data, "player_data"),
+        (all_star, "all_star"),
+    ]
+    first_seen = pl.concat(
+        [
+            frame.select(
+                pl.col(_KEY),
+                (
+                    pl.lit(rank, dtype=pl.Int64) * 2**32
+                    + pl.col(_ROW_COLUMNS[source]).cast(pl.Int64)
+                ).alias("_first_seen"),
+            )
+            for rank, (frame, source) in enumerate(sources)
+        ]
+    )
+    player_ids = (
+        first_seen.drop_nulls(_KEY)
+        .group_by(_KEY)
+        .agg(pl.col("_first_seen").min())
+        .sort("_first_seen")
+        .with_row_index("player_id")
+        .select(_KEY, pl.col("player_id").cast(pl.Int32))
+    )
+
+    players = player_data.filter(pl.col(_KEY).is_not_null()).select(
+        [_KEY, _ROW_COLUMNS["player_data"], *player_columns]
+    )
+    labels = all_star.filter(
+        pl.col("Year").is_not_null() & pl.col(_KEY).is_not_null()
+    ).select(
+        _KEY,
+        pl.col("Year").cast(pl.Int16),
+        _ROW_COLUMNS["all_star"],
+        pl.lit(1, dtype=pl.Int64).alias("is_all_star"),
+    )
+
+    merged = (
+        seasons_stats.join(player_ids, on=_KEY, how="left")
+        .join(players, on=_KEY, how="left")
+        .join(labels, on=[_KEY, "Year"], how="left")
+        .sort(list(_ROW_COLUMNS.values()), nulls_last=True)
+    )
+    return merged.select(
+        [
+            pl.col(_KEY).alias("PlayerName") if col == "Player" else pl.col(col)
+            for col in season_columns
+        ]
+        + [pl.col("player_id").fill_null(-1)]
+        + player_columns
+        + [pl.col("is_all_star").fill_null(0)]
+    )
+
+
+def _present(columns: List[str], *names: str) -> bool:
+    """Whether every name is a column."""
+    return all(name in columns for name in names)
+
+
+def clean_plan(frame: Any) -> Any:
+    """
+    Plan the cleaning of a merged frame (see clean_missing_values).
+
+    Args:
+        frame: LazyFrame from merge_plan
+
+    Returns:
+        LazyFrame with missing values handled
+    """
+    pl = _import_polars()
+    columns = frame.collect_schema().names()
+
+    # Back-fill percentages from makes and attempts; 0/0 and missing become 0
+    percentages = {}
+    for col in PERCENTAGE_COLUMNS:
+        terms, denominator = PERCENTAGE_INPUTS[col]
+        if not _present(columns, denominator, *(name for _, name in terms)):
+            if col in columns:
+                percentages[col] = pl.col(col)
+            continue
+        numerator = None
+        for coef, name in terms:
+            term = coef * pl.col(name)
+            numerator = term if numerator is None else numerator + term
+        ratio = numerator / pl.col(denominator)
+        percentages[col] = pl.coalesce(pl.col(col), ratio) if col in columns else ratio
+    fills = [
+        expr.fill_nan(0.0).fill_null(0.0).alias(col)
+        for col, expr in percentages.items()
+    ]
+    fills += [
+        pl.col(col).fill_null(0.0) for col in ADVANCED_STAT_COLUMNS if col in columns
+    ]
+    fills += [
+        pl.col(col).fill_null(value)
+        for col, value in TEXT_FILL_COLUMNS.items()
+        if col in columns
+    ]
+    return frame.with_columns(fills) if fills else frame
+
+
+def _height_cm(pl: Any) -> Any:
+    """Expression of heights in cm (see parse_heights)."""
+    text = pl.col("height").cast(pl.String).str.strip_chars()
+    feet = text.str.extract(r"^(\d+)-\d+$", 1).cast(pl.Float64)
+    inches = text.str.extract(r"^\d+-(\d+)$", 1).cast(pl.Float64)
+    metric = text.cast(pl.Float64, strict=False)
+    low, high = METRIC_HEIGHT_RANGE_CM
+    return (
+        pl.when(text.str.contains("-", literal=True))
+        .then((feet * 30.48 + inches * 2.54).round(1))
+        .when(metric.is_between(low, high))
+        .then(metric.round(1))
+        .alias("height_cm")
+    )
+
+
+def impute_plan(frame: Any, age_reference: Optional[str] = None) -> Any:
+    """
+    Plan height, weight and age processing (see process_height_weight and
+    process_age_data).
+
+    Medians are computed over the planned frame, so imputation matches the
+    serial pandas pipeline.
+
+    Args:
+        frame: LazyFrame from clean_plan
+        age_reference: "MM-DD" season reference date for player ages (see
+            process_age_data)
+
+    Returns:
+        LazyFrame with imputed heights, weights, birth years and ages
+    """
+    pl = _import_polars()
+    columns = frame.collect_schema().names()
+
+    if "height" in columns:
+        frame = frame.with_columns(_height_cm(pl))
+        frame = frame.with_columns(
+            pl.col("height_cm").fill_null(pl.col("height_cm").median())
+        )
+    if "weight" in columns:
+        frame = frame.with_columns(
+            pl.col("weight").fill_null(pl.col("weight").median())
+        )
+
+    if "birth_date" in columns:
+        birth_date = pl.col("birth_date")
+        age = pl.col("Year").cast(pl.Int32) - birth_date.dt.year()
+        if age_reference is not None:
+            month_day = birth_date.dt.month().cast(pl.Int32) * 100 + (
+                birth_date.dt.day().cast(pl.Int32)
+            )
+            age = age - (month_day > _reference_month_day(age_reference)).cast(pl.Int32)
+        age_calc = pl.col("age_calc")
+        frame = (
+            frame.with_columns(
+                pl.col("birth_date")
+                .str.to_date(BIRTH_DATE_FORMAT, strict=False)
+                .cast(pl.Datetime("ns"))
+            )
+            .with_columns(
+                birth_date.dt.year().alias("birth_year"), age.alias("age_calc")
+            )
+            # Remove unrealistic ages (NBA range: 18-44)
+            .filter(age_calc.is_null() | age_calc.is_between(18, 44))
+            .with_columns(
+                pl.col("birth_year").fill_null(pl.col("birth_year").median()),
+                age_calc.fill_null(age_calc.median()),
+            )
+        )
+
+    career = [
+        pl.col(col).fill_null(pl.col("Year"))
+        for col in ("year_start", "year_end")
+        if col in columns
+    ]
+    return frame.with_columns(career) if career else frame
+
+
+def _categorical(frame: Any) -> Any:
+    """Cast the categorical columns of the source schemas."""
+    pl = _import_polars()
+    categories = {
+        col
+        for schema in SCHEMAS.values()
+        for col, dtype in schema.items()
+        if dtype == CATEGORY
+    }
+    columns = [col for col in frame.collect_schema().names() if col in categories]
+    if not columns:
+        return frame
+    return frame.with_columns(
+        [pl.col(col).cast(pl.String).cast(pl.Categorical) for col in columns]
+    )
+
+
+def preprocess_plan(
+    player_data_path: str,
+    seasons_stats_path: str,
+    all_star_path: str,
+    season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+    age_reference: Optional[str] = None,
+) -> Any:
+    """
+    Build the lazy query plan of preprocess_data.
+
+    Args:
+        player_data_path: Path to player demographic data CSV
+        seasons_stats_path: Path to season statistics CSV
+        all_star_path: Path to All-Star selections CSV
+        season_window: Inclusive (first_year, last_year) of seasons to keep
+            (all seasons if None)
+        age_reference: "MM-DD" season reference date for player ages (see
+            process_age_data)
+
+    Returns:
+        polars.LazyFrame of the preprocessed data
+    """
+    merged = merge_plan(
+        scan_source(player_data_path, "player_data"),
+        scan_source(seasons_stats_path, "seasons_stats", season_window),
+        scan_source(all_star_path, "all_star", season_window),
+    )
+    return _categorical(impute_plan(clean_plan(merged), age_reference))
+
+
+def preprocess_polars(
+    player_data_path: str,
+    seasons_stats_path: str,
+    all_star_path: str,
+    season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+    age_reference: Optional[str] = None,
+    streaming: bool = True,
+) -> pd.DataFrame:
+    """
+    Run preprocess_data with Polars.
+
+    The result equals the pandas pipeline up to storage dtypes, except that
+    the index is a fresh range index and birth dates are parsed with
+    BIRTH_DATE_FORMAT only (other formats become missing instead of being
+    inferred).
+
+    Args:
+        player_data_path: Path to player demographic data CSV
+        seasons_stats_path: Path to season statistics CSV
+        all_star_path: Path to All-Star selections CSV
+        season_window: Inclusive (first_year, last_year) of seasons to keep
+            (all seasons if None)
+        age_reference: "MM-DD" season reference date for player ages (see
+            process_age_data)
+        streaming: Execute with the streaming engine
+
+    Returns:
+        Fully preprocessed pandas DataFrame
+    """
+    plan = preprocess_plan(
+        player_data_path,
+        seasons_stats_path,
+        all_star_path,
+        season_window,
+        age_reference,
+    )
+    return _collect(plan, streaming).to_pandas()
+
+
+def _safe_divide(pl: Any, numerator: str, denominator: str) -> Any:
+    """Expression of a ratio that is 0 where the denominator is 0 (see safe_divide)."""
+    return (
+        pl.when(pl.col(denominator) == 0)
+        .then(0.0)
+        .otherwise(pl.col(numerator) / pl.col(denominator))
+    )
+
+
+def engineer_polars(
+    df: pd.DataFrame, copy: bool = True, streaming: bool = True
+) -> pd.DataFrame:
+    """
+    Run engineer_all_features with Polars.
+
+    Only the input columns of the features are handed to Polars; the
+    features are computed in one multi-threaded pass and added to the pandas
+    frame, whose other columns are left untouched.
+
+    Args:
+        df: Preprocessed DataFrame
+        copy: Add the features to a copy of ``df``; if False ``df`` is
+            modified in place
+        streaming: Execute with the streaming engine
+
+    Returns:
+        DataFrame with all engineered features
+    """
+    pl = _import_polars()
+    features = {
+        name: _safe_divide(pl, numerator, denominator)
+        for name, (numerator, denominator) in RATIO_FEATURES.items()
+        if _present(df.columns, numerator, denominator)
+    }
+    if _present(df.columns, "year_end", "year_start"):
+        features["years_played"] = pl.col("year_end") - pl.col("year_start")
+    if copy:
+        df = df.copy()
+    if not features:
+        return df
+
+    referenced = {col for spec in RATIO_FEATURES.values() for col in spec}
+    referenced |= {"year_end", "year_start"}
+    inputs = [col for col in df.columns if col in referenced]
+    plan = pl.from_pandas(df[inputs]).lazy().select(**features)
+    result = _collect(plan, streaming)
+    for name in features:
+        df[name] = result.get_column(name).to_numpy()
+    return df
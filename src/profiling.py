@@ -0,0 +1,347 @@
+"""
+Profiling Module
+
+This module contains helpers for measuring the time and memory used by
+individual pipeline stages.
+
+``run_stage`` is the single instrumentation point of the pipeline. Without a
+``stage_memory`` dictionary or a ``StageProfiler`` it calls the stage
+directly, so disabled instrumentation costs one branch per stage.
+"""
+
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+_active_trackers: List["PeakMemoryTracker"] = []
+
+
+def _reset_peak() -> None:
+    """Reset the traced peak where supported (Python 3.9+)."""
+    reset_peak = getattr(tracemalloc, "reset_peak", None)
+    if reset_peak is not None:
+        reset_peak()
+
+
+class PeakMemoryTracker:
+    """
+    Context manager recording the peak traced memory of a block.
+
+    Uses tracemalloc, which also sees NumPy and pandas buffer allocations.
+    Trackers can be nested: an inner tracker resets the interpreter-wide peak
+    counter, so it reports its own peak back to the enclosing trackers.
+
+    Attributes:
+        start_bytes: Traced memory when the block was entered
+        end_bytes: Traced memory when the block was left
+        peak_bytes: Peak traced memory above ``start_bytes`` within the block
+    """
+
+    def __init__(self) -> None:
+        self.start_bytes = 0
+        self.end_bytes = 0
+        self.peak_bytes = 0
+        self._observed_peak = 0
+        self._started_tracing = False
+
+    def _observe(self, peak: int) -> None:
+        self._observed_peak = max(self._observed_peak, peak)
+
+    def __enter__(self) -> "PeakMemoryTracker":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        current, peak = tracemalloc.get_traced_memory()
+        for tracker in _active_trackers:
+            tracker._observe(peak)
+        _reset_peak()
+
+        self.start_bytes = current
+        self._observed_peak = current
+        _active_trackers.append(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self._observe(peak)
+        _active_trackers.remove(self)
+        for tracker in _active_trackers:
+            tracker._observe(self._observed_peak)
+
+        self.end_bytes = current
+        self.peak_bytes = self._observed_peak - self.start_bytes
+        if self._started_tracing:
+            tracemalloc.stop()
+
+
+def track_peak_memory() -> PeakMemoryTracker:
+    """
+    Create a context manager that measures peak memory of a block.
+
+    Returns:
+        PeakMemoryTracker to be used in a ``with`` statement
+    """
+    return PeakMemoryTracker()
+
+
+def _shape(value: Any) -> Tuple[Optional[int], Optional[int]]:
+    """Rows and columns of a DataFrame or a tuple of DataFrames."""
+    if isinstance(value, tuple):
+        shapes = [_shape(item) for item in value]
+        if shapes and all(rows is not None for rows, _ in shapes):
+            return (
+                sum(rows for rows, _ in shapes),
+                sum(columns or 0 for _, columns in shapes),
+            )
+        return None, None
+    shape = getattr(value, "shape", None)
+    if shape is None:
+        return None, None
+    return shape[0], (shape[1] if len(shape) > 1 else 1)
+
+
+class StageProfiler:
+    """
+    Collector of per-stage profiling records.
+
+    Pass a profiler to ``preprocess_data`` or ``engineer_all_features`` (or
+    to ``run_stage`` directly) and every stage adds one record with:
+
+    - ``stage``: stage name
+    - ``wall_seconds``: elapsed wall-clock time
+    - ``cpu_seconds``: CPU time of this process (work done in worker
+      processes of a parallel stage is not included)
+    - ``peak_memory_bytes``: peak traced memory above the stage start (None
+      if memory is not measured)
+    - ``rows_in``/``columns_in`` and ``rows_out``/``columns_out``: shape of
+      the stage input and output
+
+    Attributes:
+        records: Records of the stages run so far, in order
+        measure_memory: Whether stages run under tracemalloc, which slows
+            allocation-heavy stages down
+        hooks: Callables invoked with each record as soon as a stage finishes
+    """
+
+    def __init__(
+        self,
+        measure_memory: bool = True,
+        hooks: Optional[Iterable[Callable[[Dict[str, Any]], None]]] = None,
+    ) -> None:
+        self.records: List[Dict[str, Any]] = []
+        self.measure_memory = measure_memory
+        self.hooks = list(hooks or [])
+
+    def run(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        df: Any,
+        measure_memory: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run one stage and record its profile.
+
+        Args:
+            name: Stage name
+            func: Stage function taking ``df`` as its first argument
+            df: Stage input
+            measure_memory: Override of the profiler-wide setting
+            **kwargs: Extra keyword arguments for the stage function
+
+        Returns:
+            Result of the stage
+        """
+        if measure_memory is None:
+            measure_memory = self.measure_memory
+        rows_in, columns_in = _shape(df)
+
+        tracker = track_peak_memory() if measure_memory else None
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        if tracker is None:
+            result = func(df, **kwargs)
+        else:
+            with tracker:
+                result = func(df, **kwargs)
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+
+        rows_out, columns_out = _shape(result)
+        record = {
+            "stage": name,
+            "wall_seconds": wall_seconds,
+            "cpu_seconds": cpu_seconds,
+            "peak_memory_bytes": None if tracker is None else tracker.peak_bytes,
+            "rows_in": rows_in,
+            "columns_in": columns_in,
+            "rows_out": rows_out,
+            "columns_out": columns_out,
+        }
+        self.records.append(record)
+        for hook in self.hooks:
+            hook(record)
+        return result
+
+    def write_jsonl(self, path: Union[str, Path], append: bool = True) -> Path:
+        """
+        Export the records as JSON lines (see write_jsonl).
+
+        Args:
+            path: Destination file
+            append: Append to an existing file instead of replacing it
+
+        Returns:
+            Path of the written file
+        """
+        return write_jsonl(self.records, path, append=append)
+
+    def summary(self) -> str:
+        """
+        Format the records as a plain-text table (see format_summary).
+
+        Returns:
+            Summary table
+        """
+        return format_summary(self.records)
+
+
+def write_jsonl(
+    records: Iterable[Dict[str, Any]], path: Union[str, Path], append: bool = True
+) -> Path:
+    """
+    Write profiling records as JSON lines, one record per line.
+
+    Appending lets a nightly job accumulate one run after another in the same
+    file.
+
+    Args:
+        records: Profiling records
+        path: Destination file
+        append: Append to an existing file instead of replacing it
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a" if append else "w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record) + "\n")
+    return path
+
+
+def read_jsonl(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """
+    Read profiling records written by write_jsonl.
+
+    Args:
+        path: JSON lines file
+
+    Returns:
+        List of records
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def _format_count(value: Optional[int]) -> str:
+    """Format a row or column count for the summary table."""
+    return "-" if value is None else f"{value:,}"
+
+
+def format_summary(records: Iterable[Dict[str, Any]]) -> str:
+    """
+    Format profiling records as a plain-text table with a total row.
+
+    Args:
+        records: Profiling records
+
+    Returns:
+        Summary table
+    """
+    records = list(records)
+    header = ("stage", "wall s", "cpu s", "peak MB", "rows in", "rows out", "cols")
+    rows = []
+    for record in records:
+        peak = record["peak_memory_bytes"]
+        rows.append(
+            (
+                record["stage"],
+                f"{record['wall_seconds']:.4f}",
+                f"{record['cpu_seconds']:.4f}",
+                "-" if peak is None else f"{peak / 1024**2:.1f}",
+                _format_count(record["rows_in"]),
+                _format_count(record["rows_out"]),
+                f"{_format_count(record['columns_in'])} -> "
+                f"{_format_count(record['columns_out'])}",
+            )
+        )
+    peaks = [r["peak_memory_bytes"] for r in records if r["peak_memory_bytes"]]
+    rows.append(
+        (
+            "total",
+            f"{sum(r['wall_seconds'] for r in records):.4f}",
+            f"{sum(r['cpu_seconds'] for r in records):.4f}",
+            f"{max(peaks) / 1024**2:.1f}" if peaks else "-",
+            "",
+            "",
+            "",
+        )
+    )
+
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = []
+    for row in [header] + rows:
+        cells = [row[0].ljust(widths[0])]
+        cells += [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])]
+        lines.append("  ".join(cells).rstrip())
+    lines.insert(1, "-" * len(lines[0]))
+    lines.insert(len(lines) - 1, "-" * len(lines[0]))
+    return "\n".join(lines)
+
+
+def run_stage(
+    name: str,
+    func: Callable[..., pd.DataFrame],
+    df: pd.DataFrame,
+    stage_memory: Optional[Dict[str, int]] = None,
+    profiler: Optional[StageProfiler] = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """
+    Run one pipeline stage, optionally recording its peak memory and profile.
+
+    Args:
+        name: Stage name used as the key in ``stage_memory`` and the profile
+        func: Stage function taking a DataFrame as its first argument
+        df: Input DataFrame
+        stage_memory: Dictionary receiving the peak memory (bytes) of the
+            stage; memory is not traced if None
+        profiler: StageProfiler receiving a record for the stage; nothing is
+            measured if None
+        **kwargs: Extra keyword arguments for the stage function
+
+    Returns:
+        DataFrame returned by the stage
+    """
+    if profiler is not None:
+        measure_memory = profiler.measure_memory or stage_memory is not None
+        result = profiler.run(name, func, df, measure_memory, **kwargs)
+        if stage_memory is not None:
+            stage_memory[name] = profiler.records[-1]["peak_memory_bytes"]
+        return result
+
+    if stage_memory is None:
+        return func(df, **kwargs)
+
+    with track_peak_memory() as tracker:
+        result = func(df, **kwargs)
+    stage_memory[name] = tracker.peak_bytes
+    return result
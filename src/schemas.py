@@ -0,0 +1,271 @@
+"""
+Schemas Module
+
+This module declares the columns and storage dtypes of the three raw NBA
+sources. The schemas drive column pruning and typed parsing in
+``load_nba_data``: columns that are not declared (such as the empty ``blanl``
+and ``blank2`` columns or the ``Unnamed: 0`` index) are never read, low
+cardinality strings become categoricals and numeric columns use float32 or
+int16 storage.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Text columns with many distinct values are kept as plain strings.
+TEXT = "str"
+CATEGORY = "category"
+FLOAT = "float32"
+SMALL_INT = "int16"
+
+# Strings pandas.read_csv reads as missing by default
+CSV_NA_VALUES = frozenset(
+    [
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    ]
+)
+
+PLAYER_DATA_SCHEMA: Dict[str, str] = {
+    "name": TEXT,
+    "year_start": SMALL_INT,
+    "year_end": SMALL_INT,
+    "position": CATEGORY,
+    "height": CATEGORY,
+    "weight": FLOAT,
+    "birth_date": TEXT,
+    "college": CATEGORY,
+}
+
+SEASONS_STATS_SCHEMA: Dict[str, str] = {
+    "Year": SMALL_INT,
+    "Player": TEXT,
+    "Pos": CATEGORY,
+    "Age": FLOAT,
+    "Tm": CATEGORY,
+    "G": FLOAT,
+    "GS": FLOAT,
+    "MP": FLOAT,
+    "PER": FLOAT,
+    "TS%": FLOAT,
+    "3PAr": FLOAT,
+    "FTr": FLOAT,
+    "ORB%": FLOAT,
+    "DRB%": FLOAT,
+    "TRB%": FLOAT,
+    "AST%": FLOAT,
+    "STL%": FLOAT,
+    "BLK%": FLOAT,
+    "TOV%": FLOAT,
+    "USG%": FLOAT,
+    "OWS": FLOAT,
+    "DWS": FLOAT,
+    "WS": FLOAT,
+    "WS/48": FLOAT,
+    "OBPM": FLOAT,
+    "DBPM": FLOAT,
+    "BPM": FLOAT,
+    "VORP": FLOAT,
+    "FG": FLOAT,
+    "FGA": FLOAT,
+    "FG%": FLOAT,
+    "3P": FLOAT,
+    "3PA": FLOAT,
+    "3P%": FLOAT,
+    "2P": FLOAT,
+    "2PA": FLOAT,
+    "2P%": FLOAT,
+    "eFG%": FLOAT,
+    "FT": FLOAT,
+    "FTA": FLOAT,
+    "FT%": FLOAT,
+    "ORB": FLOAT,
+    "DRB": FLOAT,
+    "TRB": FLOAT,
+    "AST": FLOAT,
+    "STL": FLOAT,
+    "BLK": FLOAT,
+    "TOV": FLOAT,
+    "PF": FLOAT,
+    "PTS": FLOAT,
+}
+
+ALL_STAR_SCHEMA: Dict[str, str] = {
+    "Year": SMALL_INT,
+    "Player": TEXT,
+    "Pos": CATEGORY,
+    "HT": CATEGORY,
+    "WT": FLOAT,
+    "Team": CATEGORY,
+    "Selection Type": CATEGORY,
+    "NBA Draft Status": TEXT,
+    "Nationality": CATEGORY,
+}
+
+# Rows missing any of these columns carry no information (Seasons_Stats.csv
+# contains blank separator rows) and are dropped while loading.
+REQUIRED_COLUMNS: Dict[str, List[str]] = {
+    "player_data": ["name"],
+    "seasons_stats": ["Year", "Player"],
+    "all_star": ["Year", "Player"],
+}
+
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    "player_data": PLAYER_DATA_SCHEMA,
+    "seasons_stats": SEASONS_STATS_SCHEMA,
+    "all_star": ALL_STAR_SCHEMA,
+}
+
+
+def csv_read_options(
+    schema: Dict[str, str],
+    header: Iterable[str],
+    columns: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Build pd.read_csv options for a schema.
+
+    Integer columns are parsed as float32 because CSV parsing cannot store
+    missing values in integer columns; ``apply_schema`` narrows them afterwards.
+
+    Args:
+        schema: Mapping of column name to storage dtype
+        header: Column names present in the CSV file
+        columns: Optional subset of schema columns to read
+
+    Returns:
+        Dictionary with ``usecols`` and ``dtype`` entries
+    """
+    wanted = set(schema) if columns is None else set(columns) & set(schema)
+    usecols = [col for col in header if col in wanted]
+    dtype = {
+        col: (FLOAT if schema[col] == SMALL_INT else schema[col]) for col in usecols
+    }
+    return {"usecols": usecols, "dtype": dtype}
+
+
+def apply_schema(
+    df: pd.DataFrame,
+    schema: Dict[str, str],
+    required: Optional[List[str]] = None,
+    copy: bool = True,
+) -> pd.DataFrame:
+    """
+    Coerce a loaded DataFrame to the storage dtypes of a schema.
+
+    Numeric columns are coerced with ``errors="coerce"`` so that stray text
+    values become NaN. Integer columns are narrowed to int16 when they have no
+    missing values and fit the int16 range; otherwise they stay float32.
+
+    Args:
+        df: DataFrame read from a raw source
+        schema: Mapping of column name to storage dtype
+        required: Columns whose missing values mark a row as empty
+        copy: Work on a copy of ``df``; if False, ``df`` is modified in place
+
+    Returns:
+        DataFrame with schema dtypes applied
+    """
+    if copy:
+        df = df.copy()
+    if required:
+        present = [col for col in required if col in df.columns]
+        if present:
+            df = df.dropna(subset=present, how="all")
+
+    info = np.iinfo(np.int16)
+    for col in df.columns:
+        target = schema.get(col)
+        if target in (FLOAT, SMALL_INT):
+            values = df[col]
+            if not pd.api.types.is_numeric_dtype(values):
+                values = pd.to_numeric(values, errors="coerce")
+            values = values.astype(FLOAT)
+            if (
+                target == SMALL_INT
+                and not values.isna().any()
+                and (
+                    values.empty
+                    or (values.min() >= info.min and values.max() <= info.max)
+                )
+                and (values == np.round(values)).all()
+            ):
+                values = values.astype(SMALL_INT)
+            df[col] = values
+        elif target == CATEGORY and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(CATEGORY)
+
+    return df
+
+
+def dataframe_memory_mb(df: pd.DataFrame) -> float:
+    """
+    Compute the deep memory usage of a DataFrame.
+
+    Args:
+        df: Input DataFrame
+
+    Returns:
+        Memory usage in megabytes
+    """
+    return float(df.memory_usage(deep=True).sum()) / (1024**2)
+
+
+def memory_report(
+    before: Dict[str, pd.DataFrame], after: Dict[str, pd.DataFrame]
+) -> pd.DataFrame:
+    """
+    Compare the memory footprint of untyped and schema-typed frames.
+
+    Args:
+        before: Mapping of source name to DataFrame loaded without a schema
+        after: Mapping of source name to DataFrame loaded with a schema
+
+    Returns:
+        DataFrame indexed by source with before/after sizes in MB, the
+        reduction ratio and column counts
+    """
+    rows = []
+    for name in before:
+        before_mb = dataframe_memory_mb(before[name])
+        after_mb = dataframe_memory_mb(after[name]) if name in after else np.nan
+        rows.append(
+            {
+                "source": name,
+                "columns_before": before[name].shape[1],
+                "columns_after": after[name].shape[1] if name in after else np.nan,
+                "memory_before_mb": before_mb,
+                "memory_after_mb": after_mb,
+                "reduction": 1 - after_mb / before_mb if before_mb else np.nan,
+            }
+        )
+
+    report = pd.DataFrame(rows).set_index("source")
+    if not report.empty:
+        report.loc["total"] = [
+            report["columns_before"].sum(),
+            report["columns_after"].sum(),
+            report["memory_before_mb"].sum(),
+            report["memory_after_mb"].sum(),
+            1 - report["memory_after_mb"].sum() / report["memory_before_mb"].sum(),
+        ]
+    return report
@@ -0,0 +1,155 @@
+"""
+Scoring Module
+
+This module scores player-seasons with a fitted classifier and selects the
+predicted All-Stars of every season. Each season has a fixed number of
+All-Star slots, so instead of a probability threshold the top-K players of a
+season are selected.
+
+All seasons are scored with a single ``predict_proba`` call, and the top-K
+of each season is found with a partial selection (``np.argpartition``),
+which runs in linear time instead of sorting the season.
+"""
+
+from typing import Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.feature_engineering import select_modeling_features
+
+# All-Star roster size used by the notebook analysis
+ALL_STAR_SLOTS = 24
+
+# Identifier columns copied to the scoring output when present
+SCORE_ID_COLUMNS = ["PlayerName", "player_id", "Year", "Pos", "Tm"]
+
+
+def top_k_mask(scores: np.ndarray, k: int = ALL_STAR_SLOTS) -> np.ndarray:
+    """
+    Mark the ``k`` highest scores.
+
+    Ties at the cut-off are broken in favour of the earlier position, so the
+    result is deterministic and exactly ``min(k, n)`` entries are selected.
+    NaN scores rank below every other score.
+
+    Args:
+        scores: 1-D array of scores
+        k: Number of entries to select
+
+    Returns:
+        Boolean array, True for the selected entries
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    n = len(scores)
+    selected = np.zeros(n, dtype=bool)
+    if k <= 0 or n == 0:
+        return selected
+    if k >= n:
+        selected[:] = True
+        return selected
+
+    values = np.where(np.isnan(scores), -np.inf, scores)
+    # Value of the k-th largest score
+    cutoff = values[np.argpartition(values, n - k)[n - k]]
+    above = values > cutoff
+    selected[above] = True
+
+    # Fill the remaining slots with the first entries tied at the cut-off
+    remaining = k - int(above.sum())
+    tied = np.flatnonzero(values == cutoff)
+    selected[tied[:remaining]] = True
+    return selected
+
+
+def top_k_per_group(
+    scores: np.ndarray, groups: np.ndarray, k: int = ALL_STAR_SLOTS
+) -> np.ndarray:
+    """
+    Mark the ``k`` highest scores within every group.
+
+    Args:
+        scores: 1-D array of scores
+        groups: Group label of each score (e.g. the season)
+        k: Number of entries to select per group
+
+    Returns:
+        Boolean array, True for the selected entries
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    selected = np.zeros(len(scores), dtype=bool)
+    for positions in pd.Series(groups).groupby(groups, sort=False).indices.values():
+        selected[positions[top_k_mask(scores[positions], k)]] = True
+    return selected
+
+
+def predict_scores(model: Any, X: pd.DataFrame, scaler: Any = None) -> np.ndarray:
+    """
+    Score a feature matrix with a fitted classifier.
+
+    Args:
+        model: Fitted classifier with ``predict_proba`` (or
+            ``decision_function``)
+        X: Feature matrix
+        scaler: Fitted transformer applied to ``X`` first (e.g. the
+            StandardScaler used for logistic regression)
+
+    Returns:
+        1-D array of All-Star scores (positive-class probabilities)
+    """
+    if scaler is not None:
+        X = scaler.transform(X)
+    if hasattr(model, "predict_proba"):
+        return np.asarray(model.predict_proba(X))[:, 1]
+    return np.asarray(model.decision_function(X))
+
+
+def score_seasons(
+    model: Any,
+    df: pd.DataFrame,
+    features: Optional[List[str]] = None,
+    k: int = ALL_STAR_SLOTS,
+    scaler: Any = None,
+    season_column: str = "Year",
+) -> pd.DataFrame:
+    """
+    Score every player-season and select the top-K players of each season.
+
+    Args:
+        model: Fitted classifier
+        df: Engineered DataFrame with one or more seasons
+        features: Model features (select_modeling_features() if None)
+        k: All-Star slots per season
+        scaler: Fitted transformer applied to the features before scoring
+        season_column: Column identifying the season
+
+    Returns:
+        DataFrame aligned with ``df`` holding the identifier columns present
+        in ``df``, ``all_star_probability``, ``predicted_all_star`` (0/1) and
+        ``season_rank`` (1 for the top score of a season; NaN outside the
+        top-K)
+    """
+    if features is None:
+        features = select_modeling_features()
+
+    scores = predict_scores(model, df[features], scaler)
+    seasons = df[season_column].to_numpy()
+    selected = top_k_per_group(scores, seasons, k)
+
+    result = df[[col for col in SCORE_ID_COLUMNS if col in df.columns]].copy()
+    if "is_all_star" in df.columns:
+        result["is_all_star"] = df["is_all_star"]
+    result["all_star_probability"] = scores
+    result["predicted_all_star"] = selected.astype(np.int8)
+
+    # Only the selected rows are ranked, so the sort is over k rows per season
+    positions = np.flatnonzero(selected)
+    season_rank = np.full(len(df), np.nan)
+    season_rank[positions] = (
+        pd.Series(scores[positions])
+        .groupby(seasons[positions])
+        .rank(method="first", ascending=False)
+        .to_numpy()
+    )
+    result["season_rank"] = season_rank
+    return result
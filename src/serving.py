@@ -0,0 +1,478 @@
+"""
+Prediction Server Module
+
+This module serves All-Star probabilities over HTTP on the local machine. The
+fitted model and scaler are loaded once at start-up, and concurrent requests
+are grouped into micro-batches so that one vectorised ``predict_proba`` call
+answers many requests.
+
+Endpoints:
+    POST /predict   {"instances": [{feature: value, ...}, ...]}
+                    -> {"probabilities": [...]}
+    GET  /metrics   latency percentiles and batch-size statistics
+    GET  /health    {"status": "ok"}
+
+Usage:
+    python -m src.serving --model models/all_star.joblib --port 8000
+"""
+
+import argparse
+import json
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from src.artifacts import load_artifacts
+from src.feature_engineering import select_modeling_features
+from src.scoring import predict_scores
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 2.0
+
+# Number of recent requests kept for the latency percentiles
+LATENCY_WINDOW = 10_000
+
+
+def save_model_bundle(
+    path: Union[str, Path],
+    model: Any,
+    scaler: Any = None,
+    features: Optional[List[str]] = None,
+) -> Path:
+    """
+    Save a fitted model with its scaler and feature list.
+
+    Args:
+        path: Destination file
+        model: Fitted classifier
+        scaler: Fitted transformer applied before the model (optional)
+        features: Model features, in training order
+            (select_modeling_features() if None)
+
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if features is None:
+        features = select_modeling_features()
+    joblib.dump({"model": model, "scaler": scaler, "features": list(features)}, path)
+    return path
+
+
+def load_model_bundle(
+    path: Union[str, Path], model_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Load a model bundle written by save_model_bundle.
+
+    ``path`` can also be an artifact directory written by
+    src.artifacts.save_artifacts, whose arrays are memory-mapped.
+
+    Args:
+        path: Bundle file or artifact directory
+        model_name: Model to serve from an artifact directory (required if
+            it holds several models)
+
+    Returns:
+        Dictionary with "model", "scaler" and "features"
+
+    Raises:
+        ValueError: If an artifact directory holds several models and no
+            model_name is given
+    """
+    if Path(path).is_dir():
+        artifacts = load_artifacts(path, None if model_name is None else [model_name])
+        if len(artifacts.models) != 1:
+            raise ValueError(f"Choose a model to serve from {sorted(artifacts.models)}")
+        (model,) = artifacts.models.values()
+        return {
+            "model": model,
+            "scaler": artifacts.scaler,
+            "features": artifacts.features,
+        }
+
+    bundle = joblib.load(path)
+    bundle.setdefault("scaler", None)
+    if bundle.get("features") is None:
+        bundle["features"] = select_modeling_features()
+    return bundle
+
+
+def instances_to_frame(
+    instances: List[Dict[str, Any]], features: List[str]
+) -> pd.DataFrame:
+    """
+    Build a feature matrix from request instances.
+
+    Args:
+        instances: One mapping of feature name to value per player-season
+        features: Model features, in training order
+
+    Returns:
+        Float64 DataFrame with one column per feature
+
+    Raises:
+        ValueError: If an instance is not a mapping, lacks a feature or has
+            a null or non-finite value
+    """
+    for number, instance in enumerate(instances):
+        if not isinstance(instance, dict):
+            raise ValueError(f"Instance {number} is not an object")
+        missing = [name for name in features if name not in instance]
+        if missing:
+            raise ValueError(f"Instance {number} is missing features: {missing}")
+    values = [[instance[name] for name in features] for instance in instances]
+    frame = pd.DataFrame(values, columns=features, dtype=np.float64)
+    finite = np.isfinite(frame.to_numpy())
+    if not finite.all():
+        number, column = np.argwhere(~finite)[0]
+        raise ValueError(
+            f"Instance {number} has a null or non-finite value for "
+            f"{features[column]}"
+        )
+    return frame
+
+
+class ServingMetrics:
+    """
+    Thread-safe request latency and batch-size statistics.
+
+    Attributes:
+        requests: Number of answered requests
+        errors: Number of failed requests
+        batches: Number of model calls
+        instances: Number of scored instances
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._batch_sizes: Counter = Counter()
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.instances = 0
+
+    def record_request(self, seconds: float, ok: bool = True) -> None:
+        """Record the latency of one request."""
+        with self._lock:
+            self._latencies.append(seconds)
+            self.requests += 1
+            if not ok:
+                self.errors += 1
+
+    def record_batch(self, requests: int, instances: int) -> None:
+        """Record one model call over ``requests`` grouped requests."""
+        with self._lock:
+            self._batch_sizes[requests] += 1
+            self.batches += 1
+            self.instances += instances
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current statistics.
+
+        Returns:
+            Dictionary with request counts, latency percentiles in
+            milliseconds over the recent requests, and the batch-size
+            histogram (requests per model call)
+        """
+        with self._lock:
+            latencies = np.array(self._latencies) * 1000.0
+            histogram = dict(sorted(self._batch_sizes.items()))
+            batches, instances = self.batches, self.instances
+            requests, errors = self.requests, self.errors
+
+        if len(latencies):
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+            latency = {
+                "p50": p50,
+                "p95": p95,
+                "p99": p99,
+                "max": latencies.max(),
+            }
+        else:
+            latency = {"p50": None, "p95": None, "p99": None, "max": None}
+        grouped = sum(size * count for size, count in histogram.items())
+        return {
+            "requests": requests,
+            "errors": errors,
+            "batches": batches,
+            "instances": instances,
+            "mean_batch_requests": grouped / batches if batches else None,
+            "batch_requests_histogram": {str(k): v for k, v in histogram.items()},
+            "latency_ms": {
+                k: None if v is None else float(v) for k, v in latency.items()
+            },
+        }
+
+
+class MicroBatcher:
+    """
+    Group concurrent prediction requests into one model call.
+
+    A worker thread takes the first waiting request, then keeps collecting
+    requests until ``max_batch_size`` requests are grouped or ``max_wait_ms``
+    has passed, and scores them with a single call of ``predict``. If that
+    call fails, every request of the batch is scored on its own, so only the
+    requests that fail by themselves receive the error.
+
+    Attributes:
+        max_batch_size: Maximum requests per model call
+        max_wait_ms: Longest time the first request of a batch waits for others
+        metrics: ServingMetrics receiving a record per batch
+    """
+
+    def __init__(
+        self,
+        predict: Callable[[pd.DataFrame], np.ndarray],
+        features: List[str],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        metrics: Optional[ServingMetrics] = None,
+    ) -> None:
+        self.predict = predict
+        self.features = list(features)
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self.metrics = metrics if metrics is not None else ServingMetrics()
+        self._queue: "queue.Queue[Optional[Tuple[pd.DataFrame, Future]]]" = (
+            queue.Queue()
+        )
+        self._worker = threading.Thread(
+            target=self._run, name="micro-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, instances: List[Dict[str, Any]]) -> "Future[np.ndarray]":
+        """
+        Queue instances for scoring.
+
+        Args:
+            instances: One mapping of feature name to value per player-season
+
+        Returns:
+            Future resolving to the probabilities of the instances
+
+        Raises:
+            ValueError: If an instance lacks a model feature
+        """
+        frame = instances_to_frame(instances, self.features)
+        future: "Future[np.ndarray]" = Future()
+        self._queue.put((frame, future))
+        return future
+
+    def predict_instances(
+        self, instances: List[Dict[str, Any]], timeout: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Score instances and wait for the result.
+
+        Args:
+            instances: One mapping of feature name to value per player-season
+            timeout: Seconds to wait for the result (no limit if None)
+
+        Returns:
+            Probabilities of the instances
+        """
+        return self.submit(instances).result(timeout)
+
+    def _collect(self, first: Tuple[pd.DataFrame, Future]) -> List[Any]:
+        """Group requests that arrive within the wait window."""
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is None:
+                # Let the worker loop see the stop signal after this batch
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        """Worker loop: score one micro-batch at a time."""
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+            frames = [frame for frame, _ in batch]
+            sizes = [len(frame) for frame in frames]
+            try:
+                scores = np.asarray(self.predict(pd.concat(frames, ignore_index=True)))
+            except Exception as error:  # noqa: BLE001 - reported to the callers
+                if len(batch) == 1:
+                    batch[0][1].set_exception(error)
+                else:
+                    self._score_each(batch)
+                continue
+            self.metrics.record_batch(len(batch), sum(sizes))
+            offsets = np.cumsum([0] + sizes)
+            for (_, future), start, stop in zip(batch, offsets[:-1], offsets[1:]):
+                future.set_result(scores[start:stop])
+
+    def _score_each(self, batch: List[Tuple[pd.DataFrame, Future]]) -> None:
+        """Score the requests of a failed batch one at a time."""
+        for frame, future in batch:
+            try:
+                scores = np.asarray(self.predict(frame))
+            except Exception as error:  # noqa: BLE001 - reported to the caller
+                future.set_exception(error)
+                continue
+            self.metrics.record_batch(1, len(frame))
+            future.set_result(scores)
+
+    def close(self) -> None:
+        """Stop the worker thread after the queued requests are scored."""
+        self._queue.put(None)
+        self._worker.join()
+
+
+def _handler_class(batcher: MicroBatcher, timeout: float) -> type:
+    """Build a request handler bound to a batcher."""
+
+    class PredictionHandler(BaseHTTPRequestHandler):
+        """HTTP handler for the prediction endpoints."""
+
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            """Silence the per-request access log."""
+
+        def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            if self.path == "/health":
+                self._send_json(200, {"status": "ok"})
+            elif self.path == "/metrics":
+                self._send_json(200, batcher.metrics.snapshot())
+            else:
+                self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+        def do_POST(self) -> None:
+            if self.path != "/predict":
+                self._send_json(404, {"error": f"Unknown path {self.path}"})
+                return
+            start = time.perf_counter()
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                instances = (
+                    payload.get("instances") if isinstance(payload, dict) else None
+                )
+                if not isinstance(instances, list):
+                    raise ValueError('Expected {"instances": [...]}')
+                probabilities = batcher.predict_instances(instances, timeout)
+            except ValueError as error:
+                batcher.metrics.record_request(time.perf_counter() - start, ok=False)
+                self._send_json(400, {"error": str(error)})
+                return
+            except Exception as error:  # noqa: BLE001 - reported to the client
+                batcher.metrics.record_request(time.perf_counter() - start, ok=False)
+                self._send_json(500, {"error": str(error)})
+                return
+            batcher.metrics.record_request(time.perf_counter() - start)
+            self._send_json(200, {"probabilities": probabilities.tolist()})
+
+    return PredictionHandler
+
+
+def create_server(
+    bundle: Dict[str, Any],
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    timeout: float = 30.0,
+) -> Tuple[ThreadingHTTPServer, MicroBatcher]:
+    """
+    Create a prediction server for a loaded model bundle.
+
+    Call ``serve_forever()`` on the server to start answering requests, and
+    ``shutdown()``, ``server_close()`` and ``batcher.close()`` to stop.
+
+    Args:
+        bundle: Output of load_model_bundle
+        host: Interface to listen on
+        port: Port to listen on (0 picks a free port)
+        max_batch_size: Maximum requests per model call
+        max_wait_ms: Longest time a request waits for others to join its batch
+        timeout: Seconds a request waits for its result
+
+    Returns:
+        Tuple of (HTTP server, micro-batcher)
+    """
+    model, scaler = bundle["model"], bundle["scaler"]
+
+    def predict(X: pd.DataFrame) -> np.ndarray:
+        return predict_scores(model, X, scaler)
+
+    batcher = MicroBatcher(predict, bundle["features"], max_batch_size, max_wait_ms)
+    server = ThreadingHTTPServer((host, port), _handler_class(batcher, timeout))
+    server.daemon_threads = True
+    return server, batcher
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the prediction server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--model", required=True, help="model bundle file or artifact directory"
+    )
+    parser.add_argument(
+        "--model-name", default=None, help="model to serve from an artifact directory"
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT_MS)
+    args = parser.parse_args(argv)
+
+    server, batcher = create_server(
+        load_model_bundle(args.model, args.model_name),
+        args.host,
+        args.port,
+        args.max_batch_size,
+        args.max_wait_ms,
+    )
+    host, port = server.server_address[:2]
+    print(f"Serving predictions on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,434 @@
+"""
+SQL Backend Module
+
+This module runs the merge and cleaning stages on an embedded SQLite
+database instead of in pandas, so the raw tables never have to fit in memory
+together. The raw CSVs are streamed into local tables with indexes on the
+normalised player name and the season, and the season filter, the joins, the
+numeric coercion and the shooting-percentage back-fill run as one SQL query.
+Only the planned columns of the final rows are returned to pandas.
+
+The result equals ``clean_missing_values(merge_datasets(...))`` on the
+same columns, including the ``player_id`` values and the row order.
+"""
+
+import csv
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.data_cache import source_digest
+from src.data_processing import (
+    ADVANCED_STAT_COLUMNS,
+    DEFAULT_SEASON_WINDOW,
+    PERCENTAGE_COLUMNS,
+    PERCENTAGE_INPUTS,
+    TEXT_FILL_COLUMNS,
+)
+from src.planner import plan_pipeline, run_plan_stages
+from src.profiling import StageProfiler, run_stage
+from src.schemas import (
+    CSV_NA_VALUES,
+    FLOAT,
+    REQUIRED_COLUMNS,
+    SCHEMAS,
+    SMALL_INT,
+    TEXT,
+    apply_schema,
+)
+
+# Column of every table holding the normalised player name
+PLAYER_KEY = "player_key"
+
+# Raw player name column per source
+NAME_COLUMNS = {"player_data": "name", "seasons_stats": "Player", "all_star": "Player"}
+
+SOURCES_TABLE = "ingested_sources"
+INGEST_CHUNK_ROWS = 50_000
+
+
+def _quote(name: str) -> str:
+    """Quote an SQL identifier (column names contain '%' and '/')."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _affinity(dtype: str) -> str:
+    """SQLite column affinity of a schema dtype."""
+    if dtype == FLOAT:
+        return "REAL"
+    if dtype == SMALL_INT:
+        return "INTEGER"
+    return "TEXT"
+
+
+def _normalize_name(name: Optional[str]) -> Optional[str]:
+    """Same normalisation as normalize_player_names."""
+    return None if name is None else " ".join(name.split())
+
+
+def _csv_rows(
+    path: str, source: str
+) -> Tuple[List[str], Iterator[List[Optional[str]]]]:
+    """Schema columns of a CSV and an iterator over their values."""
+    schema = SCHEMAS[source]
+    handle = open(path, newline="", encoding="utf-8")
+    reader = csv.reader(handle)
+    header = next(reader, [])
+    positions = [i for i, col in enumerate(header) if col in schema]
+    columns = [header[i] for i in positions]
+    required = [
+        columns.index(col) for col in REQUIRED_COLUMNS.get(source, []) if col in columns
+    ]
+    name_position = columns.index(NAME_COLUMNS[source])
+
+    def rows() -> Iterator[List[Optional[str]]]:
+        with handle:
+            for record in reader:
+                values = [
+                    (
+                        None
+                        if i >= len(record) or record[i] in CSV_NA_VALUES
+                        else record[i]
+                    )
+                    for i in positions
+                ]
+                if required and all(values[i] is None for i in required):
+                    continue
+                values.append(_normalize_name(values[name_position]))
+                yield values
+
+    return columns, rows()
+
+
+def _ingest_csv(
+    conn: sqlite3.Connection, path: str, source: str, chunk_rows: int
+) -> None:
+    """Stream one raw CSV into a table with typed columns and indexes."""
+    schema = SCHEMAS[source]
+    columns, rows = _csv_rows(path, source)
+    table = _quote(source)
+    definitions = [f"{_quote(col)} {_affinity(schema[col])}" for col in columns]
+    definitions.append(f"{PLAYER_KEY} TEXT")
+
+    conn.execute(f"DROP TABLE IF EXISTS {table}")
+    conn.execute(f"CREATE TABLE {table} ({', '.join(definitions)})")
+    insert = f"INSERT INTO {table} VALUES ({', '.join('?' * (len(columns) + 1))})"
+    batch = []
+    for values in rows:
+        batch.append(values)
+        if len(batch) >= chunk_rows:
+            conn.executemany(insert, batch)
+            batch = []
+    if batch:
+        conn.executemany(insert, batch)
+
+    conn.execute(f"CREATE INDEX {_quote(source + '_player')} ON {table} ({PLAYER_KEY})")
+    if "Year" in columns:
+        conn.execute(
+            f"CREATE INDEX {_quote(source + '_year')} ON {table} (Year, {PLAYER_KEY})"
+        )
+
+
+def ingest_sources(
+    db_path: Union[str, Path],
+    player_data_path: str,
+    seasons_stats_path: str,
+    all_star_path: str,
+    chunk_rows: int = INGEST_CHUNK_ROWS,
+) -> List[str]:
+    """
+    Load the raw CSVs into an SQLite database, skipping unchanged sources.
+
+    Only the columns declared in src.schemas are stored. Values pandas reads
+    as missing are stored as NULL, and rows missing every required column are
+    skipped, as in load_nba_data.
+
+    Args:
+        db_path: SQLite database file (created if missing)
+        player_data_path: Path to player demographic data CSV
+        seasons_stats_path: Path to season statistics CSV
+        all_star_path: Path to All-Star selections CSV
+        chunk_rows: Rows inserted per batch
+
+    Returns:
+        Names of the sources that were (re)loaded
+    """
+    paths = {
+        "player_data": player_data_path,
+        "seasons_stats": seasons_stats_path,
+        "all_star": all_star_path,
+    }
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    loaded = []
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {SOURCES_TABLE} (source TEXT PRIMARY KEY, "
+            "path TEXT, size INTEGER, mtime_ns INTEGER, sha256 TEXT)"
+        )
+        stored = {
+            row[0]: row[1:]
+            for row in conn.execute(f"SELECT * FROM {SOURCES_TABLE}").fetchall()
+        }
+        for source, path in paths.items():
+            key = str(Path(path).resolve())
+            manifest = {}
+            previous = None
+            if source in stored and stored[source][0] == key:
+                size, mtime_ns, previous = stored[source][1:]
+                manifest[key] = {"size": size, "mtime_ns": mtime_ns, "sha256": previous}
+            digest, _ = source_digest(Path(path), manifest)
+            if digest != previous:
+                _ingest_csv(conn, path, source, chunk_rows)
+                loaded.append(source)
+            entry = manifest[key]
+            conn.execute(
+                f"INSERT OR REPLACE INTO {SOURCES_TABLE} VALUES (?, ?, ?, ?, ?)",
+                (source, key, entry["size"], entry["mtime_ns"], digest),
+            )
+    return loaded
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    """Stored raw columns of a table, in file order."""
+    rows = conn.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+    return [row[1] for row in rows if row[1] != PLAYER_KEY]
+
+
+def _numeric(column: str) -> str:
+    """SQL coercing a stored value to a number (NULL for stray text)."""
+    ref = f"s.{_quote(column)}"
+    return f"(CASE WHEN typeof({ref}) IN ('integer', 'real') THEN {ref} END)"
+
+
+def _ratio(terms: Sequence[Tuple[float, str]], denominator: str) -> str:
+    """SQL of (sum of terms) / denominator with float division semantics."""
+    numerator = " + ".join(f"{coef!r} * {_numeric(col)}" for coef, col in terms)
+    denom = _numeric(denominator)
+    # Division by zero gives +/-inf (NaN for 0/0), as in pandas
+    return (
+        f"(CASE WHEN {denom} = 0 THEN CASE WHEN ({numerator}) > 0 THEN 1e999 "
+        f"WHEN ({numerator}) < 0 THEN -1e999 END ELSE ({numerator}) / {denom} END)"
+    )
+
+
+def _window_clause(alias: str, season_window: Optional[Tuple[int, int]]) -> str:
+    """SQL condition of a season window (TRUE for all seasons)."""
+    if season_window is None:
+        return "1"
+    first, last = (int(year) for year in season_window)
+    return f"{alias}.Year BETWEEN {first} AND {last}"
+
+
+def build_merge_query(
+    season_columns: List[str],
+    player_columns: List[str],
+    season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+) -> Tuple[str, List[str]]:
+    """
+    Build the SQL of merge_datasets followed by clean_missing_values.
+
+    Player IDs are numbered in order of first appearance of the normalised
+    name in the season statistics, then the player data, then the All-Star
+    selections, as in build_player_index.
+
+    Args:
+        season_columns: Stored season-statistics columns to return
+        player_columns: Stored player-data columns to return (without name)
+        season_window: Inclusive (first_year, last_year) of seasons to keep
+
+    Returns:
+        Tuple of (query, output column names)
+    """
+    season_schema = SCHEMAS["seasons_stats"]
+    season_window_sql = _window_clause("s", season_window)
+    star_window_sql = _window_clause("a", season_window)
+
+    select = []
+    names = []
+    for col in season_columns:
+        if col == "Player":
+            select.append(f"s.{PLAYER_KEY}")
+            names.append("PlayerName")
+            continue
+        if season_schema[col] in (FLOAT, SMALL_INT):
+            expr = _numeric(col)
+        else:
+            expr = f"s.{_quote(col)}"
+        if col in ADVANCED_STAT_COLUMNS:
+            expr = f"COALESCE({expr}, 0.0)"
+        select.append(expr)
+        names.append(col)
+    select.append("COALESCE(ids.player_id, -1)")
+    names.append("player_id")
+    for col in player_columns:
+        expr = f"p.{_quote(col)}"
+        if col in TEXT_FILL_COLUMNS:
+            expr = f"COALESCE({expr}, '{TEXT_FILL_COLUMNS[col]}')"
+        select.append(expr)
+        names.append(col)
+    select.append("a.star_row IS NOT NULL")
+    names.append("is_all_star")
+
+    # Shooting percentages: back-fill from makes and attempts, then zero.
+    # Percentages missing from the source are appended, as in pandas.
+    for col in PERCENTAGE_COLUMNS:
+        terms, denominator = PERCENTAGE_INPUTS[col]
+        inputs = [term[1] for term in terms] + [denominator]
+        fills = [_numeric(col)] if col in season_columns else []
+        if all(name in season_columns for name in inputs):
+            fills.append(_ratio(terms, denominator))
+        elif col not in season_columns:
+            continue
+        expr = f"COALESCE({', '.join(fills)}, 0.0)"
+        if col in season_columns:
+            select[names.index(col)] = expr
+        else:
+            select.append(expr)
+            names.append(col)
+
+    query = f"""
+        WITH name_order AS (
+            SELECT {PLAYER_KEY}, 0 AS source, MIN(rowid) AS first_row
+            FROM seasons_stats AS s
+            WHERE s.Year IS NOT NULL AND {season_window_sql}
+                AND {PLAYER_KEY} IS NOT NULL
+            GROUP BY {PLAYER_KEY}
+            UNION ALL
+            SELECT {PLAYER_KEY}, 1, MIN(rowid)
+            FROM player_data
+            WHERE {PLAYER_KEY} IS NOT NULL
+            GROUP BY {PLAYER_KEY}
+            UNION ALL
+            SELECT {PLAYER_KEY}, 2, MIN(rowid)
+            FROM all_star AS a
+            WHERE {star_window_sql} AND {PLAYER_KEY} IS NOT NULL
+            GROUP BY {PLAYER_KEY}
+        ),
+        player_ids AS (
+            SELECT {PLAYER_KEY},
+                ROW_NUMBER() OVER (
+                    ORDER BY MIN(source * 4294967296 + first_row)
+                ) - 1 AS player_id
+            FROM name_order
+            GROUP BY {PLAYER_KEY}
+        ),
+        stars AS (
+            SELECT {PLAYER_KEY}, Year, rowid AS star_row
+            FROM all_star AS a
+            WHERE a.Year IS NOT NULL AND {star_window_sql}
+                AND {PLAYER_KEY} IS NOT NULL
+        )
+        SELECT {', '.join(select)}
+        FROM seasons_stats AS s
+        LEFT JOIN player_ids AS ids ON ids.{PLAYER_KEY} = s.{PLAYER_KEY}
+        LEFT JOIN player_data AS p ON p.{PLAYER_KEY} = s.{PLAYER_KEY}
+        LEFT JOIN stars AS a
+            ON a.{PLAYER_KEY} = s.{PLAYER_KEY} AND a.Year = s.Year
+        WHERE s.Year IS NOT NULL AND {season_window_sql}
+        ORDER BY s.rowid, p.rowid, a.star_row
+    """
+    return query, names
+
+
+def merge_and_clean_sql(
+    db_path: Union[str, Path],
+    season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+    columns: Optional[Dict[str, List[str]]] = None,
+) -> pd.DataFrame:
+    """
+    Merge and clean the ingested sources in SQLite.
+
+    Args:
+        db_path: Database written by ingest_sources
+        season_window: Inclusive (first_year, last_year) of seasons to keep
+            (all seasons if None)
+        columns: Raw columns to return per source name ("player_data",
+            "seasons_stats"); sources without an entry return every stored
+            column
+
+    Returns:
+        DataFrame equal to clean_missing_values(merge_datasets(...)) on the
+        returned columns, with the schema dtypes
+    """
+    columns = columns or {}
+    with closing(sqlite3.connect(db_path)) as conn:
+        stored_seasons = _table_columns(conn, "seasons_stats")
+        stored_players = _table_columns(conn, "player_data")
+        wanted_seasons = columns.get("seasons_stats", stored_seasons)
+        wanted_players = columns.get("player_data", stored_players)
+        season_columns = [
+            col
+            for col in stored_seasons
+            if col in wanted_seasons or col in ("Year", "Player")
+        ]
+        player_columns = [
+            col for col in stored_players if col in wanted_players and col != "name"
+        ]
+        query, names = build_merge_query(season_columns, player_columns, season_window)
+        rows = conn.execute(query).fetchall()
+
+    df = pd.DataFrame.from_records(rows, columns=names, coerce_float=True)
+    schema = {
+        **{col: SCHEMAS["player_data"][col] for col in player_columns},
+        **{col: SCHEMAS["seasons_stats"][col] for col in season_columns},
+        **{col: FLOAT for col in PERCENTAGE_COLUMNS},
+        "PlayerName": TEXT,
+    }
+    df = apply_schema(df, schema, copy=False)
+    return df.astype({"Year": np.int16, "player_id": np.int32, "is_all_star": np.int64})
+
+
+def run_sql_pipeline(
+    player_data_path: str,
+    seasons_stats_path: str,
+    all_star_path: str,
+    db_path: Union[str, Path],
+    features: Optional[List[str]] = None,
+    season_window: Optional[Tuple[int, int]] = DEFAULT_SEASON_WINDOW,
+    age_reference: Optional[str] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> pd.DataFrame:
+    """
+    Compute features with the merge and cleaning stages running in SQLite.
+
+    Equivalent to src.planner.run_planned_pipeline: the raw columns needed
+    for the features are selected by the planner, and the stages after
+    cleaning run in pandas on the returned rows only.
+
+    Args:
+        player_data_path: Path to player demographic data CSV
+        seasons_stats_path: Path to season statistics CSV
+        all_star_path: Path to All-Star selections CSV
+        db_path: SQLite database file (sources are loaded when changed)
+        features: Output features (select_modeling_features() if None)
+        season_window: Inclusive (first_year, last_year) of seasons to keep
+        age_reference: "MM-DD" season reference date for player ages (see
+            process_age_data)
+        profiler: StageProfiler receiving a record per stage
+
+    Returns:
+        DataFrame with the key columns followed by the requested features
+    """
+    plan = plan_pipeline(features)
+    run_stage(
+        "ingest_sources",
+        ingest_sources,
+        db_path,
+        profiler=profiler,
+        player_data_path=player_data_path,
+        seasons_stats_path=seasons_stats_path,
+        all_star_path=all_star_path,
+    )
+    df = run_stage(
+        "merge_and_clean_sql",
+        merge_and_clean_sql,
+        db_path,
+        profiler=profiler,
+        season_window=season_window,
+        columns=plan.columns,
+    )
+    return run_plan_stages(plan, df, age_reference, profiler)
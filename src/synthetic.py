@@ -0,0 +1,421 @@
+"""
+Synthetic Data Module
+
+This module generates synthetic NBA sources in the layout of the raw
+``player_data.csv``, ``Seasons_Stats.csv`` and ``All_Star.csv`` files. The
+tables are sized as a multiple of the real data so that pipeline stages can
+be benchmarked well beyond the size of the Kaggle dataset.
+
+Players are generated in fixed-size chunks, each with its own random stream,
+so a dataset written chunk by chunk to disk is identical to one generated in
+memory and large scales never need to fit in memory at once.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Row counts of the real sources (Seasons_Stats.csv covers 1950-2017)
+REAL_SIZES: Dict[str, int] = {
+    "player_data": 4550,
+    "seasons_stats": 24691,
+    "all_star": 441,
+}
+
+FIRST_SEASON = 1950
+LAST_SEASON = 2017
+ALL_STAR_SEASONS = (2000, 2016)
+
+# Careers cut off at LAST_SEASON then average the real ~5.4 rows per player
+MEAN_CAREER_SEASONS = 5.85
+
+# Generator-only player columns that are not part of player_data.csv
+LATENT_COLUMNS = ["birth_year", "skill"]
+
+# Players generated per chunk (each chunk has its own random stream)
+CHUNK_PLAYERS = 50_000
+
+FIRST_NAMES = (
+    "Aaron Adrian Al Allen Andre Anthony Antoine Ben Bill Bob Brandon Brian "
+    "Carl Charles Chris Clyde Corey Dale Damon Daniel Darrell David Dennis "
+    "Derek Dwight Earl Eddie Eric Frank Gary George Glen Grant Greg Harold "
+    "Isaiah Jack Jalen James Jason Jeff Jerry John Jordan Kevin Larry "
+    "Marcus Mark Michael Mike Nate Paul Ray Robert Scott Steve Terry Tim "
+    "Tony Walt"
+).split()
+
+LAST_NAMES = (
+    "Adams Allen Anderson Baker Barnes Bell Brooks Brown Bryant Butler "
+    "Campbell Carter Clark Coleman Collins Cook Cooper Davis Edwards Evans "
+    "Fisher Ford Foster Gordon Graham Grant Gray Green Hall Hamilton Harris "
+    "Hayes Hill Howard Hughes Jackson James Jenkins Johnson Jones Jordan "
+    "Kelly King Lee Lewis Long Martin Mason Miller Mitchell Moore Morris "
+    "Murphy Nelson Parker Perry Peterson Porter Price Reed Richardson "
+    "Roberts Robinson Ross Russell Sanders Scott Simmons Smith Stewart "
+    "Taylor Thomas Thompson Turner Walker Wallace Washington Watson White "
+    "Williams"
+).split()
+
+POSITIONS = ["G", "F", "C", "G-F", "F-C", "F-G", "C-F"]
+SEASON_POSITIONS = ["PG", "SG", "SF", "PF", "C"]
+TEAMS = (
+    "ATL BOS BRK CHI CHO CLE DAL DEN DET GSW HOU IND LAC LAL MEM MIA MIL "
+    "MIN NOP NYK OKC ORL PHI PHO POR SAC SAS TOR UTA WAS"
+).split()
+COLLEGES = [
+    "Duke University",
+    "University of Kentucky",
+    "University of North Carolina",
+    "University of California, Los Angeles",
+    "University of Kansas",
+    "Michigan State University",
+    "Syracuse University",
+    "Indiana University",
+    "University of Arizona",
+    "Georgetown University",
+]
+MONTHS = np.array(
+    (
+        "January February March April May June July August September October "
+        "November December"
+    ).split()
+)
+SELECTION_TYPES = [
+    "Eastern All-Star Fan Vote Selection",
+    "Eastern All-Star Coaches Selection",
+    "Western All-Star Fan Vote Selection",
+    "Western All-Star Coaches Selection",
+]
+
+
+def _player_names(start: int, count: int) -> np.ndarray:
+    """Build unique player names for global player indices."""
+    index = np.arange(start, start + count)
+    n_first, n_last = len(FIRST_NAMES), len(LAST_NAMES)
+    first = np.array(FIRST_NAMES)[index % n_first]
+    last = np.array(LAST_NAMES)[(index // n_first) % n_last]
+    names = pd.Series(first) + " " + pd.Series(last)
+
+    # Beyond every first/last combination, later players get a numeral
+    cycle = index // (n_first * n_last)
+    repeated = cycle > 0
+    names[repeated] = names[repeated] + " " + (cycle[repeated] + 1).astype(str)
+    return names.to_numpy(dtype=object)
+
+
+def _generate_players(rng: np.random.Generator, start: int, count: int) -> pd.DataFrame:
+    """
+    Generate one chunk of players.
+
+    Besides the player_data columns the frame carries the latent ``skill``
+    that drives the season statistics; it is dropped before writing.
+    """
+    year_start = rng.integers(FIRST_SEASON, LAST_SEASON + 1, count)
+    career = rng.geometric(1.0 / MEAN_CAREER_SEASONS, count)
+    year_end = np.minimum(year_start + career - 1, LAST_SEASON)
+
+    inches = np.clip(np.rint(rng.normal(78.5, 3.6, count)), 66, 91).astype(int)
+    weight = np.clip(np.rint(rng.normal(215.0, 25.0, count)), 150, 330)
+    weight[rng.random(count) < 0.01] = np.nan
+
+    birth_year = year_start - rng.integers(19, 24, count)
+    birth_month = rng.integers(1, 13, count)
+    birth_day = rng.integers(1, 29, count)
+    birth_date = pd.Series(
+        [
+            f"{month} {day}, {year}"
+            for month, day, year in zip(MONTHS[birth_month - 1], birth_day, birth_year)
+        ]
+    )
+    birth_date[rng.random(count) < 0.005] = np.nan
+
+    college = pd.Series(np.array(COLLEGES)[rng.integers(0, len(COLLEGES), count)])
+    college[rng.random(count) < 0.1] = np.nan
+
+    return pd.DataFrame(
+        {
+            "name": _player_names(start, count),
+            "year_start": year_start,
+            "year_end": year_end,
+            "position": np.array(POSITIONS)[rng.integers(0, len(POSITIONS), count)],
+            "height": [f"{value // 12}-{value % 12}" for value in inches],
+            "weight": weight,
+            "birth_date": birth_date.to_numpy(dtype=object),
+            "college": college.to_numpy(dtype=object),
+            "birth_year": birth_year,
+            "skill": rng.normal(0.0, 1.0, count),
+        }
+    )
+
+
+def _generate_seasons(rng: np.random.Generator, players: pd.DataFrame) -> pd.DataFrame:
+    """Generate one Seasons_Stats row for every season of every player."""
+    seasons = (players["year_end"] - players["year_start"] + 1).to_numpy()
+    owner = np.repeat(np.arange(len(players)), seasons)
+    offset = np.arange(len(owner)) - np.repeat(np.cumsum(seasons) - seasons, seasons)
+    year = players["year_start"].to_numpy()[owner] + offset
+    skill = players["skill"].to_numpy()[owner] + rng.normal(0.0, 0.3, len(owner))
+    n = len(owner)
+
+    games = np.clip(np.rint(rng.normal(55.0 + 8.0 * skill, 18.0)), 1, 82)
+    started = np.minimum(games, np.clip(np.rint(games * (0.4 + 0.3 * skill)), 0, 82))
+    minutes = games * np.clip(rng.normal(20.0 + 7.0 * skill, 5.0), 2.0, 42.0)
+
+    fga = np.rint(minutes * np.clip(rng.normal(0.36 + 0.06 * skill, 0.06), 0.05, 0.8))
+    three_share = np.clip(rng.normal(0.2, 0.12, n), 0.0, 0.8)
+    # The three-point line was introduced in 1980
+    three_pa = np.where(year < 1980, 0.0, np.rint(fga * three_share))
+    two_pa = fga - three_pa
+    three_pct = np.clip(rng.normal(0.33, 0.06, n), 0.0, 0.6)
+    two_pct = np.clip(rng.normal(0.48 + 0.02 * skill, 0.05), 0.25, 0.7)
+    three_p = np.rint(three_pa * three_pct)
+    two_p = np.rint(two_pa * two_pct)
+    fg = two_p + three_p
+    fta = np.rint(fga * np.clip(rng.normal(0.3, 0.1, n), 0.02, 0.9))
+    ft = np.rint(fta * np.clip(rng.normal(0.75, 0.08, n), 0.3, 0.95))
+    pts = 2 * two_p + 3 * three_p + ft
+
+    orb = np.rint(minutes * np.clip(rng.normal(0.04, 0.02, n), 0.0, 0.15))
+    drb = np.rint(minutes * np.clip(rng.normal(0.13, 0.04, n), 0.02, 0.35))
+    ast = np.rint(minutes * np.clip(rng.normal(0.09 + 0.02 * skill, 0.04), 0.0, 0.35))
+    stl = np.rint(minutes * np.clip(rng.normal(0.03, 0.01, n), 0.0, 0.08))
+    blk = np.rint(minutes * np.clip(rng.normal(0.02, 0.015, n), 0.0, 0.12))
+    tov = np.rint(minutes * np.clip(rng.normal(0.06, 0.02, n), 0.0, 0.15))
+    pf = np.rint(minutes * np.clip(rng.normal(0.1, 0.03, n), 0.01, 0.25))
+
+    ows_rate = np.clip(rng.normal(0.002 + 0.002 * skill, 0.0015), -0.004, 0.0055)
+    dws_rate = np.clip(rng.normal(0.0015 + 0.0006 * skill, 0.0006), -0.001, 0.003)
+    ows = np.round(ows_rate * minutes, 1)
+    dws = np.round(dws_rate * minutes, 1)
+    ws = ows + dws
+    obpm = np.round(rng.normal(-1.0 + 2.5 * skill, 2.0), 1)
+    dbpm = np.round(rng.normal(0.0 + 0.8 * skill, 1.5), 1)
+    bpm = obpm + dbpm
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stats = {
+            "G": games,
+            "GS": started,
+            "MP": np.rint(minutes),
+            "PER": np.round(np.clip(rng.normal(13.0 + 4.0 * skill, 3.0), -5, 35), 1),
+            "TS%": np.round(pts / (2 * (fga + 0.44 * fta)), 3),
+            "3PAr": np.round(three_pa / fga, 3),
+            "FTr": np.round(fta / fga, 3),
+            "ORB%": np.round(orb / minutes * 100 * 2.5, 1),
+            "DRB%": np.round(drb / minutes * 100 * 1.1, 1),
+            "TRB%": np.round((orb + drb) / minutes * 100 * 0.6, 1),
+            "AST%": np.round(ast / minutes * 100 * 1.6, 1),
+            "STL%": np.round(stl / minutes * 100 * 0.5, 1),
+            "BLK%": np.round(blk / minutes * 100 * 0.8, 1),
+            "TOV%": np.round(tov / (fga + 0.44 * fta + tov) * 100, 1),
+            "USG%": np.round(np.clip(rng.normal(19.0 + 3.0 * skill, 3.0), 5, 40), 1),
+            "OWS": ows,
+            "DWS": dws,
+            "WS": ws,
+            "WS/48": np.round(ws / minutes * 48, 3),
+            "OBPM": obpm,
+            "DBPM": dbpm,
+            "BPM": bpm,
+            "VORP": np.round((bpm + 2.0) * minutes / 4000.0, 1),
+            "FG": fg,
+            "FGA": fga,
+            "FG%": np.round(fg / fga, 3),
+            "3P": np.where(year < 1980, np.nan, three_p),
+            "3PA": np.where(year < 1980, np.nan, three_pa),
+            "3P%": np.round(three_p / three_pa, 3),
+            "2P": two_p,
+            "2PA": two_pa,
+            "2P%": np.round(two_p / two_pa, 3),
+            "eFG%": np.round((fg + 0.5 * three_p) / fga, 3),
+            "FT": ft,
+            "FTA": fta,
+            "FT%": np.round(ft / fta, 3),
+            "ORB": orb,
+            "DRB": drb,
+            "TRB": orb + drb,
+            "AST": ast,
+            "STL": stl,
+            "BLK": blk,
+            "TOV": tov,
+            "PF": pf,
+            "PTS": pts,
+        }
+
+    seasons_stats = pd.DataFrame(
+        {
+            "Year": year.astype(float),
+            "Player": players["name"].to_numpy()[owner],
+            "Pos": np.array(SEASON_POSITIONS)[rng.integers(0, 5, n)],
+            "Age": (year - players["birth_year"].to_numpy()[owner]).astype(float),
+            "Tm": np.array(TEAMS)[rng.integers(0, len(TEAMS), n)],
+        }
+    )
+    for col, values in stats.items():
+        # Ratios of zero attempts are missing, as in the real file
+        seasons_stats[col] = np.where(np.isfinite(values), values, np.nan)
+    # Empty separator columns of the real file
+    seasons_stats.insert(seasons_stats.columns.get_loc("OWS"), "blanl", np.nan)
+    seasons_stats.insert(seasons_stats.columns.get_loc("OBPM"), "blank2", np.nan)
+    return seasons_stats
+
+
+def _all_star_candidates(
+    seasons_stats: pd.DataFrame, players: pd.DataFrame, per_season: int
+) -> pd.DataFrame:
+    """Pick the top scorers of each All-Star season as All-Star selections."""
+    first, last = ALL_STAR_SEASONS
+    eligible = seasons_stats[seasons_stats["Year"].between(first, last)]
+    top = _top_per_season(eligible, per_season)
+    profile = players.set_index("name")
+    return pd.DataFrame(
+        {
+            "Year": top["Year"].astype(int).to_numpy(),
+            "Player": top["Player"].to_numpy(),
+            "Pos": top["Pos"].to_numpy(),
+            "HT": profile.loc[top["Player"], "height"].to_numpy(),
+            "WT": profile.loc[top["Player"], "weight"].to_numpy(),
+            "Team": top["Tm"].to_numpy(),
+            "PTS": top["PTS"].to_numpy(),
+        }
+    )
+
+
+def _top_per_season(frame: pd.DataFrame, per_season: int) -> pd.DataFrame:
+    """Keep the ``per_season`` highest scorers of every season."""
+    return (
+        frame.sort_values(["Year", "PTS"], ascending=[True, False], kind="stable")
+        .groupby("Year", sort=True)
+        .head(per_season)
+    )
+
+
+def _finish_all_star(
+    candidates: pd.DataFrame, per_season: int, seed: int
+) -> pd.DataFrame:
+    """Keep the overall top scorers per season and add the remaining columns."""
+    all_star = (
+        _top_per_season(candidates, per_season)
+        .drop(columns="PTS")
+        .reset_index(drop=True)
+    )
+    # A stream of its own, distinct from every player chunk
+    rng = np.random.default_rng([seed, 2**32 - 1])
+    n = len(all_star)
+    draft_year = all_star["Year"].to_numpy() - rng.integers(2, 12, n)
+    all_star["Selection Type"] = np.array(SELECTION_TYPES)[rng.integers(0, 4, n)]
+    all_star["NBA Draft Status"] = [
+        f"{year} Rnd 1 Pick {pick}"
+        for year, pick in zip(draft_year, rng.integers(1, 31, n))
+    ]
+    all_star["Nationality"] = "United States"
+    return all_star
+
+
+def _chunks(scale: float, chunk_players: int) -> List[Tuple[int, int]]:
+    """Return (first player index, player count) of every chunk."""
+    total = max(1, int(round(REAL_SIZES["player_data"] * scale)))
+    return [
+        (start, min(chunk_players, total - start))
+        for start in range(0, total, chunk_players)
+    ]
+
+
+def _all_stars_per_season(scale: float) -> int:
+    """Number of All-Star selections per season at a scale."""
+    first, last = ALL_STAR_SEASONS
+    per_season = REAL_SIZES["all_star"] / (last - first + 1)
+    return max(1, int(round(per_season * scale)))
+
+
+def _iter_chunks(scale: float, seed: int, chunk_players: int):
+    """Yield (players, seasons_stats) for every chunk of a dataset."""
+    for number, (start, count) in enumerate(_chunks(scale, chunk_players)):
+        rng = np.random.default_rng([seed, number])
+        players = _generate_players(rng, start, count)
+        yield players, _generate_seasons(rng, players)
+
+
+def generate_nba_tables(
+    scale: float = 1.0, seed: int = 0, chunk_players: int = CHUNK_PLAYERS
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Generate synthetic NBA sources in memory.
+
+    Args:
+        scale: Size as a multiple of the real sources (1.0 gives about 4,550
+            players and 24,700 season rows)
+        seed: Random seed
+        chunk_players: Players generated per random stream
+
+    Returns:
+        Tuple of (player_data, seasons_stats, all_star) DataFrames with the
+        columns of the raw CSV files
+    """
+    per_season = _all_stars_per_season(scale)
+    player_frames, season_frames, candidates = [], [], []
+    for players, seasons_stats in _iter_chunks(scale, seed, chunk_players):
+        candidates.append(_all_star_candidates(seasons_stats, players, per_season))
+        player_frames.append(players.drop(columns=LATENT_COLUMNS))
+        season_frames.append(seasons_stats)
+
+    all_star = _finish_all_star(pd.concat(candidates), per_season, seed)
+    return (
+        pd.concat(player_frames, ignore_index=True),
+        pd.concat(season_frames, ignore_index=True),
+        all_star,
+    )
+
+
+def write_synthetic_dataset(
+    out_dir: Union[str, Path],
+    scale: float = 1.0,
+    seed: int = 0,
+    chunk_players: int = CHUNK_PLAYERS,
+) -> Tuple[str, str, str]:
+    """
+    Write synthetic NBA sources as CSV files.
+
+    Chunks are appended to the files as they are generated, so only one chunk
+    is held in memory. The files read back equal to generate_nba_tables with
+    the same arguments; Seasons_Stats.csv has the unnamed index column of the
+    real file.
+
+    Args:
+        out_dir: Output directory
+        scale: Size as a multiple of the real sources
+        seed: Random seed
+        chunk_players: Players generated per random stream
+
+    Returns:
+        Paths to (player_data.csv, Seasons_Stats.csv, All_Star.csv)
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    player_path = out_dir / "player_data.csv"
+    seasons_path = out_dir / "Seasons_Stats.csv"
+    all_star_path = out_dir / "All_Star.csv"
+
+    per_season = _all_stars_per_season(scale)
+    candidates: Optional[pd.DataFrame] = None
+    offset = 0
+    for number, (players, seasons_stats) in enumerate(
+        _iter_chunks(scale, seed, chunk_players)
+    ):
+        # Only the running top scorers of each season can still be selected
+        chunk_candidates = _all_star_candidates(seasons_stats, players, per_season)
+        candidates = _top_per_season(
+            pd.concat([candidates, chunk_candidates]), per_season
+        )
+
+        mode, header = ("w", True) if number == 0 else ("a", False)
+        players.drop(columns=LATENT_COLUMNS).to_csv(
+            player_path, mode=mode, header=header, index=False
+        )
+        seasons_stats.index = pd.RangeIndex(offset, offset + len(seasons_stats))
+        seasons_stats.to_csv(seasons_path, mode=mode, header=header)
+        offset += len(seasons_stats)
+
+    _finish_all_star(candidates, per_season, seed).to_csv(all_star_path, index=False)
+    return str(player_path), str(seasons_path), str(all_star_path)
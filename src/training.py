@@ -0,0 +1,377 @@
+"""
+Model Training Module
+
+This module trains the notebook's models (random forest, XGBoost and
+logistic regression) over hyperparameter grids in a process pool.
+
+The training matrix is placed in shared memory once, and every worker maps
+it instead of receiving a pickled copy per task. Validation results are
+cached per (model, hyperparameters, data hash), so repeated sweeps only fit
+the new grid points.
+"""
+
+import hashlib
+import importlib.util
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import (
+    accuracy_score,
+    f1_score,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+)
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.model_matrix import as_float_matrix
+from src.parallel import resolve_n_jobs
+
+# Hyperparameters of the notebook models; grid values override them
+MODEL_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "random_forest": {
+        "n_estimators": 100,
+        "max_depth": 10,
+        "min_samples_split": 5,
+        "random_state": 42,
+        "class_weight": "balanced",
+        "n_jobs": 1,
+    },
+    "xgboost": {
+        "n_estimators": 100,
+        "max_depth": 6,
+        "learning_rate": 0.1,
+        "random_state": 42,
+        "eval_metric": "logloss",
+        "n_jobs": 1,
+    },
+    "logistic_regression": {
+        "C": 1.0,
+        "random_state": 42,
+        "max_iter": 1000,
+        "class_weight": "balanced",
+    },
+}
+
+# Models trained on standardised features
+SCALED_MODELS = {"logistic_regression"}
+
+PARAM_GRIDS: Dict[str, Dict[str, List[Any]]] = {
+    "random_forest": {
+        "n_estimators": [100, 300],
+        "max_depth": [6, 10, None],
+        "min_samples_split": [2, 5],
+    },
+    "xgboost": {
+        "n_estimators": [100, 300],
+        "max_depth": [3, 6],
+        "learning_rate": [0.05, 0.1],
+    },
+    "logistic_regression": {"C": [0.01, 0.1, 1.0, 10.0]},
+}
+
+VALIDATION_SIZE = 0.2
+SPLIT_RANDOM_STATE = 42
+
+# Arrays of the current sweep in a worker process (shared memory views)
+_SHARED_ARRAYS: Dict[str, np.ndarray] = {}
+_SHARED_SEGMENTS: List[shared_memory.SharedMemory] = []
+
+
+def default_param_grids() -> Dict[str, Dict[str, List[Any]]]:
+    """
+    Return the default grids of the models available in this environment.
+
+    XGBoost is left out when it is not installed.
+
+    Returns:
+        Mapping of model name to hyperparameter grid
+    """
+    grids = dict(PARAM_GRIDS)
+    if importlib.util.find_spec("xgboost") is None:
+        del grids["xgboost"]
+    return grids
+
+
+def expand_grid(grids: Dict[str, Dict[str, List[Any]]]) -> List[Tuple[str, Dict]]:
+    """
+    Expand hyperparameter grids into individual configurations.
+
+    Args:
+        grids: Mapping of model name to {parameter: candidate values}
+
+    Returns:
+        List of (model name, parameters) pairs
+    """
+    configs = []
+    for name, grid in grids.items():
+        keys = sorted(grid)
+        for values in itertools.product(*(grid[key] for key in keys)):
+            configs.append((name, dict(zip(keys, values))))
+    return configs
+
+
+def make_model(
+    name: str, params: Optional[Dict[str, Any]] = None, standardize: bool = True
+) -> Any:
+    """
+    Build an unfitted model with the notebook defaults and some overrides.
+
+    Args:
+        name: "random_forest", "xgboost" or "logistic_regression"
+        params: Hyperparameters overriding MODEL_DEFAULTS
+        standardize: Whether scaled models get their own StandardScaler
+            (False when the features are already standardised)
+
+    Returns:
+        Unfitted estimator (a scaler pipeline for scaled models)
+
+    Raises:
+        ValueError: If the model name is unknown
+    """
+    if name not in MODEL_DEFAULTS:
+        raise ValueError(
+            f"Unknown model {name!r}, expected one of {list(MODEL_DEFAULTS)}"
+        )
+    settings = {**MODEL_DEFAULTS[name], **(params or {})}
+    if name == "random_forest":
+        model = RandomForestClassifier(**settings)
+    elif name == "xgboost":
+        from xgboost import XGBClassifier
+
+        model = XGBClassifier(**settings)
+    else:
+        model = LogisticRegression(**settings)
+    if standardize and name in SCALED_MODELS:
+        return make_pipeline(StandardScaler(), model)
+    return model
+
+
+def data_hash(X: np.ndarray, y: np.ndarray, train: np.ndarray) -> str:
+    """
+    Fingerprint a training matrix, its labels and the training split.
+
+    Args:
+        X: Feature matrix
+        y: Labels
+        train: Row positions of the training split
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for array in (X, y, train):
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode("utf-8"))
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def _cache_key(name: str, params: Dict[str, Any], data_digest: str) -> str:
+    """Cache key of one configuration on one dataset."""
+    payload = json.dumps(
+        {"model": name, "params": params, "data": data_digest},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _read_cached(cache_dir: Optional[Path], key: str) -> Optional[Dict[str, Any]]:
+    """Cached result of a configuration (None if not cached)."""
+    if cache_dir is None:
+        return None
+    path = cache_dir / f"{key}.json"
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _write_cached(cache_dir: Path, key: str, result: Dict[str, Any]) -> None:
+    """Atomically cache the result of a configuration."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / f"{key}.json"
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(result, handle, default=str)
+    os.replace(tmp_path, path)
+
+
+def _share_arrays(
+    arrays: Dict[str, np.ndarray],
+) -> Tuple[List[shared_memory.SharedMemory], Dict[str, Tuple[str, tuple, str]]]:
+    """Copy arrays into shared memory segments."""
+    segments = []
+    descriptors = {}
+    for key, array in arrays.items():
+        segment = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        np.ndarray(array.shape, array.dtype, buffer=segment.buf)[...] = array
+        segments.append(segment)
+        descriptors[key] = (segment.name, array.shape, array.dtype.str)
+    return segments, descriptors
+
+
+def _attach_arrays(descriptors: Dict[str, Tuple[str, tuple, str]]) -> None:
+    """Worker initializer: map the shared arrays of a sweep."""
+    _SHARED_ARRAYS.clear()
+    for key, (segment_name, shape, dtype) in descriptors.items():
+        segment = shared_memory.SharedMemory(name=segment_name)
+        _SHARED_SEGMENTS.append(segment)
+        _SHARED_ARRAYS[key] = np.ndarray(shape, np.dtype(dtype), buffer=segment.buf)
+
+
+def _evaluate(config: Tuple[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Fit one configuration on the training split and score the validation split."""
+    name, params = config
+    X, y = _SHARED_ARRAYS["X"], _SHARED_ARRAYS["y"]
+    train, validation = _SHARED_ARRAYS["train"], _SHARED_ARRAYS["validation"]
+
+    model = make_model(name, params)
+    start = time.perf_counter()
+    model.fit(X[train], y[train])
+    fit_seconds = time.perf_counter() - start
+
+    proba = model.predict_proba(X[validation])[:, 1]
+    pred = (proba >= 0.5).astype(int)
+    y_val = y[validation]
+    return {
+        "accuracy": accuracy_score(y_val, pred),
+        "precision": precision_score(y_val, pred, zero_division=0),
+        "recall": recall_score(y_val, pred, zero_division=0),
+        "f1": f1_score(y_val, pred, zero_division=0),
+        "roc_auc": roc_auc_score(y_val, proba),
+        "fit_seconds": fit_seconds,
+    }
+
+
+def run_sweep(
+    X: Union[pd.DataFrame, np.ndarray],
+    y: Union[pd.Series, np.ndarray],
+    grids: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+    n_jobs: Optional[int] = -1,
+    cache_dir: Optional[Union[str, Path]] = None,
+    validation_size: float = VALIDATION_SIZE,
+    random_state: int = SPLIT_RANDOM_STATE,
+) -> pd.DataFrame:
+    """
+    Evaluate hyperparameter grids on a stratified validation split.
+
+    The split matches the notebook (20% stratified validation rows,
+    ``random_state=42``). With several workers, X, y and the split are
+    copied into shared memory once and mapped by every worker.
+
+    Args:
+        X: Feature matrix (from prepare_modeling_data or build_model_matrix;
+            float32 arrays are used without conversion)
+        y: All-Star labels
+        grids: Mapping of model name to {parameter: candidate values}
+            (default_param_grids() if None)
+        n_jobs: Number of worker processes (-1 for one per CPU, None or 1
+            for serial execution)
+        cache_dir: Directory of cached results (no caching if None)
+        validation_size: Fraction of rows held out for validation
+        random_state: Seed of the validation split
+
+    Returns:
+        One row per configuration with "model", "params", the validation
+        metrics, "fit_seconds" and "cached", best ROC AUC first
+    """
+    if grids is None:
+        grids = default_param_grids()
+    X = as_float_matrix(X)
+    y = np.ascontiguousarray(y, dtype=np.int64)
+    positions = np.arange(len(y))
+    train, validation = train_test_split(
+        positions, test_size=validation_size, random_state=random_state, stratify=y
+    )
+    digest = data_hash(X, y, train)
+    cache_path = None if cache_dir is None else Path(cache_dir)
+
+    configs = expand_grid(grids)
+    results: List[Optional[Dict[str, Any]]] = []
+    pending = []
+    for index, (name, params) in enumerate(configs):
+        cached = _read_cached(cache_path, _cache_key(name, params, digest))
+        results.append(cached)
+        if cached is None:
+            pending.append(index)
+
+    arrays = {"X": X, "y": y, "train": train, "validation": validation}
+    n_workers = min(resolve_n_jobs(n_jobs), len(pending))
+    if n_workers <= 1:
+        _SHARED_ARRAYS.update(arrays)
+        try:
+            computed = [_evaluate(configs[index]) for index in pending]
+        finally:
+            _SHARED_ARRAYS.clear()
+    else:
+        segments, descriptors = _share_arrays(arrays)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_attach_arrays,
+                initargs=(descriptors,),
+            ) as pool:
+                computed = list(pool.map(_evaluate, [configs[i] for i in pending]))
+        finally:
+            for segment in segments:
+                segment.close()
+                segment.unlink()
+
+    for index, metrics in zip(pending, computed):
+        results[index] = metrics
+        if cache_path is not None:
+            name, params = configs[index]
+            _write_cached(cache_path, _cache_key(name, params, digest), metrics)
+
+    rows = [
+        {
+            "model": name,
+            "params": params,
+            **results[index],
+            "cached": index not in pending,
+        }
+        for index, (name, params) in enumerate(configs)
+    ]
+    return (
+        pd.DataFrame(rows)
+        .sort_values("roc_auc", ascending=False, kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def fit_best(
+    sweep: pd.DataFrame,
+    X: Union[pd.DataFrame, np.ndarray],
+    y: Union[pd.Series, np.ndarray],
+    model: Optional[str] = None,
+) -> Any:
+    """
+    Fit the best configuration of a sweep on all rows.
+
+    Args:
+        sweep: Output of run_sweep
+        X: Feature matrix
+        y: All-Star labels
+        model: Only consider this model (all models if None)
+
+    Returns:
+        Fitted estimator
+    """
+    if model is not None:
+        sweep = sweep[sweep["model"] == model]
+    best = sweep.iloc[0]
+    return make_model(best["model"], best["params"]).fit(X, y)
@@ -0,0 +1,276 @@
+"""
+Season Cross-Validation Module
+
+This module backtests models season by season. Every fold trains on the
+seasons up to t (all earlier seasons, or a rolling window of them) and
+evaluates the top-24 All-Star selection on season t + 1, so no fold sees a
+future season during training.
+
+The standardised train and test matrices of every fold are cached as
+``.npy`` files keyed by the data and the fold bounds. Folds are fitted in a
+process pool whose workers memory-map the cached matrices, so only file
+paths are sent to the workers.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import roc_auc_score
+from sklearn.preprocessing import StandardScaler
+
+from src.model_matrix import as_float_matrix
+from src.parallel import map_partitions, resolve_n_jobs
+from src.scoring import ALL_STAR_SLOTS, top_k_mask
+from src.training import data_hash, default_param_grids, expand_grid, make_model
+
+FOLDS_DIR = "folds"
+FOLD_ARRAYS = ("X_train", "y_train", "X_test", "y_test")
+DEFAULT_MIN_TRAIN_SEASONS = 3
+
+
+class SeasonFold(NamedTuple):
+    """
+    One backtest fold.
+
+    Attributes:
+        train_first: First training season
+        train_last: Last training season
+        test_season: Evaluation season (the season after train_last)
+    """
+
+    train_first: int
+    train_last: int
+    test_season: int
+
+
+def season_folds(
+    years: Union[pd.Series, np.ndarray],
+    min_train_seasons: int = DEFAULT_MIN_TRAIN_SEASONS,
+    window: Optional[int] = None,
+    first_test_season: Optional[int] = None,
+    last_test_season: Optional[int] = None,
+) -> List[SeasonFold]:
+    """
+    Build expanding- or rolling-window folds over the seasons present.
+
+    Args:
+        years: Season of every row
+        min_train_seasons: Minimum number of training seasons of a fold
+        window: Number of training seasons per fold (expanding window with
+            every earlier season if None)
+        first_test_season: First evaluation season (no limit if None)
+        last_test_season: Last evaluation season (no limit if None)
+
+    Returns:
+        Folds in season order
+    """
+    seasons = np.unique(np.asarray(years, dtype=np.int64))
+    folds = []
+    for position in range(max(1, min_train_seasons), len(seasons)):
+        test_season = int(seasons[position])
+        if first_test_season is not None and test_season < first_test_season:
+            continue
+        if last_test_season is not None and test_season > last_test_season:
+            continue
+        first = 0 if window is None else max(0, position - window)
+        folds.append(
+            SeasonFold(int(seasons[first]), int(seasons[position - 1]), test_season)
+        )
+    return folds
+
+
+def _fold_key(data_digest: str, fold: SeasonFold) -> str:
+    """Cache key of one fold of one dataset."""
+    payload = f"{data_digest}:{fold.train_first}:{fold.train_last}:{fold.test_season}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _write_fold(
+    fold_dir: Path,
+    X: np.ndarray,
+    y: np.ndarray,
+    years: np.ndarray,
+    fold: SeasonFold,
+) -> None:
+    """Scale one fold and write its matrices atomically."""
+    train = (years >= fold.train_first) & (years <= fold.train_last)
+    test = years == fold.test_season
+    scaler = StandardScaler().fit(X[train])
+    arrays = {
+        "X_train": scaler.transform(X[train]),
+        "y_train": y[train],
+        "X_test": scaler.transform(X[test]),
+        "y_test": y[test],
+    }
+
+    tmp_dir = Path(tempfile.mkdtemp(dir=fold_dir.parent, prefix=".tmp-"))
+    try:
+        for name, array in arrays.items():
+            np.save(tmp_dir / f"{name}.npy", np.ascontiguousarray(array))
+        os.replace(tmp_dir, fold_dir)
+    except OSError:
+        # Another process wrote the same fold first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not fold_dir.exists():
+            raise
+
+
+def prepare_folds(
+    X: Union[pd.DataFrame, np.ndarray],
+    y: Union[pd.Series, np.ndarray],
+    years: Union[pd.Series, np.ndarray],
+    folds: List[SeasonFold],
+    cache_dir: Union[str, Path],
+) -> List[Path]:
+    """
+    Write the standardised matrices of every fold that is not cached yet.
+
+    The scaler of a fold is fitted on its training seasons only.
+
+    Args:
+        X: Feature matrix
+        y: All-Star labels
+        years: Season of every row
+        folds: Folds from season_folds
+        cache_dir: Directory of the fold cache
+
+    Returns:
+        Directory of every fold, in fold order
+    """
+    X = as_float_matrix(X)
+    y = np.ascontiguousarray(y, dtype=np.int64)
+    years = np.ascontiguousarray(years, dtype=np.int64)
+    digest = data_hash(X, y, years)
+
+    root = Path(cache_dir) / FOLDS_DIR
+    root.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for fold in folds:
+        fold_dir = root / _fold_key(digest, fold)
+        if not fold_dir.exists():
+            _write_fold(fold_dir, X, y, years, fold)
+        paths.append(fold_dir)
+    return paths
+
+
+def _evaluate_fold(task: Tuple[str, str, Dict[str, Any], int]) -> Dict[str, Any]:
+    """Fit one configuration on one cached fold and score its test season."""
+    fold_dir, name, params, k = task
+    data = {
+        key: np.load(Path(fold_dir) / f"{key}.npy", mmap_mode="r")
+        for key in FOLD_ARRAYS
+    }
+    y_test = np.asarray(data["y_test"])
+
+    # Fold matrices are already standardised on the training seasons
+    model = make_model(name, params, standardize=False)
+    model.fit(data["X_train"], data["y_train"])
+    proba = model.predict_proba(data["X_test"])[:, 1]
+
+    selected = top_k_mask(proba, k)
+    hits = int(y_test[selected].sum())
+    positives = int(y_test.sum())
+    return {
+        "hits": hits,
+        "all_stars": positives,
+        "precision_at_k": hits / max(1, int(selected.sum())),
+        "recall_at_k": hits / positives if positives else np.nan,
+        "roc_auc": (
+            roc_auc_score(y_test, proba) if 0 < positives < len(y_test) else np.nan
+        ),
+    }
+
+
+def cross_validate(
+    X: Union[pd.DataFrame, np.ndarray],
+    y: Union[pd.Series, np.ndarray],
+    years: Union[pd.Series, np.ndarray],
+    grids: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+    folds: Optional[List[SeasonFold]] = None,
+    k: int = ALL_STAR_SLOTS,
+    n_jobs: Optional[int] = -1,
+    cache_dir: Optional[Union[str, Path]] = None,
+) -> pd.DataFrame:
+    """
+    Backtest model configurations season by season.
+
+    Args:
+        X: Feature matrix (from prepare_modeling_data or build_model_matrix;
+            float32 arrays are used without conversion)
+        y: All-Star labels
+        years: Season of every row
+        grids: Mapping of model name to {parameter: candidate values} (the
+            default hyperparameters of every available model if None)
+        folds: Folds to evaluate (expanding-window season_folds() if None)
+        k: All-Star slots selected per test season
+        n_jobs: Number of worker processes (-1 for one per CPU, None or 1
+            for serial execution)
+        cache_dir: Directory of the fold cache (a temporary directory for
+            this call if None)
+
+    Returns:
+        One row per configuration and fold with "model", "params", the fold
+        bounds, the top-k hits and precision/recall, and the ROC AUC
+    """
+    if grids is None:
+        grids = {name: {} for name in default_param_grids()}
+    if folds is None:
+        folds = season_folds(years)
+    configs = expand_grid(grids)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fold_dirs = prepare_folds(
+            X, y, years, folds, tmp_dir if cache_dir is None else cache_dir
+        )
+        tasks = [
+            (str(fold_dir), name, params, k)
+            for name, params in configs
+            for fold_dir in fold_dirs
+        ]
+        metrics = map_partitions(_evaluate_fold, tasks, resolve_n_jobs(n_jobs))
+
+    rows = [
+        {"model": name, "params": params, **fold._asdict(), **result}
+        for (name, params), fold, result in zip(
+            ((name, params) for name, params in configs for _ in folds),
+            folds * len(configs),
+            metrics,
+        )
+    ]
+    return pd.DataFrame(rows)
+
+
+def summarize_folds(results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Average backtest metrics per configuration.
+
+    Args:
+        results: Output of cross_validate
+
+    Returns:
+        One row per configuration with the fold count, total hits and mean
+        metrics, best mean precision at k first
+    """
+    results = results.assign(config=results["params"].map(repr))
+    summary = (
+        results.groupby(["model", "config"], sort=False)
+        .agg(
+            params=("params", "first"),
+            folds=("test_season", "size"),
+            hits=("hits", "sum"),
+            precision_at_k=("precision_at_k", "mean"),
+            recall_at_k=("recall_at_k", "mean"),
+            roc_auc=("roc_auc", "mean"),
+        )
+        .reset_index()
+        .drop(columns="config")
+    )
+    return summary.sort_values(
+        "precision_at_k", ascending=False, kind="stable"
+    ).reset_index(drop=True)
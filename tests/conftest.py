@@ -0,0 +1,114 @@
+"""Shared fixtures for the test suite."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.synthetic import write_synthetic_dataset
+
+
+@pytest.fixture
+def raw_paths(tmp_path):
+    """Write small CSVs in the layout of the raw NBA sources."""
+    player_data = pd.DataFrame(
+        {
+            "name": ["Player A", "Player B"],
+            "year_start": [2005, 2010],
+            "year_end": [2018, 2016],
+            "position": ["G", "F-C"],
+            "height": ["6-6", "6-10"],
+            "weight": [200, np.nan],
+            "birth_date": ["June 24, 1985", "April 7, 1988"],
+            "college": ["Duke University", np.nan],
+        }
+    )
+    seasons_stats = pd.DataFrame(
+        {
+            "Unnamed: 0": [0, 1, 2],
+            "Year": [2015.0, np.nan, 2015.0],
+            "Player": ["Player A", np.nan, "Player B"],
+            "Pos": ["SG", np.nan, "C"],
+            "Tm": ["BOS", np.nan, "LAL"],
+            "MP": [2500.0, np.nan, 1200.0],
+            "blanl": [np.nan, np.nan, np.nan],
+            "FG%": [0.45, np.nan, 0.52],
+            "PTS": [1500.0, np.nan, 600.0],
+            "blank2": [np.nan, np.nan, np.nan],
+        }
+    )
+    all_star = pd.DataFrame(
+        {"Year": [2015], "Player": ["Player A"], "Pos": ["G"], "WT": [200]}
+    )
+
+    paths = []
+    for name, frame in [
+        ("player_data.csv", player_data),
+        ("Seasons_Stats.csv", seasons_stats),
+        ("All_Star.csv", all_star),
+    ]:
+        path = tmp_path / name
+        frame.to_csv(path, index=False)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture(scope="session")
+def synthetic_paths(tmp_path_factory):
+    """Write a small synthetic dataset, shared by the whole session."""
+    return write_synthetic_dataset(tmp_path_factory.mktemp("synthetic"), scale=0.1)
+
+
+@pytest.fixture
+def edge_case_paths(tmp_path):
+    """Write sources with stray text, zero attempts, metric heights and messy names."""
+    player_data = pd.DataFrame(
+        {
+            "name": ["LeBron James", "Kobe  Bryant", "Rookie", None],
+            "year_start": [2004, 1997, 2015, 2000],
+            "year_end": [2018, 2016, None, 2001],
+            "position": ["F", "G", None, "C"],
+            "height": ["6-8", "6-6", "185", "7-0"],
+            "weight": [250.0, 212.0, None, 240.0],
+            "birth_date": ["December 30, 1984", "August 23, 1978", None, None],
+            "college": [None, None, "Duke University", "UCLA"],
+        }
+    )
+    seasons_stats = pd.DataFrame(
+        {
+            "Unnamed: 0": range(6),
+            "Year": [2004.0, 2005.0, 2005.0, 2016.0, 1999.0, None],
+            "Player": [
+                "LeBron James",
+                " LeBron  James",
+                "Kobe Bryant",
+                "Rookie",
+                "Kobe Bryant",
+                "Nobody",
+            ],
+            "PER": [18.3, "bad", None, 10.0, 20.0, 1.0],
+            "MP": [3122.0, 3361.0, 0.0, 20.0, 2000.0, 5.0],
+            "FG": [622.0, 795.0, 0.0, 5.0, 500.0, 1.0],
+            "FGA": [1492.0, 1684.0, 0.0, 0.0, 1000.0, 2.0],
+            "FG%": [None, 0.472, None, None, 0.5, None],
+            "3P": [63.0, 108.0, 0.0, 2.0, 50.0, 0.0],
+            "3PA": [217.0, 308.0, 0.0, 0.0, 150.0, 0.0],
+            "3P%": [None, None, None, None, 0.33, None],
+            "FT": [347.0, 477.0, 10.0, 1.0, 300.0, 0.0],
+            "FTA": [460.0, 636.0, 12.0, 2.0, 400.0, 0.0],
+            "PTS": [1654.0, 2175.0, 10.0, 13.0, 1400.0, 2.0],
+        }
+    )
+    all_star = pd.DataFrame(
+        {
+            "Player": ["LeBron James", "Kobe Bryant", "Kobe Bryant", "Unknown Guy"],
+            "Year": [2005, 2005, 2005, 2010],
+        }
+    )
+    paths = (
+        tmp_path / "player_data.csv",
+        tmp_path / "Seasons_Stats.csv",
+        tmp_path / "All_Star.csv",
+    )
+    for frame, path in zip((player_data, seasons_stats, all_star), paths):
+        frame.to_csv(path, index=False)
+    return tuple(str(path) for path in paths)
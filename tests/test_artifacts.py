@@ -0,0 +1,115 @@
+"""
+Tests for artifacts module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from src.artifacts import MappedForestClassifier, load_artifacts, save_artifacts
+from src.serving import load_model_bundle
+
+FEATURES = ["PTS", "AST", "TRB"]
+
+
+@pytest.fixture
+def training_data():
+    """Small classification problem with named features."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(200, 3)), columns=FEATURES)
+    y = (X["PTS"] + 0.5 * X["AST"] > 0).astype(int)
+    return X, y
+
+
+class TestArtifacts:
+    """Test cases for model artifacts."""
+
+    def test_round_trip(self, tmp_path, training_data):
+        """Test that loaded models predict like the fitted ones."""
+        X, y = training_data
+        scaler = StandardScaler().fit(X)
+        X_scaled = pd.DataFrame(scaler.transform(X), columns=FEATURES)
+        models = {
+            "logistic_regression": LogisticRegression().fit(X_scaled, y),
+            "random_forest": RandomForestClassifier(
+                n_estimators=10, random_state=0
+            ).fit(X, y),
+        }
+
+        save_artifacts(tmp_path / "artifacts", models, scaler, FEATURES)
+        loaded = load_artifacts(tmp_path / "artifacts")
+
+        assert loaded.features == FEATURES
+        np.testing.assert_allclose(loaded.scaler.transform(X), scaler.transform(X))
+        for name, model in models.items():
+            data = X_scaled if name == "logistic_regression" else X
+            np.testing.assert_allclose(
+                loaded.models[name].predict_proba(data), model.predict_proba(data)
+            )
+
+    def test_arrays_are_memory_mapped(self, tmp_path, training_data):
+        """Test that linear weights and scaler parameters are memory-mapped."""
+        X, y = training_data
+        scaler = StandardScaler().fit(X)
+        save_artifacts(
+            tmp_path, {"lr": LogisticRegression().fit(X, y)}, scaler, FEATURES
+        )
+
+        mapped = load_artifacts(tmp_path)
+        assert isinstance(mapped.models["lr"].coef_, np.memmap)
+        assert isinstance(mapped.scaler.mean_, np.memmap)
+
+        in_memory = load_artifacts(tmp_path, mmap=False)
+        assert not isinstance(in_memory.models["lr"].coef_, np.memmap)
+
+    def test_forest_is_memory_mapped(self, tmp_path, training_data):
+        """Test that random forests predict from memory-mapped tree arrays."""
+        X, y = training_data
+        X = X.copy()
+        X.iloc[::5, 1] = np.nan
+        model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y)
+
+        save_artifacts(tmp_path, {"rf": model}, features=FEATURES)
+        loaded = load_artifacts(tmp_path).models["rf"]
+
+        assert isinstance(loaded, MappedForestClassifier)
+        assert isinstance(loaded.threshold, np.memmap)
+        assert not list((tmp_path / "models" / "rf").glob("*.joblib"))
+        np.testing.assert_array_equal(loaded.predict_proba(X), model.predict_proba(X))
+        np.testing.assert_array_equal(loaded.predict(X), model.predict(X))
+        with pytest.raises(ValueError, match="features"):
+            loaded.predict_proba(X[["PTS", "AST"]])
+
+    def test_errors_and_serving(self, tmp_path, training_data):
+        """Test missing artifacts and loading one model for serving."""
+        X, y = training_data
+        with pytest.raises(FileNotFoundError):
+            load_artifacts(tmp_path)
+
+        save_artifacts(
+            tmp_path,
+            {"a": LogisticRegression().fit(X, y), "b": LogisticRegression().fit(X, y)},
+            features=FEATURES,
+        )
+        with pytest.raises(KeyError):
+            load_artifacts(tmp_path, ["c"])
+        with pytest.raises(ValueError):
+            load_model_bundle(tmp_path)
+
+        bundle = load_model_bundle(tmp_path, "a")
+        assert bundle["scaler"] is None
+        assert bundle["features"] == FEATURES
+
+    def test_xgboost_round_trip(self, tmp_path, training_data):
+        """Test XGBoost models stored in their native format."""
+        xgboost = pytest.importorskip("xgboost")
+        X, y = training_data
+        model = xgboost.XGBClassifier(n_estimators=5).fit(X, y)
+
+        save_artifacts(tmp_path, {"xgb": model}, features=FEATURES)
+        loaded = load_artifacts(tmp_path).models["xgb"]
+
+        np.testing.assert_allclose(loaded.predict_proba(X), model.predict_proba(X))
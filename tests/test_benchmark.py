@@ -0,0 +1,73 @@
+"""
+Tests for benchmark module.
+"""
+
+import json
+import os
+
+from src.benchmark import benchmark_stage, main, run_benchmarks, synthetic_dataset
+
+
+class TestBenchmark:
+    """Test cases for the benchmark suite."""
+
+    def test_benchmark_stage_record(self):
+        """Test the timing and memory fields of a stage record."""
+        result, record = benchmark_stage("sum", sum, [1, 2, 3], rows=3, repeat=2)
+
+        assert result == 6
+        assert record["stage"] == "sum"
+        assert record["repeat"] == 2
+        assert record["rows"] == 3
+        assert record["seconds_min"] <= record["seconds_median"]
+        assert record["peak_memory_bytes"] >= 0
+
+    def test_synthetic_dataset_is_reused(self, tmp_path):
+        """Test that a generated dataset is not written twice."""
+        paths = synthetic_dataset(tmp_path, 0.02)
+        mtimes = [os.stat(path).st_mtime_ns for path in paths]
+
+        assert synthetic_dataset(tmp_path, 0.02) == paths
+        assert [os.stat(path).st_mtime_ns for path in paths] == mtimes
+
+    def test_run_benchmarks_covers_stages(self, tmp_path):
+        """Test that every stage is benchmarked at every scale."""
+        results = run_benchmarks(
+            scales=[0.02, 0.04], work_dir=tmp_path, repeat=1, measure_memory=False
+        )
+
+        stages = [record["stage"] for record in results["results"]]
+        assert stages.count("load_nba_data") == 2
+        assert stages[:7] == [
+            "load_nba_data",
+            "merge_datasets",
+            "clean_missing_values",
+            "process_height_weight",
+            "process_age_data",
+            "engineer_all_features",
+            "get_correlation_matrix",
+        ]
+        assert all(record["peak_memory_bytes"] is None for record in results["results"])
+
+    def test_main_writes_json(self, tmp_path):
+        """Test that the command line entry point writes readable JSON."""
+        output = tmp_path / "results.json"
+
+        main(
+            [
+                "--scales",
+                "0.02",
+                "--repeat",
+                "1",
+                "--work-dir",
+                str(tmp_path / "data"),
+                "--output",
+                str(output),
+            ]
+        )
+
+        with open(output, encoding="utf-8") as handle:
+            results = json.load(handle)
+        assert results["settings"]["scales"] == [0.02]
+        assert len(results["results"]) == 7
+        assert results["environment"]["pandas"]
@@ -0,0 +1,124 @@
+"""
+Tests for cli module.
+"""
+
+import importlib.util
+import json
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from src.cli import main
+
+
+class TestCli:
+    """Test cases for the command-line interface."""
+
+    def test_help_does_not_import_heavy_modules(self):
+        """Test that start-up only loads the standard library."""
+        code = (
+            "import sys\n"
+            "from src.cli import main\n"
+            "try:\n"
+            "    main(['train', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print([m for m in ('pandas', 'numpy', 'sklearn') if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_validation_errors(self, tmp_path, capsys):
+        """Test that invalid arguments are rejected before any work."""
+        with pytest.raises(SystemExit) as excinfo:
+            main(["features", str(tmp_path / "missing.parquet"), "out.parquet"])
+        assert excinfo.value.code == 2
+        assert "no such file" in capsys.readouterr().err
+
+        table = tmp_path / "table.parquet"
+        table.touch()
+        with pytest.raises(SystemExit):
+            main(["features", str(table), str(tmp_path / "out.txt")])
+        assert "expected one of" in capsys.readouterr().err
+
+        with pytest.raises(SystemExit):
+            main(["features", str(table), str(tmp_path / "out.csv"), "--unknown"])
+        assert "unrecognized arguments: --unknown" in capsys.readouterr().err
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("xgboost") is not None, reason="xgboost is installed"
+    )
+    def test_missing_xgboost(self, tmp_path, capsys):
+        """Test that models of missing packages are rejected up front."""
+        table = tmp_path / "table.parquet"
+        table.touch()
+        with pytest.raises(SystemExit) as excinfo:
+            main(["train", str(table), str(tmp_path / "models"), "--models", "xgboost"])
+        assert excinfo.value.code == 2
+        assert "xgboost is not installed" in capsys.readouterr().err
+
+    def test_benchmark_options(self, tmp_path, capsys):
+        """Test that benchmark options are passed to src.benchmark."""
+        output = tmp_path / "results.json"
+
+        status = main(
+            [
+                "benchmark",
+                "--scales",
+                "0.01",
+                "--repeat",
+                "1",
+                "--no-memory",
+                "--work-dir",
+                str(tmp_path / "work"),
+                "--output",
+                str(output),
+            ]
+        )
+
+        assert status == 0
+        assert f"Results written to {output}" in capsys.readouterr().out
+        results = json.loads(output.read_text())
+        assert {record["scale"] for record in results["results"]} == {0.01}
+
+    def test_pipeline(self, tmp_path, synthetic_paths, capsys):
+        """Test preprocessing, features, training and scoring end to end."""
+        player_data, seasons_stats, all_star = synthetic_paths
+        processed = tmp_path / "processed.parquet"
+        features = tmp_path / "features.parquet"
+        models = tmp_path / "models"
+        scores = tmp_path / "scores.csv"
+
+        assert (
+            main(
+                [
+                    "preprocess",
+                    "--player-data",
+                    player_data,
+                    "--seasons-stats",
+                    seasons_stats,
+                    "--all-star",
+                    all_star,
+                    "--output",
+                    str(processed),
+                ]
+            )
+            == 0
+        )
+        assert main(["features", str(processed), str(features)]) == 0
+        assert main(["train", str(features), str(models), "--last-season", "2015"]) == 0
+        assert (
+            main(["score", str(features), str(models), "--season", "2016", "--k", "5"])
+            == 0
+        )
+        assert "PlayerName" in capsys.readouterr().out
+        assert main(["score", str(features), str(models), "--output", str(scores)]) == 0
+
+        result = pd.read_csv(scores)
+        assert set(result["Year"]) == set(pd.read_parquet(features)["Year"])
+        assert (result.groupby("Year")["predicted_all_star"].sum() == 24).all()
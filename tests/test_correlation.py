@@ -0,0 +1,91 @@
+"""
+Tests for streaming correlation module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.correlation import CorrelationAccumulator, streaming_correlation
+
+
+@pytest.fixture
+def sample_frame():
+    """Correlated columns with missing values and a large offset."""
+    rng = np.random.default_rng(0)
+    n = 2000
+    df = pd.DataFrame(
+        {
+            "a": rng.normal(1e6, 1.0, n),
+            "b": rng.normal(5.0, 10.0, n),
+            "c": rng.normal(-3.0, 0.01, n),
+        }
+    )
+    df["b"] += (df["a"] - 1e6) * 5
+    df.loc[rng.random(n) < 0.1, "b"] = np.nan
+    df.loc[rng.random(n) < 0.2, "c"] = np.nan
+    return df
+
+
+def _chunks(df, size):
+    """Split a frame into row chunks."""
+    return [df.iloc[start : start + size] for start in range(0, len(df), size)]
+
+
+class TestCorrelation:
+    """Test cases for the one-pass correlation accumulator."""
+
+    def test_pairwise_matches_pandas(self, sample_frame):
+        """Test pairwise-complete correlations against DataFrame.corr."""
+        result = streaming_correlation(
+            _chunks(sample_frame, 170), ["a", "b", "c"], "pairwise"
+        )
+
+        pd.testing.assert_frame_equal(result, sample_frame.corr(), atol=1e-9)
+
+    def test_listwise_matches_dropna(self, sample_frame):
+        """Test listwise correlations against dropna().corr()."""
+        result = streaming_correlation(
+            _chunks(sample_frame, 170), ["a", "b", "c"], "listwise"
+        )
+
+        expected = sample_frame.dropna().corr()
+        pd.testing.assert_frame_equal(result, expected, atol=1e-9)
+
+    def test_merge_equals_single_pass(self, sample_frame):
+        """Test that merged partial results equal one accumulator."""
+        columns = ["a", "b", "c"]
+        single = CorrelationAccumulator(columns).update(sample_frame)
+
+        first = CorrelationAccumulator(columns).update(sample_frame.iloc[:700])
+        second = CorrelationAccumulator(columns).update(sample_frame.iloc[700:])
+        merged = first.merge(second)
+
+        pd.testing.assert_frame_equal(merged.count(), single.count())
+        pd.testing.assert_frame_equal(
+            merged.covariance(), sample_frame.cov(), rtol=1e-8
+        )
+        pd.testing.assert_frame_equal(
+            merged.correlation(), single.correlation(), atol=1e-12
+        )
+
+    def test_constant_and_sparse_columns(self):
+        """Test that undefined correlations are NaN, as in pandas."""
+        df = pd.DataFrame(
+            {
+                "x": [1.0, 2.0, 3.0],
+                "const": [4.0, 4.0, 4.0],
+                "one": [np.nan, 1.0, np.nan],
+            }
+        )
+
+        result = streaming_correlation([df], ["x", "const", "one"])
+
+        assert result.loc["x", "x"] == 1.0
+        assert np.isnan(result.loc["x", "const"])
+        assert np.isnan(result.loc["x", "one"])
+
+    def test_invalid_policy(self):
+        """Test that unknown NaN policies are rejected."""
+        with pytest.raises(ValueError):
+            CorrelationAccumulator(["x"], nan_policy="drop")
@@ -0,0 +1,140 @@
+"""
+Tests for data cache module.
+"""
+
+import pandas as pd
+import pytest
+
+from src import data_cache
+from src.data_cache import MANIFEST_NAME, csv_header, read_csv_cached
+from src.data_processing import load_nba_data
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Write a small CSV source file."""
+    path = tmp_path / "All_Star.csv"
+    pd.DataFrame({"Year": [2015, 2016], "Player": ["Player A", "Player B"]}).to_csv(
+        path, index=False
+    )
+    return path
+
+
+class TestDataCache:
+    """Test cases for the columnar CSV cache."""
+
+    def test_first_read_writes_cache(self, csv_file, tmp_path):
+        """Test that a cache file and manifest are created on first read."""
+        cache_dir = tmp_path / "processed"
+
+        result = read_csv_cached(csv_file, cache_dir)
+
+        assert list(result["Player"]) == ["Player A", "Player B"]
+        assert len(list(cache_dir.glob("All_Star-*.parquet"))) == 1
+        assert (cache_dir / MANIFEST_NAME).exists()
+
+    def test_second_read_skips_csv_parsing(self, csv_file, tmp_path, monkeypatch):
+        """Test that unchanged sources are served from the cache."""
+        cache_dir = tmp_path / "processed"
+        expected = read_csv_cached(csv_file, cache_dir)
+
+        def fail_read_csv(*args, **kwargs):
+            raise AssertionError("CSV should not be parsed again")
+
+        monkeypatch.setattr(data_cache.pd, "read_csv", fail_read_csv)
+        result = read_csv_cached(csv_file, cache_dir)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_changed_source_invalidates_cache(self, csv_file, tmp_path):
+        """Test that editing the source rebuilds and replaces the cache entry."""
+        cache_dir = tmp_path / "processed"
+        read_csv_cached(csv_file, cache_dir)
+
+        pd.DataFrame({"Year": [2017], "Player": ["Player C"]}).to_csv(
+            csv_file, index=False
+        )
+        result = read_csv_cached(csv_file, cache_dir)
+
+        assert list(result["Player"]) == ["Player C"]
+        assert len(list(cache_dir.glob("All_Star-*.parquet"))) == 1
+
+    def test_same_name_sources_keep_their_entries(self, csv_file, tmp_path):
+        """Test that same-named sources in other directories do not evict."""
+        cache_dir = tmp_path / "processed"
+        other = tmp_path / "other" / csv_file.name
+        other.parent.mkdir()
+        pd.DataFrame({"Year": [2017], "Player": ["Player C"]}).to_csv(
+            other, index=False
+        )
+
+        read_csv_cached(csv_file, cache_dir)
+        read_csv_cached(other, cache_dir)
+
+        assert len(list(cache_dir.glob("All_Star-*.parquet"))) == 2
+        assert list(read_csv_cached(csv_file, cache_dir)["Player"]) == [
+            "Player A",
+            "Player B",
+        ]
+        assert list(read_csv_cached(other, cache_dir)["Player"]) == ["Player C"]
+
+    def test_options_are_part_of_cache_key(self, csv_file, tmp_path):
+        """Test that different parsing options get separate cache entries."""
+        cache_dir = tmp_path / "processed"
+
+        full = read_csv_cached(csv_file, cache_dir)
+        pruned = read_csv_cached(csv_file, cache_dir, usecols=["Player"])
+
+        assert list(full.columns) == ["Year", "Player"]
+        assert list(pruned.columns) == ["Player"]
+        assert len(list(cache_dir.glob("All_Star-*.parquet"))) == 2
+
+    def test_filters_pushed_down_on_cache_hit(self, csv_file, tmp_path):
+        """Test that row filters apply to both cache misses and hits."""
+        cache_dir = tmp_path / "processed"
+        filters = [("Year", ">=", 2016)]
+
+        miss = read_csv_cached(csv_file, cache_dir, filters=filters)
+        hit = read_csv_cached(csv_file, cache_dir, filters=filters)
+
+        assert list(miss["Player"]) == ["Player B"]
+        pd.testing.assert_frame_equal(hit, miss)
+        assert len(read_csv_cached(csv_file, cache_dir)) == 2
+
+    def test_no_cache_dir_reads_csv(self, csv_file, tmp_path):
+        """Test that caching is skipped when no directory is given."""
+        result = read_csv_cached(csv_file)
+
+        assert len(result) == 2
+        assert not (tmp_path / "processed").exists()
+
+    def test_csv_header_is_cached(self, csv_file, tmp_path, monkeypatch):
+        """Test that the header of an unchanged source is read once."""
+        cache_dir = tmp_path / "processed"
+        assert csv_header(csv_file, cache_dir) == ["Year", "Player"]
+
+        def fail_read_csv(*args, **kwargs):
+            raise AssertionError("CSV should not be opened again")
+
+        monkeypatch.setattr(data_cache.pd, "read_csv", fail_read_csv)
+        assert csv_header(csv_file, cache_dir) == ["Year", "Player"]
+
+        monkeypatch.undo()
+        pd.DataFrame({"Season": [2017]}).to_csv(csv_file, index=False)
+        assert csv_header(csv_file, cache_dir) == ["Season"]
+
+    def test_typed_load_hit_skips_csv(self, raw_paths, tmp_path, monkeypatch):
+        """Test that typed loading does not open the CSVs on cache hits."""
+        cache_dir = tmp_path / "processed"
+        expected = load_nba_data(*raw_paths, cache_dir=cache_dir)
+
+        def fail_read_csv(*args, **kwargs):
+            raise AssertionError("CSV should not be opened again")
+
+        monkeypatch.setattr(data_cache.pd, "read_csv", fail_read_csv)
+        result = load_nba_data(*raw_paths, cache_dir=cache_dir)
+
+        for frame, expected_frame in zip(result, expected):
+            pd.testing.assert_frame_equal(frame, expected_frame)
@@ -7,8 +7,13 @@ import pandas as pd
 import pytest
 
 from src.data_processing import (
+    build_player_index,
     clean_missing_values,
+    encode_player_names,
     merge_datasets,
+    parse_birth_dates,
+    parse_heights,
+    preprocess_data,
     process_age_data,
     process_height_weight,
 )
@@ -45,6 +50,52 @@ class TestDataProcessing:
         assert result["is_all_star"].sum() == 1
         assert len(result) == 2
 
+    def test_merge_datasets_normalizes_names(self):
+        """Test that joins match names differing only in whitespace."""
+        player_data = pd.DataFrame({"name": ["Player A "], "weight": [200]})
+        seasons_stats = pd.DataFrame(
+            {"Player": [" Player A", "Player  B"], "Year": [2015.0, 2015.0]}
+        )
+        all_star = pd.DataFrame({"Player": ["Player B"], "Year": [2015]})
+
+        result = merge_datasets(player_data, seasons_stats, all_star)
+
+        assert list(result["PlayerName"]) == ["Player A", "Player B"]
+        assert result.loc[0, "weight"] == 200
+        assert list(result["is_all_star"]) == [0, 1]
+        assert result["player_id"].dtype == np.int32
+        assert result["player_id"].nunique() == 2
+
+    def test_merge_datasets_season_window(self):
+        """Test that the season window is applied before joining."""
+        player_data = pd.DataFrame({"name": ["Player A"], "weight": [200]})
+        seasons_stats = pd.DataFrame(
+            {"Player": ["Player A"] * 3, "Year": [1999.0, 2005.0, 2017.0]}
+        )
+        all_star = pd.DataFrame({"Player": ["Player A"] * 2, "Year": [1999, 2005]})
+
+        default = merge_datasets(player_data, seasons_stats, all_star)
+        narrow = merge_datasets(
+            player_data, seasons_stats, all_star, season_window=(1990, 2000)
+        )
+        full = merge_datasets(player_data, seasons_stats, all_star, season_window=None)
+
+        assert list(default["Year"]) == [2005]
+        assert list(narrow["Year"]) == [1999]
+        assert list(narrow["is_all_star"]) == [1]
+        assert list(full["is_all_star"]) == [1, 1, 0]
+
+    def test_encode_player_names(self):
+        """Test integer encoding against a player index."""
+        names = pd.Series(["Player A", " Player B", None, "Player A"])
+        player_index = build_player_index(names, pd.Series(["Player C"]))
+
+        ids = encode_player_names(names, player_index)
+
+        assert len(player_index) == 3
+        assert list(ids) == [0, 1, -1, 0]
+        assert list(encode_player_names(pd.Series(["Player Z"]), player_index)) == [-1]
+
     def test_clean_missing_values(self):
         """Test missing value cleaning."""
         df = pd.DataFrame(
@@ -66,6 +117,20 @@ class TestDataProcessing:
         # Check that college was filled
         assert result.loc[1, "college"] == "Unknown"
 
+    def test_clean_missing_values_categorical(self):
+        """Test that categorical text columns are filled with 'Unknown'."""
+        df = pd.DataFrame(
+            {
+                "college": pd.Series(["Duke", np.nan], dtype="category"),
+                "position": pd.Series([np.nan, "G"], dtype="category"),
+            }
+        )
+
+        result = clean_missing_values(df)
+
+        assert result.loc[1, "college"] == "Unknown"
+        assert result.loc[0, "position"] == "Unknown"
+
     def test_process_height_weight(self):
         """Test height and weight processing."""
         df = pd.DataFrame(
@@ -78,6 +143,27 @@ class TestDataProcessing:
         assert result.loc[0, "height_cm"] == pytest.approx(198.1, rel=1e-1)
         assert not pd.isna(result["weight"]).any()
 
+    def test_parse_heights_formats(self):
+        """Test feet-inches, metric and unparseable heights."""
+        heights = pd.Series(["6-10", "6-10", 180, "203", "6-", "tall", None])
+
+        result = parse_heights(heights)
+
+        assert result[0] == result[1] == 208.3
+        assert result[2] == 180.0
+        assert result[3] == 203.0
+        assert result[4:].isna().all()
+
+    def test_parse_heights_categorical(self):
+        """Test that categorical heights keep the row index."""
+        heights = pd.Series(["6-6", None, "6-6"], index=[5, 3, 1], dtype="category")
+
+        result = parse_heights(heights)
+
+        assert list(result.index) == [5, 3, 1]
+        assert result.dtype == float
+        assert result[5] == result[1] == 198.1
+
     def test_process_age_data(self):
         """Test age data processing."""
         df = pd.DataFrame(
@@ -95,3 +181,78 @@ class TestDataProcessing:
         assert result.loc[0, "age_calc"] == 25  # 2015 - 1990
         assert not pd.isna(result["year_start"]).any()
         assert not pd.isna(result["year_end"]).any()
+
+    def test_parse_birth_dates(self):
+        """Test the known format, the fallback and missing dates."""
+        dates = pd.Series(
+            ["June 24, 1985", "1990-01-01", None, "not a date", "June 24, 1985"]
+        )
+
+        result = parse_birth_dates(dates)
+
+        assert result.dtype == "datetime64[ns]"
+        assert result[0] == result[4] == pd.Timestamp("1985-06-24")
+        assert result[1] == pd.Timestamp("1990-01-01")
+        assert result[2:4].isna().all()
+
+    def test_process_age_data_reference_date(self):
+        """Test ages measured on a reference date of the season year."""
+        df = pd.DataFrame(
+            {
+                "birth_date": ["February 1, 1990", "February 2, 1990"],
+                "Year": [2015, 2015],
+            }
+        )
+
+        plain = process_age_data(df)
+        result = process_age_data(df, age_reference="02-01")
+
+        assert list(plain["age_calc"]) == [25, 25]
+        assert list(result["age_calc"]) == [25, 24]
+        with pytest.raises(ValueError):
+            process_age_data(df, age_reference="13-01")
+
+    def test_stages_copy_free_match_copy_path(self):
+        """Test that in-place stages give the same output as copying stages."""
+        df = pd.DataFrame(
+            {
+                "Year": [2015, 2015, 2016, 2016],
+                "blanl": [np.nan] * 4,
+                "FG": [8.0, 6.0, 5.0, 0.0],
+                "FGA": [16.0, 12.0, 10.0, 0.0],
+                "FG%": [0.5, np.nan, 0.5, np.nan],
+                "college": ["Duke", np.nan, "UNC", np.nan],
+                "height": ["6-6", "6-8", None, "7-0"],
+                "weight": [200, np.nan, 220, 250],
+                "birth_date": ["1990-01-01", "1985-06-15", None, "2010-01-01"],
+                "year_start": [2010, np.nan, 2012, 2015],
+                "year_end": [2018, np.nan, 2020, 2016],
+            }
+        )
+        original = df.copy()
+
+        expected = process_age_data(process_height_weight(clean_missing_values(df)))
+        pd.testing.assert_frame_equal(df, original)
+
+        result = clean_missing_values(df, copy=False)
+        result = process_height_weight(result, copy=False)
+        result = process_age_data(result, copy=False)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert len(result) == 3
+
+    def test_preprocess_data_copy_free(self, raw_paths):
+        """Test the copy-free pipeline and per-stage memory tracking."""
+        expected = preprocess_data(*raw_paths)
+        stage_memory = {}
+
+        result = preprocess_data(*raw_paths, copy=False, stage_memory=stage_memory)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert list(stage_memory) == [
+            "merge_datasets",
+            "clean_missing_values",
+            "process_height_weight",
+            "process_age_data",
+        ]
+        assert all(peak >= 0 for peak in stage_memory.values())
@@ -0,0 +1,110 @@
+"""
+Tests for feature engineering module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.feature_engineering import (
+    create_efficiency_features,
+    create_role_features,
+    engineer_all_features,
+    get_correlation_matrix,
+    safe_divide,
+)
+
+
+class TestFeatureEngineering:
+    """Test cases for feature engineering functions."""
+
+    def test_safe_divide(self):
+        """Test zero and missing denominators."""
+        numerator = pd.Series([10.0, 5.0, np.nan, 3.0])
+        denominator = pd.Series([2.0, 0.0, 4.0, np.nan])
+
+        result = safe_divide(numerator, denominator)
+
+        assert result[0] == 5.0
+        assert result[1] == 0.0
+        assert np.isnan(result[2])
+        assert np.isnan(result[3])
+
+    def test_safe_divide_keeps_float32(self):
+        """Test that float32 inputs produce float32 ratios."""
+        values = pd.Series([1.0, 2.0], dtype=np.float32)
+
+        assert safe_divide(values, values).dtype == np.float32
+
+    def test_create_efficiency_features(self):
+        """Test per-minute and assist-to-turnover features."""
+        df = pd.DataFrame(
+            {
+                "PTS": [100.0, 0.0],
+                "MP": [50.0, 0.0],
+                "AST": [10.0, 4.0],
+                "TOV": [5.0, 0.0],
+            }
+        )
+
+        result = create_efficiency_features(df)
+
+        assert result.loc[0, "pts_per_minute"] == pytest.approx(2.0)
+        assert result.loc[1, "pts_per_minute"] == 0.0
+        assert np.isfinite(result["pts_per_minute"]).all()
+        assert list(result["ast_to_turnover_ratio"]) == [2.0, 0.0]
+        assert "fga_per_minute" not in result.columns
+
+    def test_create_role_features(self):
+        """Test win share ratios with a zero WS season."""
+        df = pd.DataFrame({"OWS": [3.0, 0.0], "DWS": [1.0, 0.0], "WS": [4.0, 0.0]})
+
+        result = create_role_features(df)
+
+        assert list(result["offensive_ws_ratio"]) == [0.75, 0.0]
+        assert list(result["defensive_ws_ratio"]) == [0.25, 0.0]
+
+    def test_engineer_all_features_copy_free(self):
+        """Test that in-place feature engineering matches the copying path."""
+        df = pd.DataFrame(
+            {
+                "PTS": [100.0, 0.0],
+                "MP": [50.0, 0.0],
+                "AST": [10.0, 4.0],
+                "TOV": [5.0, 0.0],
+                "OWS": [3.0, 0.0],
+                "DWS": [1.0, 0.0],
+                "WS": [4.0, 0.0],
+                "year_start": [2005, 2010],
+                "year_end": [2015, 2012],
+            }
+        )
+        expected = engineer_all_features(df)
+        assert "years_played" not in df.columns
+
+        stage_memory = {}
+        result = engineer_all_features(df, copy=False, stage_memory=stage_memory)
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert result is df
+        assert set(stage_memory) == {
+            "create_efficiency_features",
+            "create_role_features",
+            "create_career_features",
+        }
+
+    def test_get_correlation_matrix(self):
+        """Test listwise and pairwise correlations with the target."""
+        df = pd.DataFrame(
+            {
+                "PTS": [10.0, 20.0, 30.0, np.nan, 50.0],
+                "AST": [1.0, 3.0, 2.0, 5.0, 4.0],
+                "is_all_star": [0, 0, 1, 1, 1],
+            }
+        )
+
+        listwise = get_correlation_matrix(df, ["PTS", "AST"], chunk_size=2)
+        pairwise = get_correlation_matrix(df, ["PTS", "AST"], nan_policy="pairwise")
+
+        pd.testing.assert_frame_equal(listwise, df.dropna().corr())
+        pd.testing.assert_frame_equal(pairwise, df.corr())
@@ -0,0 +1,100 @@
+"""
+Tests for feature store module.
+"""
+
+import shutil
+
+import pandas as pd
+import pytest
+
+from src.data_processing import preprocess_data
+from src.feature_engineering import FEATURE_VERSIONS, engineer_all_features
+from src.feature_store import FeatureStore
+from src.synthetic import write_synthetic_dataset
+
+
+@pytest.fixture(scope="module")
+def synthetic_dir(tmp_path_factory):
+    """Write a small synthetic dataset."""
+    out_dir = tmp_path_factory.mktemp("synthetic")
+    write_synthetic_dataset(out_dir, scale=0.1)
+    return out_dir
+
+
+@pytest.fixture
+def source_paths(synthetic_dir, tmp_path):
+    """Copy the synthetic dataset so a test can modify it."""
+    paths = []
+    for name in ("player_data.csv", "Seasons_Stats.csv", "All_Star.csv"):
+        paths.append(str(shutil.copy(synthetic_dir / name, tmp_path / name)))
+    return paths
+
+
+class TestFeatureStore:
+    """Test cases for the persistent feature store."""
+
+    def test_load_matches_pipeline(self, source_paths, tmp_path):
+        """Test that stored features equal the full pipeline output."""
+        store = FeatureStore(tmp_path / "store", *source_paths)
+
+        result = store.load()
+
+        expected = engineer_all_features(preprocess_data(*source_paths))
+        expected = expected.sort_values(["Year", "PlayerName"], kind="stable")
+        expected = expected.reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected[result.columns])
+
+    def test_materializes_only_missing_features(self, source_paths, tmp_path):
+        """Test that fresh features are not recomputed."""
+        store = FeatureStore(tmp_path / "store", *source_paths)
+
+        assert store.materialize(["PTS", "age_calc"]) == ["PTS", "age_calc"]
+        assert store.materialize(["PTS", "age_calc"]) == []
+        assert store.materialize(["PTS", "pts_per_minute"]) == ["pts_per_minute"]
+
+        reopened = FeatureStore(tmp_path / "store", *source_paths)
+        assert reopened.stale_features(["PTS", "pts_per_minute", "MP"]) == ["MP"]
+
+    def test_version_bump_marks_feature_stale(
+        self, source_paths, tmp_path, monkeypatch
+    ):
+        """Test that a new feature definition version is recomputed."""
+        store = FeatureStore(tmp_path / "store", *source_paths)
+        store.materialize(["PTS", "pts_per_minute"])
+
+        monkeypatch.setitem(FEATURE_VERSIONS, "pts_per_minute", 2)
+
+        assert store.stale_features(["PTS", "pts_per_minute"]) == ["pts_per_minute"]
+        assert store.materialize(["PTS", "pts_per_minute"]) == ["pts_per_minute"]
+
+    def test_source_change_rebuilds_store(self, source_paths, tmp_path):
+        """Test that changed raw data invalidates every stored feature."""
+        store = FeatureStore(tmp_path / "store", *source_paths)
+        before = store.load(["PTS"])
+
+        seasons = pd.read_csv(source_paths[1])
+        seasons = seasons[seasons["Year"] != 2005]
+        seasons.to_csv(source_paths[1], index=False)
+
+        assert store.stale_features(["PTS"]) == ["PTS"]
+        assert store.materialize(["PTS"]) == ["PTS"]
+        after = store.load(["PTS"])
+        assert len(after) < len(before)
+        assert 2005 not in set(after["Year"])
+
+    def test_point_lookup_and_season_scan(self, source_paths, tmp_path):
+        """Test player-season lookups and season-range scans."""
+        store = FeatureStore(tmp_path / "store", *source_paths)
+        features = ["PTS", "ast_to_turnover_ratio"]
+        stored = store.load(features)
+        row = stored.iloc[len(stored) // 2]
+
+        found = store.get(f" {row['PlayerName']} ", int(row["Year"]), features)
+        scanned = store.scan(2003, 2004, features)
+
+        assert len(found) == 1
+        assert found.iloc[0]["PTS"] == row["PTS"]
+        assert store.get("Unknown Player", int(row["Year"]), features).empty
+        pd.testing.assert_frame_equal(
+            scanned, stored[stored["Year"].between(2003, 2004)]
+        )
@@ -0,0 +1,138 @@
+"""
+Tests for incremental processing module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processing import (
+    collect_imputation_counts,
+    imputation_medians,
+    load_nba_data,
+    merge_imputation_counts,
+    preprocess_data,
+)
+from src.feature_engineering import engineer_all_features
+from src.incremental import (
+    append_season,
+    build_processed_store,
+    current_medians,
+    load_processed_dataset,
+)
+
+
+@pytest.fixture
+def two_season_paths(tmp_path):
+    """Write raw sources covering the 2015 and 2016 seasons."""
+    player_data = pd.DataFrame(
+        {
+            "name": ["Player A", "Player B", "Player C"],
+            "year_start": [2005, 2010, 2016],
+            "year_end": [2018, 2016, 2018],
+            "position": ["G", "F-C", "C"],
+            "height": ["6-6", "6-10", None],
+            "weight": [200, 240, np.nan],
+            "birth_date": ["June 24, 1985", "April 7, 1988", "May 1, 1995"],
+            "college": ["Duke University", "UCLA", np.nan],
+        }
+    )
+    seasons_stats = pd.DataFrame(
+        {
+            "Year": [2015, 2015, 2016, 2016, 2016],
+            "Player": ["Player A", "Player B", "Player A", "Player B", "Player C"],
+            "Pos": ["SG", "C", "SG", "C", "C"],
+            "MP": [2500.0, 1200.0, 2400.0, 900.0, 300.0],
+            "PTS": [1500.0, 600.0, 1400.0, 300.0, 80.0],
+            "AST": [300.0, 50.0, 280.0, 40.0, 5.0],
+            "TOV": [100.0, 30.0, 90.0, 20.0, 0.0],
+        }
+    )
+    all_star = pd.DataFrame({"Year": [2015, 2016], "Player": ["Player A"] * 2})
+
+    paths = []
+    for name, frame in [
+        ("player_data.csv", player_data),
+        ("Seasons_Stats.csv", seasons_stats),
+        ("All_Star.csv", all_star),
+    ]:
+        path = tmp_path / name
+        frame.to_csv(path, index=False)
+        paths.append(str(path))
+    return paths
+
+
+class TestIncremental:
+    """Test cases for incremental season ingestion."""
+
+    def test_imputation_medians_match_pandas(self):
+        """Test that count-based medians equal Series.median on the union."""
+        first = pd.DataFrame({"weight": [200.0, 215.0, np.nan, 230.0]})
+        second = pd.DataFrame({"weight": [190.0, 215.0]})
+
+        counts = merge_imputation_counts(
+            collect_imputation_counts(first), collect_imputation_counts(second)
+        )
+        medians = imputation_medians(counts)
+
+        expected = pd.concat([first, second])["weight"].median()
+        assert medians["weight"] == expected
+
+    def test_build_store_matches_full_pipeline(self, two_season_paths, tmp_path):
+        """Test that a freshly built store equals the batch pipeline."""
+        store_dir = tmp_path / "store"
+        window = (2015, 2016)
+
+        result = build_processed_store(store_dir, *two_season_paths, window)
+
+        expected = engineer_all_features(
+            preprocess_data(*two_season_paths, season_window=window)
+        )
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(load_processed_dataset(store_dir), expected)
+
+    def test_append_season_matches_full_rebuild(self, two_season_paths, tmp_path):
+        """Test that appending a season equals rebuilding both seasons."""
+        pytest.importorskip("pyarrow")
+        store_dir = tmp_path / "store"
+        build_processed_store(store_dir, *two_season_paths, (2015, 2015))
+
+        player_data, seasons_stats, all_star = load_nba_data(
+            *two_season_paths, season_window=(2016, 2016)
+        )
+        result = append_season(store_dir, player_data, seasons_stats, all_star)
+
+        expected = engineer_all_features(
+            preprocess_data(*two_season_paths, season_window=(2015, 2016))
+        )
+        pd.testing.assert_frame_equal(result, expected)
+        assert current_medians(store_dir)["weight"] == 220.0
+
+    def test_append_season_replaces_existing_season(self, two_season_paths, tmp_path):
+        """Test that re-ingesting a season does not duplicate its rows."""
+        store_dir = tmp_path / "store"
+        build_processed_store(store_dir, *two_season_paths, (2015, 2016))
+
+        player_data, seasons_stats, all_star = load_nba_data(
+            *two_season_paths, season_window=(2016, 2016)
+        )
+        append_season(store_dir, player_data, seasons_stats, all_star)
+        result = append_season(store_dir, player_data, seasons_stats, all_star)
+
+        assert len(result) == 5
+        assert result["Year"].value_counts()[2016] == 3
+
+    def test_append_season_keeps_player_ids(self, two_season_paths, tmp_path):
+        """Test that appended rows reuse the stored IDs of known players."""
+        store_dir = tmp_path / "store"
+        build_processed_store(store_dir, *two_season_paths, (2015, 2015))
+
+        player_data, seasons_stats, all_star = load_nba_data(
+            *two_season_paths, season_window=(2016, 2016)
+        )
+        seasons_stats = seasons_stats.iloc[::-1]
+        result = append_season(store_dir, player_data, seasons_stats, all_star)
+
+        ids = result.groupby("PlayerName")["player_id"].nunique()
+        assert (ids == 1).all()
+        assert result["player_id"].nunique() == 3
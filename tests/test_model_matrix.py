@@ -0,0 +1,105 @@
+"""
+Tests for model_matrix module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from src.model_matrix import (
+    build_model_matrix,
+    load_model_matrix,
+    season_rows,
+    standardize_inplace,
+    train_validation_split,
+)
+from src.training import run_sweep
+
+FEATURES = ["PTS", "AST", "TRB"]
+
+
+@pytest.fixture
+def engineered_df():
+    """Engineered-like frame with unsorted seasons and a missing value."""
+    rng = np.random.default_rng(0)
+    n = 400
+    df = pd.DataFrame(
+        rng.normal(100, 20, size=(n, 3)),
+        columns=FEATURES,
+        index=np.arange(n) * 3,
+    )
+    df["Year"] = rng.permutation(np.repeat(np.arange(2012, 2017), n // 5))
+    df["is_all_star"] = (df["PTS"] > 120).astype(int)
+    df.loc[df.index[5], "AST"] = np.nan
+    return df
+
+
+class TestModelMatrix:
+    """Test cases for the contiguous model matrix."""
+
+    def test_build(self, engineered_df):
+        """Test layout, ordering and values of the matrix."""
+        matrix = build_model_matrix(engineered_df, FEATURES)
+
+        assert matrix.X.dtype == np.float32
+        assert matrix.X.flags["C_CONTIGUOUS"]
+        assert (np.diff(matrix.years) >= 0).all()
+        expected = engineered_df.loc[matrix.index]
+        np.testing.assert_array_equal(
+            matrix.X, expected[FEATURES].to_numpy(dtype=np.float32)
+        )
+        np.testing.assert_array_equal(matrix.y, expected["is_all_star"])
+        with pytest.raises(KeyError):
+            build_model_matrix(engineered_df, ["PTS", "BLK"])
+
+    def test_splits_are_views_or_indices(self, engineered_df):
+        """Test season slices and stratified train/validation positions."""
+        matrix = build_model_matrix(engineered_df, FEATURES)
+
+        rows = season_rows(matrix, None, 2015)
+        history = matrix.X[rows]
+        assert np.shares_memory(history, matrix.X)
+        assert set(matrix.years[rows]) == {2012, 2013, 2014, 2015}
+        assert set(matrix.years[season_rows(matrix, 2016, 2016)]) == {2016}
+
+        train, validation = train_validation_split(matrix, rows)
+        assert len(train) + len(validation) == rows.stop - rows.start
+        assert not set(train) & set(validation)
+        assert matrix.years[validation].max() <= 2015
+
+    def test_standardize_inplace(self, engineered_df):
+        """Test in-place scaling against StandardScaler on the fit rows."""
+        matrix = build_model_matrix(engineered_df, FEATURES)
+        train, _ = train_validation_split(matrix)
+        original = matrix.X.astype(np.float64)
+        pointer = matrix.X.ctypes.data
+
+        scaler = standardize_inplace(matrix.X, train, chunk_rows=64)
+
+        expected = StandardScaler().fit(original[train])
+        np.testing.assert_allclose(scaler.mean_, expected.mean_, rtol=1e-6)
+        np.testing.assert_allclose(scaler.scale_, expected.scale_, rtol=1e-6)
+        assert matrix.X.ctypes.data == pointer
+        np.testing.assert_allclose(
+            matrix.X, expected.transform(original), rtol=1e-4, atol=1e-5
+        )
+
+    def test_memory_mapped(self, tmp_path, engineered_df):
+        """Test a file-backed matrix used by the training sweep."""
+        path = tmp_path / "X.npy"
+        matrix = build_model_matrix(engineered_df, FEATURES, path=path)
+        reopened = load_model_matrix(path, matrix)
+
+        assert isinstance(reopened.X, np.memmap)
+        np.testing.assert_array_equal(reopened.X, matrix.X)
+
+        standardize_inplace(reopened.X)
+        np.testing.assert_allclose(np.nanmean(np.load(path), axis=0), 0, atol=1e-5)
+        sweep = run_sweep(
+            np.nan_to_num(reopened.X),
+            reopened.y,
+            {"logistic_regression": {"C": [1.0]}},
+            n_jobs=1,
+        )
+        assert len(sweep) == 1
@@ -0,0 +1,176 @@
+"""
+Tests for name resolution module.
+"""
+
+import pandas as pd
+import pytest
+
+from src.data_processing import merge_datasets, preprocess_data
+from src.name_resolution import (
+    RESOLVED_SOURCES,
+    build_name_index,
+    candidate_positions,
+    canonical_name,
+    crosswalk_mapping,
+    load_crosswalk,
+    resolve_name,
+    save_crosswalk,
+    update_crosswalk,
+)
+
+
+@pytest.fixture
+def sources():
+    """Sources whose names differ by asterisks, accents and punctuation."""
+    player_data = pd.DataFrame(
+        {
+            "name": [
+                "Karl Malone",
+                "Jose Calderon",
+                "Tim Hardaway",
+                "Jermaine O'Neal",
+                "Kevin Garnett",
+            ],
+            "year_start": [1986, 2006, 1990, 1997, 1996],
+            "year_end": [2004, 2016, 2003, 2014, 2016],
+            "height": ["6-9", "6-3", "6-0", "6-11", "6-11"],
+            "weight": [250.0, 200.0, 195.0, 255.0, 240.0],
+            "birth_date": [
+                "July 24, 1963",
+                "September 28, 1981",
+                "September 1, 1966",
+                "October 13, 1978",
+                "May 19, 1976",
+            ],
+            "college": ["Louisiana Tech", None, "UTEP", None, None],
+        }
+    )
+    seasons_stats = pd.DataFrame(
+        {
+            "Year": [2001, 2006, 2001, 2001, 2001],
+            "Player": [
+                "Karl Malone*",
+                "José Calderón",
+                "Tim Hardaway*",
+                "Jermaine O Neal",
+                "Kevin Garnett",
+            ],
+            "Age": [37.0, 24.0, 34.0, 22.0, 24.0],
+            "PTS": [1878.0, 400.0, 600.0, 1000.0, 1800.0],
+        }
+    )
+    all_star = pd.DataFrame(
+        {
+            "Player": ["Karl Malone", "Jermaine O'Neal", "Kevin Garnett"],
+            "Year": [2001, 2001, 2001],
+        }
+    )
+    return player_data, seasons_stats, all_star
+
+
+class TestNameResolution:
+    """Test cases for blocking-indexed player-name resolution."""
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("Karl Malone*", "karl malone"),
+            ("José Calderón", "jose calderon"),
+            ("Tim Hardaway Jr.", "tim hardaway"),
+            ("Shaquille O'Neal", "shaquille oneal"),
+            ("Karl-Anthony Towns", "karl anthony towns"),
+            ("Glen Rice Sr.", "glen rice"),
+        ],
+    )
+    def test_canonical_name(self, name, expected):
+        """Test that accents, asterisks, punctuation and suffixes are removed."""
+        assert canonical_name(name) == expected
+
+    def test_candidates_come_from_blocks(self):
+        """Test that only names sharing a block are scored."""
+        index = build_name_index(
+            ["Kevin Garnett", "Kevin Martin", "Kenyon Martin", "Jermaine O'Neal"],
+            [1976, 1983, 1977, 1978],
+        )
+
+        assert candidate_positions(index, "kenyon martin") == [1, 2]
+        # Surname typo: found through the first name and birth year block
+        assert candidate_positions(index, "kevin garnet", 1977) == [0]
+        assert candidate_positions(index, "kevin garnet", 1990) == []
+
+    def test_resolve_name_methods(self):
+        """Test exact, canonical, fuzzy and unresolved matches."""
+        index = build_name_index(
+            ["Karl Malone", "Jermaine O'Neal", "Eddie Johnson", "Eddie Johnson"],
+            [1963, 1978, 1959, 1955],
+        )
+
+        assert resolve_name("Karl Malone", index) == ("Karl Malone", 1.0, "exact")
+        assert resolve_name("Karl Malone*", index)[::2] == ("Karl Malone", "canonical")
+        resolved, score, method = resolve_name("Jermaine O Neal", index, 1978)
+        assert (resolved, method) == ("Jermaine O'Neal", "fuzzy")
+        assert 0.88 <= score < 1.0
+        assert resolve_name("Moses Malone", index)[2] == "unresolved"
+
+    def test_birth_year_separates_namesakes(self):
+        """Test that birth years pick between canonical namesakes."""
+        index = build_name_index(["Patrick Ewing", "Patrick Ewing Jr."], [1962, 1984])
+
+        assert resolve_name("Patrick Ewing*", index, 1962)[0] == "Patrick Ewing"
+        assert resolve_name("Patrick Ewing*", index, 1984)[0] == "Patrick Ewing Jr."
+        assert resolve_name("Patrick Ewing*", index)[2] == "ambiguous"
+
+    def test_update_crosswalk_persists_and_reuses(self, sources, tmp_path):
+        """Test that stored entries, including manual edits, are reused."""
+        path = tmp_path / "crosswalk.csv"
+        crosswalk = update_crosswalk(path, *sources)
+
+        assert path.exists()
+        assert set(crosswalk["source"]) == set(RESOLVED_SOURCES)
+        assert crosswalk_mapping(crosswalk, "seasons_stats") == {
+            "Karl Malone*": "Karl Malone",
+            "José Calderón": "Jose Calderon",
+            "Tim Hardaway*": "Tim Hardaway",
+            "Jermaine O Neal": "Jermaine O'Neal",
+        }
+
+        # A manual correction is kept, as nothing is resolved again
+        crosswalk.loc[crosswalk["name"] == "Tim Hardaway*", "resolved_name"] = None
+        save_crosswalk(crosswalk, path)
+        reused = update_crosswalk(path, *sources)
+        assert "Tim Hardaway*" not in crosswalk_mapping(reused, "seasons_stats")
+        pd.testing.assert_frame_equal(reused, load_crosswalk(path))
+
+    def test_merge_with_crosswalk(self, sources, tmp_path):
+        """Test that resolved names join demographics and All-Star labels."""
+        crosswalk = update_crosswalk(tmp_path / "crosswalk.csv", *sources)
+        name_map = {
+            source: crosswalk_mapping(crosswalk, source) for source in RESOLVED_SOURCES
+        }
+
+        plain = merge_datasets(*sources, season_window=None)
+        resolved = merge_datasets(*sources, season_window=None, name_crosswalk=name_map)
+
+        assert plain["birth_date"].isna().sum() == 4
+        assert resolved["birth_date"].notna().all()
+        assert plain["is_all_star"].sum() == 1
+        assert resolved["is_all_star"].sum() == 3
+        assert resolved["PlayerName"].iloc[0] == "Karl Malone"
+
+    def test_preprocess_with_crosswalk(self, sources, tmp_path):
+        """Test that preprocess_data creates and applies the crosswalk."""
+        paths = []
+        for frame, name in zip(sources, ["players", "seasons", "all_star"]):
+            path = tmp_path / f"{name}.csv"
+            frame.to_csv(path, index=False)
+            paths.append(str(path))
+        crosswalk_path = tmp_path / "crosswalk.csv"
+
+        df = preprocess_data(*paths, name_crosswalk=str(crosswalk_path))
+
+        assert crosswalk_path.exists()
+        assert df["is_all_star"].sum() == 3
+        with pytest.raises(ValueError, match="polars"):
+            preprocess_data(
+                *paths, name_crosswalk=str(crosswalk_path), backend="polars"
+            )
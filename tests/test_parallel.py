@@ -0,0 +1,103 @@
+"""
+Tests for parallel execution module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processing import preprocess_data
+from src.feature_engineering import engineer_all_features
+from src.parallel import concat_partitions, resolve_n_jobs, split_rows
+
+
+@pytest.fixture
+def varied_paths(tmp_path):
+    """Write raw sources with missing values spread over many rows."""
+    rng = np.random.default_rng(0)
+    n_players, n_rows = 40, 200
+
+    names = [f"Player {i}" for i in range(n_players)]
+    heights = [f"{rng.integers(5, 8)}-{rng.integers(0, 12)}" for _ in names]
+    heights[3] = None
+    weights = rng.integers(170, 280, n_players).astype(float)
+    weights[[5, 17]] = np.nan
+    birth_dates = [
+        f"June {rng.integers(1, 28)}, {rng.integers(1970, 1998)}" for _ in names
+    ]
+    birth_dates[8] = None
+    birth_dates[9] = "June 1, 2010"
+    player_data = pd.DataFrame(
+        {
+            "name": names,
+            "year_start": rng.integers(1990, 2010, n_players),
+            "year_end": rng.integers(2010, 2018, n_players),
+            "position": rng.choice(["G", "F", "C", "G-F"], n_players),
+            "height": heights,
+            "weight": weights,
+            "birth_date": birth_dates,
+            "college": rng.choice(["Duke", "UCLA", None], n_players),
+        }
+    )
+    stats = {
+        col: rng.uniform(0, 100, n_rows)
+        for col in ["PTS", "AST", "TOV", "FG", "FGA", "OWS", "DWS", "WS"]
+    }
+    stats["MP"] = rng.choice([0.0, 500.0, 1500.0], n_rows)
+    stats["FG%"] = np.where(rng.random(n_rows) < 0.2, np.nan, 0.45)
+    seasons_stats = pd.DataFrame(
+        {
+            "Year": rng.integers(2000, 2017, n_rows),
+            "Player": rng.choice(names + ["Unknown Player"], n_rows),
+            "Pos": rng.choice(["PG", "SG", "C"], n_rows),
+            **stats,
+        }
+    )
+    all_star = seasons_stats.sample(20, random_state=0)[["Year", "Player"]]
+
+    paths = []
+    for name, frame in [
+        ("player_data.csv", player_data),
+        ("Seasons_Stats.csv", seasons_stats),
+        ("All_Star.csv", all_star),
+    ]:
+        path = tmp_path / name
+        frame.to_csv(path, index=False)
+        paths.append(str(path))
+    return paths
+
+
+class TestParallel:
+    """Test cases for partitioned parallel execution."""
+
+    def test_resolve_n_jobs(self):
+        """Test worker count resolution."""
+        assert resolve_n_jobs(None) == 1
+        assert resolve_n_jobs(4) == 4
+        assert resolve_n_jobs(-1) >= 1
+
+    def test_split_rows_round_trip(self):
+        """Test that chunks concatenate back to the original frame."""
+        df = pd.DataFrame({"a": range(10), "b": list("abcdefghij")}, index=range(5, 15))
+
+        parts = split_rows(df, 3)
+
+        assert len(parts) == 3
+        pd.testing.assert_frame_equal(concat_partitions(parts), df)
+
+    def test_preprocess_parallel_matches_serial(self, varied_paths):
+        """Test that the parallel preprocessing result equals the serial one."""
+        expected = preprocess_data(*varied_paths)
+
+        result = preprocess_data(*varied_paths, n_jobs=3)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_engineer_parallel_matches_serial(self, varied_paths):
+        """Test that parallel feature engineering equals the serial result."""
+        df = preprocess_data(*varied_paths)
+        expected = engineer_all_features(df)
+
+        result = engineer_all_features(df, n_jobs=2)
+
+        pd.testing.assert_frame_equal(result, expected)
@@ -0,0 +1,61 @@
+"""
+Tests for pipeline planner module.
+"""
+
+import pandas as pd
+import pytest
+
+from src.data_processing import preprocess_data
+from src.feature_engineering import engineer_all_features
+from src.planner import plan_pipeline, required_raw_columns, run_planned_pipeline
+
+
+class TestPlanner:
+    """Test cases for the column-pruned pipeline planner."""
+
+    def test_required_raw_columns(self):
+        """Test that derived features resolve to their raw inputs."""
+        columns = required_raw_columns(["ast_to_turnover_ratio", "3P%", "age_calc"])
+
+        assert columns["seasons_stats"] == [
+            "Year",
+            "Player",
+            "3P",
+            "3PA",
+            "3P%",
+            "AST",
+            "TOV",
+        ]
+        assert columns["player_data"] == ["name", "birth_date"]
+        assert columns["all_star"] == ["Year", "Player"]
+
+    def test_unknown_feature_raises(self):
+        """Test that features without a known source are rejected."""
+        with pytest.raises(ValueError, match="not_a_feature"):
+            plan_pipeline(["PTS", "not_a_feature"])
+
+    def test_plan_skips_unneeded_stages(self):
+        """Test that a scoring-only feature list skips most stages."""
+        plan = plan_pipeline(["PTS", "PER"])
+
+        assert "process_height_weight" not in plan.stages
+        assert "add_ratio_features" not in plan.stages
+        assert "create_career_features" not in plan.stages
+        assert "height" not in plan.columns["player_data"]
+
+    @pytest.mark.parametrize(
+        "features",
+        [
+            None,
+            ["PTS", "age_calc"],
+            ["fga_per_minute", "offensive_ws_ratio", "eFG%", "college"],
+        ],
+    )
+    def test_planned_pipeline_matches_full_pipeline(self, synthetic_paths, features):
+        """Test that planned columns equal the full pipeline output."""
+        result = run_planned_pipeline(*synthetic_paths, features=features)
+
+        full = engineer_all_features(preprocess_data(*synthetic_paths))
+        pd.testing.assert_frame_equal(result, full[result.columns])
+        expected = features or plan_pipeline().features
+        assert list(result.columns[4:]) == expected
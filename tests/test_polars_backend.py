@@ -0,0 +1,97 @@
+"""
+Tests for Polars backend module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processing import preprocess_data
+from src.feature_engineering import engineer_all_features
+from src.polars_backend import polars_available
+
+requires_polars = pytest.mark.skipif(
+    not polars_available(), reason="polars is not installed"
+)
+
+
+def _comparable(df):
+    """Frame with text and categoricals as objects and a fresh index."""
+    df = df.reset_index(drop=True)
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype) or (
+            pd.api.types.is_string_dtype(df[col])
+        ):
+            df[col] = df[col].astype(object).where(df[col].notna(), None)
+        elif pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = df[col].astype("datetime64[ns]")
+    return df
+
+
+def _assert_equivalent(result, expected):
+    """Assert equal values and column order, ignoring storage dtypes."""
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(
+        _comparable(result), _comparable(expected), check_dtype=False, rtol=1e-6
+    )
+
+
+class TestBackendSelection:
+    """Test cases for choosing the execution backend."""
+
+    def test_unknown_backend_raises(self, synthetic_paths):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown backend"):
+            preprocess_data(*synthetic_paths, backend="spark")
+        with pytest.raises(ValueError, match="Unknown backend"):
+            engineer_all_features(pd.DataFrame(), backend="spark")
+
+    @pytest.mark.skipif(polars_available(), reason="polars is installed")
+    def test_missing_polars_raises(self, synthetic_paths):
+        """Test that the Polars backend explains how to install Polars."""
+        with pytest.raises(ImportError, match="polars"):
+            preprocess_data(*synthetic_paths, backend="polars")
+
+
+@requires_polars
+class TestPolarsBackend:
+    """Test cases for the Polars preprocessing and feature backend."""
+
+    @pytest.mark.parametrize("age_reference", [None, "02-01"])
+    def test_preprocess_matches_pandas(self, synthetic_paths, age_reference):
+        """Test that the Polars plan equals the pandas preprocessing."""
+        result = preprocess_data(
+            *synthetic_paths, age_reference=age_reference, backend="polars"
+        )
+
+        expected = preprocess_data(*synthetic_paths, age_reference=age_reference)
+        _assert_equivalent(result, expected)
+
+    @pytest.mark.parametrize("season_window", [(2000, 2016), None])
+    def test_preprocess_matches_pandas_edge_cases(self, edge_case_paths, season_window):
+        """Test parity on stray text, zero attempts and messy names."""
+        result = preprocess_data(
+            *edge_case_paths, season_window=season_window, backend="polars"
+        )
+
+        expected = preprocess_data(*edge_case_paths, season_window=season_window)
+        _assert_equivalent(result, expected)
+        assert np.isinf(result.loc[result["PlayerName"] == "Rookie", "FG%"]).all()
+
+    def test_engineer_matches_pandas(self, synthetic_paths):
+        """Test that the Polars features equal the pandas features."""
+        df = preprocess_data(*synthetic_paths)
+
+        result = engineer_all_features(df, backend="polars")
+
+        _assert_equivalent(result, engineer_all_features(df))
+        assert "pts_per_minute" not in df.columns
+
+    def test_engineer_in_place(self, synthetic_paths):
+        """Test that copy=False adds the features to the input frame."""
+        df = preprocess_data(*synthetic_paths)
+
+        result = engineer_all_features(df, copy=False, backend="polars")
+
+        assert result is df
+        assert "years_played" in df.columns
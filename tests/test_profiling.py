@@ -0,0 +1,110 @@
+"""
+Tests for profiling module.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import preprocess_data
+from src.feature_engineering import engineer_all_features
+from src.profiling import (
+    StageProfiler,
+    format_summary,
+    read_jsonl,
+    run_stage,
+    track_peak_memory,
+)
+
+
+class TestProfiling:
+    """Test cases for memory tracking helpers."""
+
+    def test_track_peak_memory(self):
+        """Test that a temporary allocation shows up in the peak."""
+        with track_peak_memory() as tracker:
+            buffer = np.ones(1_000_000)
+            del buffer
+
+        assert tracker.peak_bytes >= 8_000_000
+        assert not tracemalloc.is_tracing()
+
+    def test_nested_trackers_report_to_outer(self):
+        """Test that an inner tracker does not hide the outer peak."""
+        with track_peak_memory() as outer:
+            with track_peak_memory() as inner:
+                buffer = np.ones(1_000_000)
+                del buffer
+
+        assert inner.peak_bytes >= 8_000_000
+        assert outer.peak_bytes >= inner.peak_bytes
+
+    def test_run_stage_records_memory(self):
+        """Test that run_stage stores the stage peak under its name."""
+        stage_memory = {}
+
+        result = run_stage(
+            "double", lambda x, factor: x * factor, 2, stage_memory, factor=3
+        )
+
+        assert result == 6
+        assert "double" in stage_memory
+
+    def test_profiler_records_stage(self):
+        """Test the timing, memory and shape fields of a stage record."""
+        profiler = StageProfiler()
+        df = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+
+        result = run_stage(
+            "add", lambda frame: frame.assign(b=frame["a"] + 1), df, profiler=profiler
+        )
+
+        (record,) = profiler.records
+        assert list(result.columns) == ["a", "b"]
+        assert record["stage"] == "add"
+        assert record["wall_seconds"] >= 0
+        assert record["cpu_seconds"] >= 0
+        assert record["peak_memory_bytes"] >= 0
+        assert (record["rows_in"], record["columns_in"]) == (3, 1)
+        assert (record["rows_out"], record["columns_out"]) == (3, 2)
+
+    def test_profiler_hooks_and_disabled_memory(self):
+        """Test that hooks see each record and memory can be skipped."""
+        seen = []
+        profiler = StageProfiler(measure_memory=False, hooks=[seen.append])
+
+        run_stage("noop", lambda x: x, 1, profiler=profiler)
+
+        assert seen == profiler.records
+        assert seen[0]["peak_memory_bytes"] is None
+        assert not tracemalloc.is_tracing()
+
+    def test_pipeline_profile_and_exporters(self, raw_paths, tmp_path):
+        """Test profiling preprocess_data and engineer_all_features."""
+        profiler = StageProfiler()
+
+        engineer_all_features(
+            preprocess_data(*raw_paths, profiler=profiler), profiler=profiler
+        )
+
+        stages = [record["stage"] for record in profiler.records]
+        assert stages == [
+            "load_nba_data",
+            "merge_datasets",
+            "clean_missing_values",
+            "process_height_weight",
+            "process_age_data",
+            "create_efficiency_features",
+            "create_role_features",
+            "create_career_features",
+        ]
+
+        path = tmp_path / "profile.jsonl"
+        profiler.write_jsonl(path)
+        profiler.write_jsonl(path)
+        assert read_jsonl(path) == profiler.records * 2
+
+        summary = format_summary(profiler.records)
+        assert "process_age_data" in summary
+        assert summary.splitlines()[-1].startswith("total")
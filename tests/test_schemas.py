@@ -0,0 +1,71 @@
+"""
+Tests for schemas module and typed loading.
+"""
+
+import numpy as np
+import pandas as pd
+
+from src.data_processing import compare_load_memory, load_nba_data
+from src.schemas import SEASONS_STATS_SCHEMA, apply_schema, csv_read_options
+
+
+class TestSchemas:
+    """Test cases for schema-driven loading."""
+
+    def test_csv_read_options_prunes_undeclared_columns(self):
+        """Test that undeclared columns are left out of usecols."""
+        header = ["Unnamed: 0", "Year", "Player", "blanl", "PTS", "blank2"]
+
+        options = csv_read_options(SEASONS_STATS_SCHEMA, header)
+
+        assert options["usecols"] == ["Year", "Player", "PTS"]
+        assert options["dtype"]["PTS"] == "float32"
+
+    def test_apply_schema_narrows_integers(self):
+        """Test that complete integer columns become int16."""
+        df = pd.DataFrame({"Year": [2015.0, 2016.0], "PTS": ["10", "bad"]})
+
+        result = apply_schema(df, SEASONS_STATS_SCHEMA)
+
+        assert result["Year"].dtype == np.int16
+        assert result["PTS"].dtype == np.float32
+        assert pd.isna(result.loc[1, "PTS"])
+        assert df["Year"].dtype == np.float64
+        assert list(df["PTS"]) == ["10", "bad"]
+
+    def test_load_nba_data_typed(self, raw_paths):
+        """Test that typed loading prunes junk columns and blank rows."""
+        player_data, seasons_stats, all_star = load_nba_data(*raw_paths)
+
+        assert "blanl" not in seasons_stats.columns
+        assert "Unnamed: 0" not in seasons_stats.columns
+        assert len(seasons_stats) == 2
+        assert seasons_stats["Year"].dtype == np.int16
+        assert isinstance(seasons_stats["Pos"].dtype, pd.CategoricalDtype)
+        assert isinstance(player_data["college"].dtype, pd.CategoricalDtype)
+        assert player_data["weight"].dtype == np.float32
+        assert all_star["Year"].dtype == np.int16
+
+    def test_load_nba_data_untyped(self, raw_paths):
+        """Test that untyped loading keeps every column."""
+        _, seasons_stats, _ = load_nba_data(*raw_paths, typed=False)
+
+        assert "blanl" in seasons_stats.columns
+        assert len(seasons_stats) == 3
+
+    def test_compare_load_memory(self, raw_paths):
+        """Test the before/after memory report."""
+        report = compare_load_memory(*raw_paths)
+
+        assert list(report.index) == [
+            "player_data",
+            "seasons_stats",
+            "all_star",
+            "merged",
+            "total",
+        ]
+        assert (
+            report.loc["seasons_stats", "columns_after"]
+            < report.loc["seasons_stats", "columns_before"]
+        )
+        assert (report["memory_after_mb"] > 0).all()
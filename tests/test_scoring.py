@@ -0,0 +1,70 @@
+"""
+Tests for scoring module.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from src.scoring import score_seasons, top_k_mask, top_k_per_group
+
+
+class TestScoring:
+    """Test cases for batch scoring and top-K selection."""
+
+    def test_top_k_mask_matches_sort(self):
+        """Test partial selection against a full sort."""
+        scores = np.random.default_rng(0).random(500)
+
+        result = top_k_mask(scores, 24)
+
+        expected = np.zeros(500, dtype=bool)
+        expected[np.argsort(-scores)[:24]] = True
+        np.testing.assert_array_equal(result, expected)
+
+    def test_top_k_mask_ties_and_edges(self):
+        """Test ties at the cut-off, NaN scores and small inputs."""
+        scores = np.array([0.5, 0.9, 0.5, np.nan, 0.5])
+
+        assert list(top_k_mask(scores, 2)) == [True, True, False, False, False]
+        assert top_k_mask(scores, 10).all()
+        assert not top_k_mask(scores, 0).any()
+
+    def test_top_k_per_group(self):
+        """Test that each group gets its own top-K."""
+        scores = np.array([0.1, 0.9, 0.8, 0.2, 0.3, 0.7])
+        groups = np.array([2015, 2015, 2016, 2016, 2015, 2016])
+
+        result = top_k_per_group(scores, groups, 2)
+
+        assert list(result) == [False, True, True, False, True, True]
+
+    def test_score_seasons(self):
+        """Test scoring several seasons with a scaled logistic regression."""
+        rng = np.random.default_rng(1)
+        n = 120
+        df = pd.DataFrame(
+            {
+                "PlayerName": [f"Player {i}" for i in range(n)],
+                "Year": np.repeat([2014, 2015, 2016], n // 3),
+                "PTS": rng.normal(800, 300, n),
+                "AST": rng.normal(200, 80, n),
+            },
+            index=np.arange(n) * 2,
+        )
+        df["is_all_star"] = (df["PTS"] > 1100).astype(int)
+        features = ["PTS", "AST"]
+        scaler = StandardScaler().fit(df[features])
+        model = LogisticRegression().fit(
+            scaler.transform(df[features]), df["is_all_star"]
+        )
+
+        result = score_seasons(model, df, features, k=5, scaler=scaler)
+
+        assert result.index.equals(df.index)
+        assert result.groupby("Year")["predicted_all_star"].sum().tolist() == [5] * 3
+        top = result[result["season_rank"] == 1]
+        best = result.groupby("Year")["all_star_probability"].max()
+        assert top.set_index("Year")["all_star_probability"].equals(best)
+        assert result.loc[result["predicted_all_star"] == 0, "season_rank"].isna().all()
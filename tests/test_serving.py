@@ -0,0 +1,146 @@
+"""
+Tests for serving module.
+"""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from src.serving import (
+    MicroBatcher,
+    create_server,
+    load_model_bundle,
+    save_model_bundle,
+)
+
+FEATURES = ["PTS", "AST"]
+
+
+def _post(url, payload):
+    """POST JSON and return (status, decoded body)."""
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+class TestServing:
+    """Test cases for the prediction server."""
+
+    def test_micro_batcher_groups_requests(self):
+        """Test that concurrent requests share model calls."""
+        calls = []
+
+        def predict(X):
+            calls.append(len(X))
+            time.sleep(0.01)
+            return X["PTS"].to_numpy() * 2
+
+        batcher = MicroBatcher(predict, FEATURES, max_batch_size=8, max_wait_ms=20)
+        results = {}
+
+        def request(i):
+            results[i] = batcher.predict_instances([{"PTS": i, "AST": 0}], timeout=5)
+
+        threads = [threading.Thread(target=request, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batcher.close()
+
+        assert {i: list(v) for i, v in results.items()} == {
+            i: [2.0 * i] for i in range(16)
+        }
+        assert len(calls) < 16
+        metrics = batcher.metrics.snapshot()
+        assert metrics["batches"] == len(calls)
+        assert metrics["instances"] == 16
+
+    def test_missing_feature(self):
+        """Test that instances must provide every model feature."""
+        batcher = MicroBatcher(lambda X: np.zeros(len(X)), FEATURES)
+        with pytest.raises(ValueError, match="AST"):
+            batcher.submit([{"PTS": 1.0}])
+        batcher.close()
+
+    @pytest.mark.parametrize("value", [None, float("nan"), float("inf")])
+    def test_non_finite_value(self, value):
+        """Test that null and non-finite values are rejected per request."""
+        batcher = MicroBatcher(lambda X: np.zeros(len(X)), FEATURES)
+        with pytest.raises(ValueError, match="non-finite value for PTS"):
+            batcher.submit([{"PTS": 1.0, "AST": 0.0}, {"PTS": value, "AST": 0.0}])
+        batcher.close()
+
+    def test_failed_request_does_not_fail_batch(self):
+        """Test that a failing request leaves the rest of its batch scored."""
+        calls = []
+
+        def predict(X):
+            calls.append(len(X))
+            if (X["PTS"] < 0).any():
+                raise ValueError("negative points")
+            return X["PTS"].to_numpy() * 2
+
+        batcher = MicroBatcher(predict, FEATURES, max_batch_size=8, max_wait_ms=200)
+        good = batcher.submit([{"PTS": 1.0, "AST": 2.0}])
+        bad = batcher.submit([{"PTS": -1.0, "AST": 2.0}])
+
+        assert list(good.result(timeout=5)) == [2.0]
+        with pytest.raises(ValueError, match="negative points"):
+            bad.result(timeout=5)
+        batcher.close()
+        assert calls == [2, 1, 1]
+        assert batcher.metrics.snapshot()["instances"] == 1
+
+    def test_server_round_trip(self, tmp_path):
+        """Test predictions, metrics and errors over HTTP."""
+        rng = np.random.default_rng(0)
+        X = pd.DataFrame(rng.normal(size=(60, 2)), columns=FEATURES)
+        y = (X["PTS"] > 0).astype(int)
+        scaler = StandardScaler().fit(X)
+        model = LogisticRegression().fit(scaler.transform(X), y)
+        bundle = load_model_bundle(
+            save_model_bundle(tmp_path / "model.joblib", model, scaler, FEATURES)
+        )
+
+        server, batcher = create_server(bundle, port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            instances = X.head(3).to_dict(orient="records")
+            status, body = _post(f"{base}/predict", {"instances": instances})
+            assert status == 200
+            expected = model.predict_proba(scaler.transform(X.head(3)))[:, 1]
+            np.testing.assert_allclose(body["probabilities"], expected)
+
+            status, body = _post(f"{base}/predict", {"instances": [{"PTS": 1}]})
+            assert status == 400
+            status, body = _post(f"{base}/predict", [1, 2])
+            assert status == 400
+            assert "instances" in body["error"]
+
+            with urllib.request.urlopen(f"{base}/metrics", timeout=10) as response:
+                metrics = json.loads(response.read())
+            assert metrics["requests"] == 3
+            assert metrics["errors"] == 2
+            assert metrics["latency_ms"]["p50"] is not None
+        finally:
+            server.shutdown()
+            server.server_close()
+            batcher.close()
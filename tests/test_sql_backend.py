@@ -0,0 +1,135 @@
+"""
+Tests for SQL backend module.
+"""
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processing import clean_missing_values, load_nba_data, merge_datasets
+from src.planner import plan_pipeline, run_planned_pipeline
+from src.sql_backend import ingest_sources, merge_and_clean_sql, run_sql_pipeline
+
+
+def _comparable(df):
+    """Frame with text and categoricals as objects and a fresh index."""
+    df = df.reset_index(drop=True)
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype) or (
+            pd.api.types.is_string_dtype(df[col])
+        ):
+            df[col] = df[col].astype(object).where(df[col].notna(), None)
+    return df
+
+
+def _pandas_merge_and_clean(paths, season_window=(2000, 2016)):
+    """Reference result of the pandas merge and cleaning stages."""
+    return clean_missing_values(
+        merge_datasets(*load_nba_data(*paths), season_window=season_window)
+    )
+
+
+class TestSqlBackend:
+    """Test cases for the SQLite merge and cleaning backend."""
+
+    def test_ingest_creates_indexes(self, edge_case_paths, tmp_path):
+        """Test that sources are loaded with player and season indexes."""
+        db_path = tmp_path / "nba.sqlite"
+        loaded = ingest_sources(db_path, *edge_case_paths)
+
+        assert loaded == ["player_data", "seasons_stats", "all_star"]
+        with sqlite3.connect(db_path) as conn:
+            indexes = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index'"
+                )
+            }
+            columns = [
+                row[1] for row in conn.execute("PRAGMA table_info(seasons_stats)")
+            ]
+        assert {"seasons_stats_player", "seasons_stats_year", "all_star_year"} <= (
+            indexes
+        )
+        assert "Unnamed: 0" not in columns
+
+    def test_ingest_skips_unchanged_sources(self, edge_case_paths, tmp_path):
+        """Test that only changed sources are loaded again."""
+        db_path = tmp_path / "nba.sqlite"
+        ingest_sources(db_path, *edge_case_paths)
+
+        assert ingest_sources(db_path, *edge_case_paths) == []
+        with open(edge_case_paths[2], "a", encoding="utf-8") as handle:
+            handle.write("Rookie,2016\n")
+        assert ingest_sources(db_path, *edge_case_paths) == ["all_star"]
+
+    @pytest.mark.parametrize("season_window", [(2000, 2016), (2005, 2005), None])
+    def test_matches_pandas_edge_cases(self, edge_case_paths, tmp_path, season_window):
+        """Test parity with pandas on stray text, zero attempts and messy names."""
+        db_path = tmp_path / "nba.sqlite"
+        ingest_sources(db_path, *edge_case_paths)
+
+        result = merge_and_clean_sql(db_path, season_window)
+        expected = _pandas_merge_and_clean(edge_case_paths, season_window)
+        pd.testing.assert_frame_equal(
+            _comparable(result), _comparable(expected), check_dtype=False
+        )
+
+    def test_division_by_zero_matches_pandas(self, edge_case_paths, tmp_path):
+        """Test that made shots over zero attempts give infinity, as in pandas."""
+        db_path = tmp_path / "nba.sqlite"
+        ingest_sources(db_path, *edge_case_paths)
+
+        result = merge_and_clean_sql(db_path)
+        rookie = result[result["PlayerName"] == "Rookie"].iloc[0]
+        kobe = result[result["PlayerName"] == "Kobe Bryant"].iloc[0]
+        assert np.isinf(rookie["FG%"]) and np.isinf(rookie["3P%"])
+        assert kobe["FG%"] == 0.0
+
+    def test_matches_pandas_on_synthetic_data(self, synthetic_paths, tmp_path):
+        """Test parity with the pandas merge and cleaning on every column."""
+        db_path = tmp_path / "nba.sqlite"
+        ingest_sources(db_path, *synthetic_paths)
+
+        result = merge_and_clean_sql(db_path)
+        expected = _pandas_merge_and_clean(synthetic_paths)
+        assert list(result.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(
+            _comparable(result), _comparable(expected), check_dtype=False, rtol=1e-6
+        )
+
+    def test_returns_only_planned_columns(self, synthetic_paths, tmp_path):
+        """Test that only the planned raw columns are returned."""
+        db_path = tmp_path / "nba.sqlite"
+        ingest_sources(db_path, *synthetic_paths)
+        plan = plan_pipeline(["PTS", "PER"])
+
+        result = merge_and_clean_sql(db_path, columns=plan.columns)
+
+        assert list(result.columns) == [
+            "Year",
+            "PlayerName",
+            "PER",
+            "PTS",
+            "player_id",
+            "birth_date",
+            "is_all_star",
+        ]
+
+    @pytest.mark.parametrize(
+        "features", [None, ["fga_per_minute", "offensive_ws_ratio", "eFG%", "college"]]
+    )
+    def test_pipeline_matches_planned_pipeline(
+        self, synthetic_paths, tmp_path, features
+    ):
+        """Test that the SQL pipeline equals the pandas planned pipeline."""
+        result = run_sql_pipeline(
+            *synthetic_paths, db_path=tmp_path / "nba.sqlite", features=features
+        )
+
+        expected = run_planned_pipeline(*synthetic_paths, features=features)
+        pd.testing.assert_frame_equal(
+            _comparable(result), _comparable(expected), check_dtype=False, rtol=1e-6
+        )
@@ -0,0 +1,57 @@
+"""
+Tests for synthetic data module.
+"""
+
+import pandas as pd
+
+from src.data_processing import preprocess_data
+from src.schemas import PLAYER_DATA_SCHEMA, SEASONS_STATS_SCHEMA
+from src.synthetic import REAL_SIZES, generate_nba_tables, write_synthetic_dataset
+
+
+class TestSynthetic:
+    """Test cases for the synthetic NBA data generator."""
+
+    def test_tables_have_raw_layout(self):
+        """Test that generated tables carry the columns of the raw sources."""
+        player_data, seasons_stats, all_star = generate_nba_tables(scale=0.1)
+
+        assert list(player_data.columns) == list(PLAYER_DATA_SCHEMA)
+        assert set(SEASONS_STATS_SCHEMA) <= set(seasons_stats.columns)
+        assert len(player_data) == round(REAL_SIZES["player_data"] * 0.1)
+        assert player_data["name"].is_unique
+        assert set(all_star["Player"]) <= set(seasons_stats["Player"])
+
+    def test_generation_is_deterministic(self):
+        """Test that the same seed gives the same tables."""
+        first = generate_nba_tables(scale=0.05, seed=3)
+        second = generate_nba_tables(scale=0.05, seed=3)
+
+        for left, right in zip(first, second):
+            pd.testing.assert_frame_equal(left, right)
+
+    def test_written_dataset_matches_generated(self, tmp_path):
+        """Test that chunked CSV output equals the in-memory tables."""
+        paths = write_synthetic_dataset(tmp_path, scale=0.05, chunk_players=50)
+        player_data, seasons_stats, all_star = generate_nba_tables(
+            scale=0.05, chunk_players=50
+        )
+
+        pd.testing.assert_frame_equal(pd.read_csv(paths[0]), player_data)
+        written = pd.read_csv(paths[1])
+        assert list(written["Unnamed: 0"]) == list(range(len(seasons_stats)))
+        pd.testing.assert_frame_equal(
+            written.drop(columns="Unnamed: 0"), seasons_stats, check_dtype=False
+        )
+        pd.testing.assert_frame_equal(
+            pd.read_csv(paths[2]), all_star, check_dtype=False
+        )
+
+    def test_dataset_runs_through_pipeline(self, tmp_path):
+        """Test that the synthetic sources can be preprocessed."""
+        paths = write_synthetic_dataset(tmp_path, scale=0.05)
+
+        result = preprocess_data(*paths)
+
+        assert len(result) > 0
+        assert result["is_all_star"].sum() > 0
@@ -0,0 +1,74 @@
+"""
+Tests for training module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.training import expand_grid, fit_best, make_model, run_sweep
+
+GRIDS = {
+    "logistic_regression": {"C": [0.1, 1.0]},
+    "random_forest": {"n_estimators": [10], "max_depth": [3, None]},
+}
+
+
+@pytest.fixture
+def training_data():
+    """Small imbalanced classification problem."""
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(300, 4)), columns=["PTS", "AST", "TRB", "MP"])
+    y = (X["PTS"] + 0.5 * X["AST"] + rng.normal(0, 0.5, 300) > 1.0).astype(int)
+    return X, y
+
+
+class TestTraining:
+    """Test cases for the hyperparameter sweep."""
+
+    def test_expand_grid(self):
+        """Test that grids expand to every combination."""
+        configs = expand_grid(GRIDS)
+
+        assert configs == [
+            ("logistic_regression", {"C": 0.1}),
+            ("logistic_regression", {"C": 1.0}),
+            ("random_forest", {"max_depth": 3, "n_estimators": 10}),
+            ("random_forest", {"max_depth": None, "n_estimators": 10}),
+        ]
+        with pytest.raises(ValueError, match="Unknown model"):
+            make_model("svm")
+
+    def test_parallel_matches_serial(self, training_data):
+        """Test that workers on shared memory reproduce the serial sweep."""
+        X, y = training_data
+
+        serial = run_sweep(X, y, GRIDS, n_jobs=1)
+        parallel = run_sweep(X, y, GRIDS, n_jobs=2)
+
+        assert len(serial) == 4
+        assert serial["roc_auc"].is_monotonic_decreasing
+        columns = ["model", "accuracy", "f1", "roc_auc"]
+        pd.testing.assert_frame_equal(serial[columns], parallel[columns])
+
+    def test_results_are_cached(self, tmp_path, training_data):
+        """Test that repeated sweeps reuse cached results."""
+        X, y = training_data
+
+        first = run_sweep(X, y, GRIDS, n_jobs=1, cache_dir=tmp_path)
+        second = run_sweep(X, y, GRIDS, n_jobs=1, cache_dir=tmp_path)
+        changed = run_sweep(X, y.iloc[::-1].values, GRIDS, n_jobs=1, cache_dir=tmp_path)
+
+        assert not first["cached"].any()
+        assert second["cached"].all()
+        pd.testing.assert_series_equal(first["roc_auc"], second["roc_auc"])
+        assert not changed["cached"].any()
+
+    def test_fit_best(self, training_data):
+        """Test fitting the best configuration on all rows."""
+        X, y = training_data
+        sweep = run_sweep(X, y, GRIDS, n_jobs=1)
+
+        model = fit_best(sweep, X, y, model="logistic_regression")
+
+        assert model.predict_proba(X).shape == (300, 2)
@@ -0,0 +1,86 @@
+"""
+Tests for validation module.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.validation import (
+    SeasonFold,
+    cross_validate,
+    prepare_folds,
+    season_folds,
+    summarize_folds,
+)
+
+GRIDS = {"logistic_regression": {"C": [0.1, 1.0]}}
+
+
+@pytest.fixture
+def season_data():
+    """Six seasons of 60 players with roughly five All-Stars each."""
+    rng = np.random.default_rng(0)
+    years = np.repeat(np.arange(2010, 2016), 60)
+    X = pd.DataFrame(rng.normal(size=(len(years), 3)), columns=["PTS", "AST", "TRB"])
+    score = X["PTS"] + 0.5 * X["AST"] + rng.normal(0, 0.3, len(years))
+    y = (score > 1.4).astype(int)
+    return X, y, years
+
+
+class TestValidation:
+    """Test cases for season cross-validation."""
+
+    def test_season_folds(self):
+        """Test expanding and rolling windows."""
+        years = np.array([2001, 2000, 2002, 2003, 2003, 2004])
+
+        assert season_folds(years, min_train_seasons=3) == [
+            SeasonFold(2000, 2002, 2003),
+            SeasonFold(2000, 2003, 2004),
+        ]
+        assert season_folds(years, min_train_seasons=2, window=2) == [
+            SeasonFold(2000, 2001, 2002),
+            SeasonFold(2001, 2002, 2003),
+            SeasonFold(2002, 2003, 2004),
+        ]
+        assert season_folds(years, 1, last_test_season=2001) == [
+            SeasonFold(2000, 2000, 2001)
+        ]
+
+    def test_folds_train_on_past_seasons(self, tmp_path, season_data):
+        """Test that fold matrices hold past seasons, scaled on training rows."""
+        X, y, years = season_data
+        fold = SeasonFold(2010, 2012, 2013)
+
+        (fold_dir,) = prepare_folds(X, y, years, [fold], tmp_path)
+
+        X_train = np.load(fold_dir / "X_train.npy")
+        X_test = np.load(fold_dir / "X_test.npy")
+        assert X_train.shape == (180, 3)
+        assert X_test.shape == (60, 3)
+        np.testing.assert_allclose(X_train.mean(axis=0), 0, atol=1e-12)
+        np.testing.assert_array_equal(
+            np.load(fold_dir / "y_test.npy"), y[years == 2013]
+        )
+        mtime = (fold_dir / "X_train.npy").stat().st_mtime_ns
+        assert prepare_folds(X, y, years, [fold], tmp_path) == [fold_dir]
+        assert (fold_dir / "X_train.npy").stat().st_mtime_ns == mtime
+
+    def test_cross_validate(self, tmp_path, season_data):
+        """Test that parallel backtests match serial ones."""
+        X, y, years = season_data
+
+        serial = cross_validate(X, y, years, GRIDS, k=5, n_jobs=1)
+        parallel = cross_validate(X, y, years, GRIDS, k=5, n_jobs=2, cache_dir=tmp_path)
+
+        assert len(serial) == 2 * 3
+        assert serial["test_season"].tolist() == [2013, 2014, 2015] * 2
+        assert (serial["train_last"] < serial["test_season"]).all()
+        pd.testing.assert_frame_equal(serial, parallel)
+        assert serial["precision_at_k"].between(0, 1).all()
+
+        summary = summarize_folds(serial)
+        assert len(summary) == 2
+        assert summary["folds"].tolist() == [3, 3]
+        assert summary["hits"].sum() == serial["hits"].sum()